@@ -0,0 +1,38 @@
+#%%
+# timing of srsf_align split into the DP alignments and the rest of the work
+# (warping, SRSFs, centering and statistics) for several numbers of functions
+import sys
+import time as tm
+import numpy as np
+import fdasrsf as fs
+import fdasrsf.utility_functions as uf
+
+sizes = [int(a) for a in sys.argv[1:]] or [100, 1000]
+M = 100
+rng = np.random.RandomState(0)
+
+dp_time = [0.0]
+optimum_reparam = uf.optimum_reparam
+
+
+def timed_reparam(*args, **kwargs):
+    t0 = tm.time()
+    gam = optimum_reparam(*args, **kwargs)
+    dp_time[0] += tm.time() - t0
+    return gam
+
+
+uf.optimum_reparam = timed_reparam
+
+for N in sizes:
+    time = np.linspace(0, 1, M)
+    p = np.exp(0.3 * rng.randn(N))
+    a = 1 + 0.1 * rng.randn(N)
+    f = a * np.exp(-(time[:, np.newaxis] ** p - 0.5) ** 2 / 0.01)
+    obj = fs.fdawarp(f, time)
+    dp_time[0] = 0.0
+    t0 = tm.time()
+    obj.srsf_align()
+    el = tm.time() - t0
+    print("N = %6d: %8.2f s total, %8.2f s DP, %8.2f s other (%4.1f%%)"
+          % (N, el, dp_time[0], el - dp_time[0], 100 * (el - dp_time[0]) / el))
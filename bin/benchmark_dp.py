@@ -0,0 +1,22 @@
+#%%
+# timing of the DP alignment of one pair of functions for several sample sizes
+import sys
+import time as tm
+import numpy as np
+import fdasrsf as fs
+
+sizes = [int(a) for a in sys.argv[1:]] or [100, 500, 2000]
+rng = np.random.RandomState(0)
+
+for M in sizes:
+    time = np.linspace(0, 1, M)
+    f1 = np.sin(2 * np.pi * time) + 0.05 * np.cumsum(rng.randn(M)) / np.sqrt(M)
+    f2 = np.sin(2 * np.pi * time ** 1.2) + 0.05 * np.cumsum(rng.randn(M)) / np.sqrt(M)
+    q1 = fs.f_to_srsf(f1, time)
+    q2 = fs.f_to_srsf(f2, time)
+    reps = max(1, 20000 // (M * M) * 5)
+    t0 = tm.time()
+    for k in range(reps):
+        gam = fs.optimum_reparam(q1, time, q2)
+    el = (tm.time() - t0) / reps
+    print("M = %5d: %10.4f s per alignment" % (M, el))
@@ -19,11 +19,13 @@ else:  # Python 3
 
 del sys
 
-from .time_warping import fdawarp, align_fPCA, align_fPLS, pairwise_align_bayes
+from .time_warping import fdawarp, fdatemplate, align_fPCA, align_fPLS, pairwise_align_bayes
 from .plot_style import f_plot, rstyle, plot_curve, plot_reg_open_curve, plot_geod_open_curve, plot_geod_close_curve
 from .utility_functions import smooth_data, optimum_reparam, f_to_srsf, gradient_spline, elastic_distance, invertGamma, srsf_to_f
 from .utility_functions import SqrtMean, SqrtMeanInverse, cumtrapzmid, rgam, outlier_detection, innerprod_q
 from .utility_functions import optimum_reparam_pair, warp_q_gamma, resamplefunction, warp_f_gamma
+from .utility_functions import DPWorkspace, elastic_distance_matrix, elastic_cdist
+from .utility_functions import elastic_knn
 from .fPCA import fdavpca, fdahpca, fdajpca
 from .fPLS import pls_svd
 from .regression import elastic_prediction, elastic_logistic, elastic_regression, elastic_mlogistic
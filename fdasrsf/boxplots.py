@@ -8,9 +8,6 @@ import numpy as np
 from scipy.integrate import trapz
 import fdasrsf.utility_functions as uf
 import fdasrsf.geometry as geo
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from matplotlib import cm
 import collections
 
 
@@ -59,6 +56,7 @@ class ampbox:
         :param alpha: quantile value (e.g.,=.05, i.e., 95\%)
         :param k_a: scalar for outlier cutoff (e.g.,=1)
         """
+        import matplotlib.pyplot as plt
 
         if self.warp_data.rsamps:
             ft = self.warp_data.fs
@@ -219,6 +217,9 @@ class ampbox:
 
         Usage: obj.plot()
         """
+        import matplotlib.pyplot as plt
+        from matplotlib import cm
+        from mpl_toolkits.mplot3d import Axes3D
         M = self.warp_data.time.shape[0]
         fig1, ax1 = plt.subplots()
         ax1.plot(self.warp_data.time,self.f_median,'k')
@@ -288,6 +289,7 @@ class phbox:
         :param alpha: quantile value (e.g.,=.05, i.e., 95\%)
         :param k_a: scalar for outlier cutoff (e.g.,=1)
         """
+        import matplotlib.pyplot as plt
 
         if self.warp_data.rsamps:
             gam = self.warp_data.gams
@@ -302,11 +304,8 @@ class phbox:
         median_x, psi_median, psi, vec = uf.SqrtMedian(gam)
 
         # compute phase distances
-        dx = np.zeros(N)
-        v = np.zeros((M,N))
-        for k in range(0, N):
-            v[:,k], d = geo.inv_exp_map(psi_median,psi[:,k])
-            dx[k] = np.sqrt(trapz(v[:,k]**2,t))
+        v, d = geo.inv_exp_map(psi_median,psi)
+        dx = np.sqrt(trapz(v**2,t,axis=0))
 
         dx_ordering = dx.argsort()
         CR_50 = dx_ordering[0:np.ceil(N/2).astype('int')]
@@ -452,6 +451,9 @@ class phbox:
 
         Usage: obj.plot()
         """
+        import matplotlib.pyplot as plt
+        from matplotlib import cm
+        from mpl_toolkits.mplot3d import Axes3D
 
         M = self.warp_data.time.shape[0]
         time = np.linspace(0,1,M)
@@ -12,6 +12,7 @@ from numpy import finfo, double, eye, roll, tile, vstack, array, cos, sin
 from numpy import arccos, fabs
 from scipy.linalg import norm, svd, det, solve
 import optimum_reparam_N as orN
+import warp_batch as wb
 import fdasrsf.utility_functions as uf
 
 
@@ -160,22 +161,30 @@ def Basis_Normal_A(q):
     return delG
 
 
-def optimum_reparam_curve(q1, q2, lam=0.0):
+def optimum_reparam_curve(q1, q2, lam=0.0, cores=1):
     """
     calculates the warping to align srsf q2 to q1
 
     :param q1: matrix of size nxN or array of NxM samples of first SRVF
     :param time: vector of size N describing the sample points
-    :param q2: matrix of size nxN or array of NxM samples samples of second SRVF
+    :param q2: matrix of size nxN or array of NxM samples samples of second SRVF,
+               or array of size nxNxK of K SRVFs which are all aligned to q1
     :param lam: controls the amount of elasticity (default = 0.0)
+    :param cores: number of native threads used to align K SRVFs (default = 1,
+                  -1 uses all cores)
 
     :rtype: vector
-    :return gam: describing the warping function used to align q2 with q1
+    :return gam: describing the warping function used to align q2 with q1,
+                 array of size NxK for K SRVFs
 
     """
     time = linspace(0, 1, q1.shape[1])
-    gam = orN.coptimum_reparam_curve(ascontiguousarray(q1), time,
-                                     ascontiguousarray(q2), lam)
+    if q2.ndim == 3:
+        gam = orN.coptimum_reparam_curve_N(ascontiguousarray(q1), time,
+                                           ascontiguousarray(q2), lam, cores)
+    else:
+        gam = orN.coptimum_reparam_curve(ascontiguousarray(q1), time,
+                                         ascontiguousarray(q2), lam)
 
     return gam
 
@@ -456,17 +465,24 @@ def group_action_by_gamma_coord(f, gamma):
     return (fn)
 
 
-def group_action_by_gamma(q, gamma):
+def group_action_by_gamma(q, gamma, cores=1):
     """
     This function reparamerized srvf q by gamma
 
-    :param f: numpy ndarray of shape (2,M) of M samples
-    :param gamma: numpy ndarray of shape (2,M) of M samples
+    A numpy ndarray q of shape (n,M,N) of N srvfs is reparameterized by the
+    N columns of gamma in one call of the compiled batch kernel, which uses
+    the same not-a-knot cubic spline as a single srvf.
+
+    :param f: numpy ndarray of shape (2,M) of M samples, or (n,M,N)
+    :param gamma: numpy ndarray of shape (2,M) of M samples, or (M,N)
+    :param cores: number of threads of the batch kernel (default = 1, -1 uses all)
 
     :rtype: numpy ndarray
     :return qn: reparatermized srvf
 
     """
+    if q.ndim == 3:
+        return wb.group_action_by_gamma(q, gamma, cores)
     n, T = q.shape
     gammadot = gradient(gamma, 1. / T)
     qn = zeros((n, T))
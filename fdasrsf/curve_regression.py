@@ -8,16 +8,17 @@ moduleauthor:: J. Derek Tucker <jdtuck@sandia.gov>
 import numpy as np
 import fdasrsf.utility_functions as uf
 import fdasrsf.curve_functions as cf
+import fdasrsf.parallel as par
 from scipy import dot
 from scipy.interpolate import interp1d
 from scipy.optimize import fmin_l_bfgs_b
 from scipy.integrate import trapz, cumtrapz
 from scipy.linalg import inv, norm, expm
 from patsy import bs
-from joblib import Parallel, delayed
 import ocmlogit_warp as mw
 import oclogit_warp as lw
 import collections
+from contextlib import ExitStack
 
 def oc_elastic_regression(beta, y, B=None, df=40, T=200, max_itr=20, cores=-1):
     """
@@ -71,63 +72,64 @@ def oc_elastic_regression(beta, y, B=None, df=40, T=200, max_itr=20, cores=-1):
     gamma = gamma.transpose()
     O_hat = np.tile(np.eye(n), (N, 1, 1)).T
 
-    itr = 1
-    SSE = np.zeros(max_itr)
-    while itr <= max_itr:
-        print("Iteration: %d" % itr)
-        # align data
-
-        # OLS using basis
-        Phi = np.ones((N, n * Nb + 1))
-        for ii in range(0, N):
-            for jj in range(0, n):
-                for kk in range(1, Nb + 1):
-                    Phi[ii, jj * Nb + kk] = trapz(qn[jj, :, ii] * B[:, kk - 1], time)
-
-        xx = dot(Phi.T, Phi)
-        inv_xx = inv(xx)
-        xy = dot(Phi.T, y)
-        b = dot(inv_xx, xy)
-
-        alpha = b[0]
-        nu = np.zeros((n, T))
-        for ii in range(0, n):
-            nu[ii, :] = B.dot(b[(ii * Nb + 1):((ii + 1) * Nb + 1)])
-
-        # compute the SSE
-        int_X = np.zeros(N)
-        for ii in range(0, N):
-            int_X[ii] = cf.innerprod_q2(qn[:, :, ii], nu)
-
-        SSE[itr - 1] = sum((y.reshape(N) - alpha - int_X) ** 2)
-
-        # find gamma
-        gamma_new = np.zeros((T, N))
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(regression_warp)(nu, beta0[:, :, n], y[n], alpha) for n in range(N))
+    with par.Pool(cores, beta0=beta0, y=np.ravel(y)) if parallel else ExitStack() as pool:
+        itr = 1
+        SSE = np.zeros(max_itr)
+        while itr <= max_itr:
+            print("Iteration: %d" % itr)
+            # align data
+
+            # OLS using basis
+            Phi = np.ones((N, n * Nb + 1))
             for ii in range(0, N):
-                gamma_new[:, ii] = out[ii][0]
-                beta1n = cf.group_action_by_gamma_coord(out[ii][1].dot(beta0[:, :, ii]), out[ii][0])
-                beta[:, :, ii] = beta1n
-                O_hat[:, :, ii] = out[ii][1]
-                qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
-        else:
+                for jj in range(0, n):
+                    for kk in range(1, Nb + 1):
+                        Phi[ii, jj * Nb + kk] = trapz(qn[jj, :, ii] * B[:, kk - 1], time)
+
+            xx = dot(Phi.T, Phi)
+            inv_xx = inv(xx)
+            xy = dot(Phi.T, y)
+            b = dot(inv_xx, xy)
+
+            alpha = b[0]
+            nu = np.zeros((n, T))
+            for ii in range(0, n):
+                nu[ii, :] = B.dot(b[(ii * Nb + 1):((ii + 1) * Nb + 1)])
+
+            # compute the SSE
+            int_X = np.zeros(N)
             for ii in range(0, N):
-                beta1 = beta0[:, :, ii]
-                gammatmp, Otmp, tau = regression_warp(nu, beta1, y[ii], alpha)
-                gamma_new[:, ii] = gammatmp
-                beta1n = cf.group_action_by_gamma_coord(Otmp.dot(beta0[:, :, ii]), gammatmp)
-                beta[:, :, ii] = beta1n
-                O_hat[:, :, ii] = Otmp
-                qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
-
-
-        if np.abs(SSE[itr - 1] - SSE[itr - 2]) < 1e-15:
-            break
-        else:
-            gamma = gamma_new
-
-        itr += 1
+                int_X[ii] = cf.innerprod_q2(qn[:, :, ii], nu)
+
+            SSE[itr - 1] = sum((y.reshape(N) - alpha - int_X) ** 2)
+
+            # find gamma
+            gamma_new = np.zeros((T, N))
+            if parallel:
+                out = pool.map(regression_warp, nu, par.col('beta0'), par.col('y'), alpha)
+                for ii in range(0, N):
+                    gamma_new[:, ii] = out[ii][0]
+                    beta1n = cf.group_action_by_gamma_coord(out[ii][1].dot(beta0[:, :, ii]), out[ii][0])
+                    beta[:, :, ii] = beta1n
+                    O_hat[:, :, ii] = out[ii][1]
+                    qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
+            else:
+                for ii in range(0, N):
+                    beta1 = beta0[:, :, ii]
+                    gammatmp, Otmp, tau = regression_warp(nu, beta1, y[ii], alpha)
+                    gamma_new[:, ii] = gammatmp
+                    beta1n = cf.group_action_by_gamma_coord(Otmp.dot(beta0[:, :, ii]), gammatmp)
+                    beta[:, :, ii] = beta1n
+                    O_hat[:, :, ii] = Otmp
+                    qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
+
+
+            if np.abs(SSE[itr - 1] - SSE[itr - 2]) < 1e-15:
+                break
+            else:
+                gamma = gamma_new
+
+            itr += 1
 
     tau = np.zeros(N)
 
@@ -188,61 +190,62 @@ def oc_elastic_logistic(beta, y, B=None, df=60, T=100, max_itr=40, cores=-1,
     gamma = gamma.transpose()
     O_hat = np.tile(np.eye(n), (N, 1, 1)).T
 
-    itr = 1
-    LL = np.zeros(max_itr + 1)
-    while itr <= max_itr:
-        print("Iteration: %d" % itr)
-
-        Phi = np.ones((N, n * Nb + 1))
-        for ii in range(0, N):
-            for jj in range(0, n):
-                for kk in range(1, Nb + 1):
-                    Phi[ii, jj * Nb + kk] = trapz(qn[jj, :, ii] * B[:, kk - 1], time)
-
-        # Find alpha and beta using l_bfgs
-        b0 = np.zeros(n * Nb + 1)
-        out = fmin_l_bfgs_b(logit_loss, b0, fprime=logit_gradient,
-                            args=(Phi, y), pgtol=1e-10, maxiter=200,
-                            maxfun=250, factr=1e-30)
-        b = out[0]
-        b = b/norm(b)
-        # alpha_norm = b1[0]
-        alpha = b[0]
-        nu = np.zeros((n, T))
-        for ii in range(0, n):
-            nu[ii, :] = B.dot(b[(ii * Nb + 1):((ii + 1) * Nb + 1)])
-
-        # compute the logistic loss
-        LL[itr] = logit_loss(b, Phi, y)
-
-        # find gamma
-        gamma_new = np.zeros((T, N))
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(logistic_warp)(alpha, nu, q[:, :, ii], y[ii], deltaO=deltaO, deltag=deltag, method=method) for ii in range(N))
-            for ii in range(0, N):
-                gamma_new[:, ii] = out[ii][0]
-                beta1n = cf.group_action_by_gamma_coord(out[ii][1].dot(beta0[:, :, ii]), out[ii][0])
-                beta[:, :, ii] = beta1n
-                O_hat[:, :, ii] = out[ii][1]
-                if np.isinf(beta1n).any() or np.isnan(beta1n).any():
-                    Tracer()()
-                qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
-        else:
-            for ii in range(0, N):
-                q1 = q[:, :, ii]
-                gammatmp, Otmp, tautmp = logistic_warp(alpha, nu, q1, y[ii],deltaO=deltaO, deltag=deltag, method=method)
-                gamma_new[:, ii] = gammatmp
-                beta1n = cf.group_action_by_gamma_coord(Otmp.dot(beta0[:, :, ii]), gammatmp)
-                beta[:, :, ii] = beta1n
-                O_hat[:, :, ii] = Otmp
-                qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
-
-        if norm(gamma - gamma_new) < 1e-5:
-            break
-        else:
-            gamma = gamma_new.copy()
+    with par.Pool(cores, q=q, y=np.ravel(y)) if parallel else ExitStack() as pool:
+        itr = 1
+        LL = np.zeros(max_itr + 1)
+        while itr <= max_itr:
+            print("Iteration: %d" % itr)
 
-        itr += 1
+            Phi = np.ones((N, n * Nb + 1))
+            for ii in range(0, N):
+                for jj in range(0, n):
+                    for kk in range(1, Nb + 1):
+                        Phi[ii, jj * Nb + kk] = trapz(qn[jj, :, ii] * B[:, kk - 1], time)
+
+            # Find alpha and beta using l_bfgs
+            b0 = np.zeros(n * Nb + 1)
+            out = fmin_l_bfgs_b(logit_loss, b0, fprime=logit_gradient,
+                                args=(Phi, y), pgtol=1e-10, maxiter=200,
+                                maxfun=250, factr=1e-30)
+            b = out[0]
+            b = b/norm(b)
+            # alpha_norm = b1[0]
+            alpha = b[0]
+            nu = np.zeros((n, T))
+            for ii in range(0, n):
+                nu[ii, :] = B.dot(b[(ii * Nb + 1):((ii + 1) * Nb + 1)])
+
+            # compute the logistic loss
+            LL[itr] = logit_loss(b, Phi, y)
+
+            # find gamma
+            gamma_new = np.zeros((T, N))
+            if parallel:
+                out = pool.map(logistic_warp, alpha, nu, par.col('q'), par.col('y'), deltaO=deltaO, deltag=deltag, method=method)
+                for ii in range(0, N):
+                    gamma_new[:, ii] = out[ii][0]
+                    beta1n = cf.group_action_by_gamma_coord(out[ii][1].dot(beta0[:, :, ii]), out[ii][0])
+                    beta[:, :, ii] = beta1n
+                    O_hat[:, :, ii] = out[ii][1]
+                    if np.isinf(beta1n).any() or np.isnan(beta1n).any():
+                        Tracer()()
+                    qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
+            else:
+                for ii in range(0, N):
+                    q1 = q[:, :, ii]
+                    gammatmp, Otmp, tautmp = logistic_warp(alpha, nu, q1, y[ii],deltaO=deltaO, deltag=deltag, method=method)
+                    gamma_new[:, ii] = gammatmp
+                    beta1n = cf.group_action_by_gamma_coord(Otmp.dot(beta0[:, :, ii]), gammatmp)
+                    beta[:, :, ii] = beta1n
+                    O_hat[:, :, ii] = Otmp
+                    qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
+
+            if norm(gamma - gamma_new) < 1e-5:
+                break
+            else:
+                gamma = gamma_new.copy()
+
+            itr += 1
 
     tau = np.zeros(N)
 
@@ -311,58 +314,59 @@ def oc_elastic_mlogistic(beta, y, B=None, df=20, T=100, max_itr=30, cores=-1,
     gamma = gamma.transpose()
     O_hat = np.tile(np.eye(n), (N, 1, 1)).T
 
-    itr = 1
-    LL = np.zeros(max_itr+1)
-    while itr <= max_itr:
-        print("Iteration: %d" % itr)
-
-        Phi = np.ones((N, n * Nb + 1))
-        for ii in range(0, N):
-            for jj in range(0, n):
-                for kk in range(1, Nb + 1):
-                    Phi[ii, jj * Nb + kk] = trapz(qn[jj, :, ii] * B[:, kk - 1], time)
-
-        # Find alpha and beta using l_bfgs
-        b0 = np.zeros(m * (n * Nb + 1))
-        out = fmin_l_bfgs_b(mlogit_loss, b0, fprime=mlogit_gradient,
-                            args=(Phi, Y), pgtol=1e-10, maxiter=200,
-                            maxfun=250, factr=1e-30)
-        b = out[0]
-        B0 = b.reshape(n * Nb + 1, m)
-        alpha = B0[0, :]
-        nu = np.zeros((n, T, m))
-        for i in range(0, m):
-            for j in range(0, n):
-                nu[j, :, i] = B.dot(B0[(j * Nb + 1):((j + 1) * Nb + 1), i])
-
-        # compute the logistic loss
-        LL[itr] = mlogit_loss(b, Phi, Y)
-
-        # find gamma
-        gamma_new = np.zeros((T, N))
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(mlogit_warp_grad)(alpha, nu, q[:, :, n], Y[n, :], deltaO=deltaO, deltag=deltag) for n in range(N))
-            for ii in range(0, N):
-                gamma_new[:, ii] = out[ii][0]
-                beta1n = cf.group_action_by_gamma_coord(out[ii][1].dot(beta0[:, :, ii]), out[ii][0])
-                beta[:, :, ii] = beta1n
-                O_hat[:, :, ii] = out[ii][1]
-                qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
-        else:
-            for ii in range(0, N):
-                gammatmp, Otmp = mlogit_warp_grad(alpha, nu, q[:, :, ii], Y[ii, :], deltaO=deltaO, deltag=deltag)
-                gamma_new[:, ii] = gammatmp
-                beta1n = cf.group_action_by_gamma_coord(Otmp.dot(beta0[:, :, ii]), gammatmp)
-                beta[:, :, ii] = beta1n
-                O_hat[:, :, ii] = Otmp
-                qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
-
-        if norm(gamma - gamma_new) < 1e-5:
-            break
-        else:
-            gamma = gamma_new.copy()
+    with par.Pool(cores, q=q, Y=Y.T) if parallel else ExitStack() as pool:
+        itr = 1
+        LL = np.zeros(max_itr+1)
+        while itr <= max_itr:
+            print("Iteration: %d" % itr)
 
-        itr += 1
+            Phi = np.ones((N, n * Nb + 1))
+            for ii in range(0, N):
+                for jj in range(0, n):
+                    for kk in range(1, Nb + 1):
+                        Phi[ii, jj * Nb + kk] = trapz(qn[jj, :, ii] * B[:, kk - 1], time)
+
+            # Find alpha and beta using l_bfgs
+            b0 = np.zeros(m * (n * Nb + 1))
+            out = fmin_l_bfgs_b(mlogit_loss, b0, fprime=mlogit_gradient,
+                                args=(Phi, Y), pgtol=1e-10, maxiter=200,
+                                maxfun=250, factr=1e-30)
+            b = out[0]
+            B0 = b.reshape(n * Nb + 1, m)
+            alpha = B0[0, :]
+            nu = np.zeros((n, T, m))
+            for i in range(0, m):
+                for j in range(0, n):
+                    nu[j, :, i] = B.dot(B0[(j * Nb + 1):((j + 1) * Nb + 1), i])
+
+            # compute the logistic loss
+            LL[itr] = mlogit_loss(b, Phi, Y)
+
+            # find gamma
+            gamma_new = np.zeros((T, N))
+            if parallel:
+                out = pool.map(mlogit_warp_grad, alpha, nu, par.col('q'), par.col('Y'), deltaO=deltaO, deltag=deltag)
+                for ii in range(0, N):
+                    gamma_new[:, ii] = out[ii][0]
+                    beta1n = cf.group_action_by_gamma_coord(out[ii][1].dot(beta0[:, :, ii]), out[ii][0])
+                    beta[:, :, ii] = beta1n
+                    O_hat[:, :, ii] = out[ii][1]
+                    qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
+            else:
+                for ii in range(0, N):
+                    gammatmp, Otmp = mlogit_warp_grad(alpha, nu, q[:, :, ii], Y[ii, :], deltaO=deltaO, deltag=deltag)
+                    gamma_new[:, ii] = gammatmp
+                    beta1n = cf.group_action_by_gamma_coord(Otmp.dot(beta0[:, :, ii]), gammatmp)
+                    beta[:, :, ii] = beta1n
+                    O_hat[:, :, ii] = Otmp
+                    qn[:, :, ii] = cf.curve_to_q(beta[:, :, ii])
+
+            if norm(gamma - gamma_new) < 1e-5:
+                break
+            else:
+                gamma = gamma_new.copy()
+
+            itr += 1
 
     model = collections.namedtuple('model', ['alpha', 'nu', 'betan', 'q',
                                              'gamma', 'O', 'B', 'b',
@@ -10,10 +10,11 @@ from numpy.linalg import svd
 from numpy.random import randn
 import fdasrsf.curve_functions as cf
 import fdasrsf.utility_functions as uf
+import fdasrsf.parallel as par
 import fdasrsf.plot_style as plot
-import matplotlib.pyplot as plt
 from joblib import Parallel, delayed
 import collections
+from contextlib import ExitStack
 
 class fdacurve:
     """
@@ -108,50 +109,55 @@ class fdacurve:
         told = 5*1e-3
 
         print("Computing Karcher Mean of %d curves in SRVF space.." % N)
-        while itr < maxit:
-            print("updating step: %d" % (itr+1))
+        with par.Pool(cores, beta=self.beta, q=self.q) if parallel else ExitStack() as pool:
+            while itr < maxit:
+                print("updating step: %d" % (itr+1))
 
-            if iter == maxit:
-                print("maximal number of iterations reached")
+                if iter == maxit:
+                    print("maximal number of iterations reached")
 
-            mu = mu / sqrt(cf.innerprod_q2(mu, mu))
-            if mode == 1:
-                self.basis = cf.find_basis_normal(mu)
-            else:
-                self.basis = []
-
-            sumv = zeros((n, T))
-            sumd[0] = inf
-            sumd[itr+1] = 0
-            out = Parallel(n_jobs=cores)(delayed(karcher_calc)(self.beta[:, :, n],
-                                    self.q[:, :, n], betamean, mu, self.basis, mode) for n in range(N))
-            v = zeros((n, T, N))
-            for i in range(0, N):
-                v[:, :, i] = out[i][0]
-                sumd[itr+1] = sumd[itr+1] + out[i][1]**2
+                mu = mu / sqrt(cf.innerprod_q2(mu, mu))
+                if mode == 1:
+                    self.basis = cf.find_basis_normal(mu)
+                else:
+                    self.basis = []
+
+                sumv = zeros((n, T))
+                sumd[0] = inf
+                sumd[itr+1] = 0
+                if parallel:
+                    out = pool.map(karcher_calc, par.col('beta'), par.col('q'), betamean,
+                                   mu, self.basis, mode)
+                else:
+                    out = [karcher_calc(self.beta[:, :, k], self.q[:, :, k], betamean,
+                                        mu, self.basis, mode) for k in range(N)]
+                v = zeros((n, T, N))
+                for i in range(0, N):
+                    v[:, :, i] = out[i][0]
+                    sumd[itr+1] = sumd[itr+1] + out[i][1]**2
 
-            sumv = v.sum(axis=2)
+                sumv = v.sum(axis=2)
 
-            # Compute average direction of tangent vectors v_i
-            vbar = sumv/float(N)
+                # Compute average direction of tangent vectors v_i
+                vbar = sumv/float(N)
 
-            normvbar[itr] = sqrt(cf.innerprod_q2(vbar, vbar))
-            normv = normvbar[itr]
+                normvbar[itr] = sqrt(cf.innerprod_q2(vbar, vbar))
+                normv = normvbar[itr]
 
-            if normv > tolv and fabs(sumd[itr+1]-sumd[itr]) > told:
-                # Update mu in direction of vbar
-                mu = cos(delta*normvbar[itr])*mu + sin(delta*normvbar[itr]) * vbar/normvbar[itr]
+                if normv > tolv and fabs(sumd[itr+1]-sumd[itr]) > told:
+                    # Update mu in direction of vbar
+                    mu = cos(delta*normvbar[itr])*mu + sin(delta*normvbar[itr]) * vbar/normvbar[itr]
 
-                if mode == 1:
-                    mu = cf.project_curve(mu)
+                    if mode == 1:
+                        mu = cf.project_curve(mu)
 
-                x = cf.q_to_curve(mu)
-                a = -1*cf.calculatecentroid(x)
-                betamean = x + tile(a, [T, 1]).T
-            else:
-                break
+                    x = cf.q_to_curve(mu)
+                    a = -1*cf.calculatecentroid(x)
+                    betamean = x + tile(a, [T, 1]).T
+                else:
+                    break
 
-            itr += 1
+                itr += 1
 
         self.q_mean = mu
         self.beta_mean = betamean
@@ -295,6 +301,7 @@ class fdacurve:
         """
         plot curve mean results
         """
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots()
         n,T,K = self.beta.shape
         for ii in range(0,K):
@@ -322,6 +329,7 @@ class fdacurve:
 
     def plot_pca(self):
 
+        import matplotlib.pyplot as plt
         if not hasattr(self,'s'):
             raise NameError('Calculate PCA')
 
@@ -11,7 +11,6 @@ from scipy import dot
 from scipy.linalg import norm, svd
 from scipy.integrate import trapz, cumtrapz
 from scipy.optimize import fminbound
-import matplotlib.pyplot as plt
 import fdasrsf.plot_style as plot
 import collections
 
@@ -131,6 +130,7 @@ class fdavpca:
         plot plot elastic vertical fPCA result
         Usage: obj.plot()
         """
+        import matplotlib.pyplot as plt
 
         no = self.no
         Nstd = self.stds.shape[0]
@@ -280,6 +280,7 @@ class fdahpca:
 
         Usage: obj.plot()
         """
+        import matplotlib.pyplot as plt
 
         no = self.no
         TT = self.warp_data.time.shape[0]
@@ -445,6 +446,7 @@ class fdajpca:
 
         Usage: obj.plot()
         """
+        import matplotlib.pyplot as plt
         no = self.no
         M = self.time.shape[0]
         Nstd = self.stds.shape[0]
@@ -517,12 +519,9 @@ def jointfPCAd(qn, vec, C, m, mu_psi):
     qhat = qhat + dot(U[0:M,0:m],a.T)
 
     vechat = dot(U[M:,0:m], a.T/C)
-    psihat = np.zeros((M-1,N))
-    gamhat = np.zeros((M-1,N))
-    for ii in range(0,N):
-        psihat[:,ii] = geo.exp_map(mu_psi,vechat[:,ii])
-        gam_tmp = cumtrapz(psihat[:,ii]*psihat[:,ii], np.linspace(0,1,M-1), initial=0)
-        gamhat[:,ii] = (gam_tmp - gam_tmp.min()) / (gam_tmp.max() - gam_tmp.min())
+    psihat = geo.exp_map(mu_psi,vechat)
+    gam_tmp = cumtrapz(psihat*psihat, np.linspace(0,1,M-1), axis=0, initial=0)
+    gamhat = (gam_tmp - gam_tmp.min(axis=0)) / (gam_tmp.max(axis=0) - gam_tmp.min(axis=0))
 
     U = U[:,0:m]
     s = s[0:m]
@@ -534,10 +533,8 @@ def find_C(C, qn, vec, q0, m, mu_psi):
     (M,N) = qn.shape
     time = np.linspace(0,1,M-1)
 
-    d = np.zeros(N)
-    for i in range(0,N):
-        tmp = uf.warp_q_gamma(time, qhat[0:(M-1),i], uf.invertGamma(gamhat[:,i]))
-        d[i] = trapz((tmp-q0[:,i])*(tmp-q0[:,i]), time)
+    tmp = uf.warp_q_gamma(time, qhat[0:(M-1),:], uf.invertGamma(gamhat))
+    d = trapz((tmp-q0)*(tmp-q0), time, axis=0)
 
     out = sum(d*d)/N
 
@@ -1,44 +1,119 @@
 """
 geometry functions for SRSF Manipulations
 
+The functions accept a single psi function of shape (M,) or N functions as
+the columns of an (M,N) array, which are broadcast against a single base
+point. The inner products use the trapezoidal rule on the uniform grid of
+[0,1]; its weights can be computed once with :func:`quadrature_weights` and
+passed as w to avoid rebuilding them at every call.
+
 moduleauthor:: J. Derek Tucker <jdtuck@sandia.gov>
 
 """
 
-from numpy import arccos, sin, cos, linspace, zeros, sqrt
-from scipy.integrate import trapz
+from numpy import arccos, sin, cos, sqrt, ones, clip, where, empty, multiply
+
+
+def quadrature_weights(M):
+    """
+    trapezoidal quadrature weights of the uniform grid of [0,1] with M points
+
+    :param M: number of sample points
+
+    :rtype: vector
+    :return w: weights such that w @ f approximates the integral of f
+    """
+    w = ones(M) / (M - 1)
+    w[0] = w[-1] = 0.5 / (M - 1)
+    return w
+
+
+def inv_exp_map(Psi, psi, w=None, out=None):
+    """
+    inverse exponential map of the Hilbert sphere at Psi, the shooting
+    vectors from Psi to psi
+
+    :param Psi: vector of size M, base point
+    :param psi: vector of size M or numpy ndarray of shape (M,N)
+    :param w: quadrature weights, see :func:`quadrature_weights`
+              (default = None, computed)
+    :param out: array of the shape of psi receiving the shooting vectors
+                (default = None, allocated)
+
+    :rtype: numpy ndarray and double or vector
+    :return exp_inv: shooting vectors
+    :return theta: angles between Psi and psi
+    """
+    if w is None:
+        w = quadrature_weights(Psi.shape[0])
+    theta = arccos(clip(inner_product(Psi, psi, w), -1, 1))
+    nz = theta >= 1e-10
+    c = where(nz, theta, 0) / where(nz, sin(theta), 1)
+    if out is None:
+        out = empty(psi.shape)
+    multiply(psi, c, out=out)
+    out -= multiply.outer(Psi, c * cos(theta))
+
+    return out, theta
+
+
+def exp_map(psi, v, w=None, out=None):
+    """
+    exponential map of the Hilbert sphere at psi
+
+    :param psi: vector of size M, base point
+    :param v: vector of size M or numpy ndarray of shape (M,N) of tangent vectors
+    :param w: quadrature weights, see :func:`quadrature_weights`
+              (default = None, computed)
+    :param out: array of the shape of v receiving the result
+                (default = None, allocated)
+
+    :rtype: numpy ndarray
+    :return expgam: points of the sphere, psi for zero tangent vectors
+    """
+    v_norm = L2norm(v, w)
+    nz = v_norm > 0
+    if out is None:
+        out = empty(v.shape)
+    multiply.outer(psi, cos(v_norm), out=out)
+    out += v * (where(nz, sin(v_norm), 0) / where(nz, v_norm, 1))
+    return out
 
-def inv_exp_map(Psi, psi):
-    tmp = inner_product(Psi,psi)
-    if tmp > 1:
-        tmp = 1
-    if tmp < -1:
-        tmp = -1
 
-    theta = arccos(tmp)
+def inner_product(psi1, psi2, w=None):
+    """
+    L2 inner product on [0,1]
 
-    if (theta < 1e-10):
-        exp_inv = zeros(psi.shape[0])
-    else: 
-        exp_inv = theta / sin(theta) * (psi - cos(theta)*Psi)
-    
-    return exp_inv, theta
+    :param psi1: vector of size M or numpy ndarray of shape (M,N)
+    :param psi2: vector of size M or numpy ndarray of shape (M,N)
+    :param w: quadrature weights, see :func:`quadrature_weights`
+              (default = None, computed)
 
+    :rtype: double or vector
+    :return ip: inner products, of size N if either argument has N columns
+    """
+    if w is None:
+        w = quadrature_weights(psi1.shape[0])
+    if psi1.ndim == 1:
+        return (w * psi1) @ psi2
+    if psi2.ndim == 1:
+        return (w * psi2) @ psi1
+    return w @ (psi1 * psi2)
 
-def exp_map(psi, v):
-    v_norm = L2norm(v)
-    expgam = cos(v_norm) * psi + sin(v_norm) * v / v_norm
-    return expgam
 
-def inner_product(psi1, psi2):
-    M = psi1.shape[0]
-    t = linspace(0,1,M)
-    ip = trapz(psi1*psi2, t)
-    return ip
+def L2norm(psi, w=None, out=None):
+    """
+    L2 norm on [0,1]
 
-def L2norm(psi):
-    M = psi.shape[0]
-    t = linspace(0,1,M)
-    l2norm = sqrt(trapz(psi*psi,t))
-    return l2norm
+    :param psi: vector of size M or numpy ndarray of shape (M,N)
+    :param w: quadrature weights, see :func:`quadrature_weights`
+              (default = None, computed)
+    :param out: vector of size N receiving the norms of the columns
+                (default = None, allocated)
 
+    :rtype: double or vector
+    :return l2norm: norms of the functions
+    """
+    if w is None:
+        w = quadrature_weights(psi.shape[0])
+    return sqrt(w @ (psi * psi), out=out)
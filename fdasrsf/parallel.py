@@ -0,0 +1,127 @@
+"""
+Persistent worker pool sharing the data of an iterative algorithm
+
+moduleauthor:: J. Derek Tucker <jdtuck@sandia.gov>
+
+"""
+import multiprocessing as mp
+import numpy as np
+
+# arrays attached by the initializer of each worker process
+_shared = {}
+
+
+class col:
+    """
+    Placeholder for the k-th slice, along the last axis, of a shared array
+
+    :param name: name of the shared array
+    """
+    def __init__(self, name):
+        self.name = name
+
+
+def _attach(specs):
+    _shared.clear()
+    for name, (raw, shape) in specs.items():
+        _shared[name] = np.frombuffer(raw, dtype=np.double).reshape(shape)
+
+
+def _resolve(a, data, k):
+    if isinstance(a, col):
+        return data[a.name][..., k]
+    return a
+
+
+def _run(func, idx, args, kwargs, data=None):
+    if data is None:
+        data = _shared
+    out = []
+    for k in idx:
+        a = [_resolve(x, data, k) for x in args]
+        kw = {key: _resolve(x, data, k) for key, x in kwargs.items()}
+        out.append(func(*a, **kw))
+    return out
+
+
+def shared(name):
+    """
+    Returns the shared array `name` inside a worker of a :class:`Pool`
+
+    :param name: name of the shared array
+    :rtype: numpy ndarray
+    """
+    return _shared[name]
+
+
+class Pool:
+    """
+    This class provides a pool of worker processes that is started once and
+    reused by every iteration of an algorithm. The arrays passed at
+    construction are copied once to shared memory and attached by every
+    worker, so that each call to :meth:`map` only sends the arguments that
+    change between iterations
+
+    Usage:  with Pool(cores, q=q, y=y) as pool:
+                out = pool.map(func, template, col('q'), col('y'))
+
+    :param cores: number of worker processes (default = -1 (all))
+    :param data: named arrays shared with the workers, sliced along their
+                 last axis by :class:`col`
+    """
+    def __init__(self, cores=-1, **data):
+        if cores < 1:
+            cores = mp.cpu_count()
+        self.cores = cores
+        self.N = None
+        specs = {}
+        self._data = {}
+        for name, a in data.items():
+            a = np.ascontiguousarray(a, dtype=np.double)
+            if self.N is None:
+                self.N = a.shape[-1]
+            elif a.shape[-1] != self.N:
+                raise Exception('shared arrays must have the same last dimension')
+            raw = mp.RawArray('d', max(a.size, 1))
+            buf = np.frombuffer(raw, dtype=np.double)[:a.size].reshape(a.shape)
+            buf[...] = a
+            specs[name] = (raw, a.shape)
+            self._data[name] = buf
+        if self.cores > 1:
+            self._pool = mp.Pool(self.cores, _attach, (specs,))
+        else:
+            self._pool = None
+
+    def map(self, func, *args, **kwargs):
+        """
+        Calls `func` once for every column k of the shared data, replacing
+        each :class:`col` argument by the k-th slice of its array
+
+        :param func: picklable function
+        :param args: arguments of func, :class:`col` placeholders or values
+                     broadcast to every call
+        :param kwargs: keyword arguments of func
+
+        :rtype: list
+        :return out: results of the N calls in order
+        """
+        if self._pool is None:
+            return _run(func, range(self.N), args, kwargs, self._data)
+        blocks = np.array_split(np.arange(self.N), min(self.N, 4 * self.cores))
+        res = self._pool.starmap(_run, [(func, b, args, kwargs) for b in blocks])
+        return [o for r in res for o in r]
+
+    def close(self):
+        """
+        Stops the worker processes
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -147,13 +147,9 @@ class elastic_pcr_regression:
             n = q1.shape[1]
             self.y_pred = np.zeros(n)
             mq = self.warp_data.mqn
-            fn = np.zeros((M,n))
-            qn = np.zeros((M,n))
-            gam = np.zeros((M,n))
-            for ii in range(0,n):
-                gam[:,ii] = uf.optimum_reparam(mq,time,q1[:,ii],omethod)
-                fn[:,ii] = uf.warp_f_gamma(time,f[:,ii],gam[:,ii])
-                qn[:,ii] = uf.f_to_srsf(fn[:,ii],time)
+            gam = uf.optimum_reparam(mq,time,q1,omethod)
+            fn = uf.warp_f_gamma(time,f,gam)
+            qn = uf.f_to_srsf(fn,time)
             
             m_new = np.sign(fn[self.pca.id,:])*np.sqrt(np.abs(fn[self.pca.id,:]))
             qn1 = np.vstack((qn, m_new))
@@ -162,15 +158,11 @@ class elastic_pcr_regression:
 
             if self.pca.__class__.__name__ == 'fdajpca':
                 C = self.pca.C
-                TT = self.time.shape[0]
                 mu_g = self.pca.mu_g
                 mu_psi = self.pca.mu_psi
-                vec = np.zeros((M,n))
-                psi = np.zeros((TT,n))
                 binsize = np.mean(np.diff(self.time))
-                for i in range(0,n):
-                    psi[:,i] = np.sqrt(np.gradient(gam[:,i],binsize))
-                    vec[:,i] = geo.inv_exp_map(mu_psi, psi[:,i])
+                psi = np.sqrt(np.gradient(gam, binsize, axis=0))
+                vec, theta = geo.inv_exp_map(mu_psi, psi)
                 
                 g = np.vstack((qn1, C*vec))
                 a = np.zeros((n,no))
@@ -189,13 +181,9 @@ class elastic_pcr_regression:
             elif self.pca.__class__.__name__ == 'fdahpca':
                 a = np.zeros((n,no))
                 mu_psi = self.pca.psi_mu
-                vec = np.zeros((M,n))
-                TT = self.time.shape[0]
-                psi = np.zeros((TT,n))
                 binsize = np.mean(np.diff(self.time))
-                for i in range(0,n):
-                    psi[:,i] = np.sqrt(np.gradient(gam[:,i],binsize))
-                    vec[:,i] = geo.inv_exp_map(mu_psi, psi[:,i])
+                psi = np.sqrt(np.gradient(gam, binsize, axis=0))
+                vec, theta = geo.inv_exp_map(mu_psi, psi)
                 
                 vm = self.pca.vec.mean(axis=1)
 
@@ -354,13 +342,9 @@ class elastic_lpcr_regression:
             n = q1.shape[1]
             self.y_pred = np.zeros(n)
             mq = self.warp_data.mqn
-            fn = np.zeros((M,n))
-            qn = np.zeros((M,n))
-            gam = np.zeros((M,n))
-            for ii in range(0,n):
-                gam[:,ii] = uf.optimum_reparam(mq,time,q1[:,ii],omethod)
-                fn[:,ii] = uf.warp_f_gamma(time,f[:,ii],gam[:,ii])
-                qn[:,ii] = uf.f_to_srsf(fn[:,ii],time)
+            gam = uf.optimum_reparam(mq,time,q1,omethod)
+            fn = uf.warp_f_gamma(time,f,gam)
+            qn = uf.f_to_srsf(fn,time)
             
             m_new = np.sign(fn[self.pca.id,:])*np.sqrt(np.abs(fn[self.pca.id,:]))
             qn1 = np.vstack((qn, m_new))
@@ -369,15 +353,11 @@ class elastic_lpcr_regression:
 
             if self.pca.__class__.__name__ == 'fdajpca':
                 C = self.pca.C
-                TT = self.time.shape[0]
                 mu_g = self.pca.mu_g
                 mu_psi = self.pca.mu_psi
-                vec = np.zeros((M,n))
-                psi = np.zeros((TT,n))
                 binsize = np.mean(np.diff(self.time))
-                for i in range(0,n):
-                    psi[:,i] = np.sqrt(np.gradient(gam[:,i],binsize))
-                    vec[:,i] = geo.inv_exp_map(mu_psi, psi[:,i])
+                psi = np.sqrt(np.gradient(gam, binsize, axis=0))
+                vec, theta = geo.inv_exp_map(mu_psi, psi)
                 
                 g = np.vstack((qn1, C*vec))
                 a = np.zeros((n,no))
@@ -396,13 +376,9 @@ class elastic_lpcr_regression:
             elif self.pca.__class__.__name__ == 'fdahpca':
                 a = np.zeros((n,no))
                 mu_psi = self.pca.psi_mu
-                vec = np.zeros((M,n))
-                TT = self.time.shape[0]
-                psi = np.zeros((TT,n))
                 binsize = np.mean(np.diff(self.time))
-                for i in range(0,n):
-                    psi[:,i] = np.sqrt(np.gradient(gam[:,i],binsize))
-                    vec[:,i] = geo.inv_exp_map(mu_psi, psi[:,i])
+                psi = np.sqrt(np.gradient(gam, binsize, axis=0))
+                vec, theta = geo.inv_exp_map(mu_psi, psi)
                 
                 vm = self.pca.vec.mean(axis=1)
 
@@ -594,13 +570,9 @@ class elastic_mlpcr_regression:
             n = q1.shape[1]
             self.y_pred = np.zeros((n,m))
             mq = self.warp_data.mqn
-            fn = np.zeros((M,n))
-            qn = np.zeros((M,n))
-            gam = np.zeros((M,n))
-            for ii in range(0,n):
-                gam[:,ii] = uf.optimum_reparam(mq,time,q1[:,ii],omethod)
-                fn[:,ii] = uf.warp_f_gamma(time,f[:,ii],gam[:,ii])
-                qn[:,ii] = uf.f_to_srsf(fn[:,ii],time)
+            gam = uf.optimum_reparam(mq,time,q1,omethod)
+            fn = uf.warp_f_gamma(time,f,gam)
+            qn = uf.f_to_srsf(fn,time)
             
             m_new = np.sign(fn[self.pca.id,:])*np.sqrt(np.abs(fn[self.pca.id,:]))
             qn1 = np.vstack((qn, m_new))
@@ -609,15 +581,11 @@ class elastic_mlpcr_regression:
 
             if self.pca.__class__.__name__ == 'fdajpca':
                 C = self.pca.C
-                TT = self.time.shape[0]
                 mu_g = self.pca.mu_g
                 mu_psi = self.pca.mu_psi
-                vec = np.zeros((M,n))
-                psi = np.zeros((TT,n))
                 binsize = np.mean(np.diff(self.time))
-                for i in range(0,n):
-                    psi[:,i] = np.sqrt(np.gradient(gam[:,i],binsize))
-                    vec[:,i] = geo.inv_exp_map(mu_psi, psi[:,i])
+                psi = np.sqrt(np.gradient(gam, binsize, axis=0))
+                vec, theta = geo.inv_exp_map(mu_psi, psi)
                 
                 g = np.vstack((qn1, C*vec))
                 a = np.zeros((n,no))
@@ -636,13 +604,9 @@ class elastic_mlpcr_regression:
             elif self.pca.__class__.__name__ == 'fdahpca':
                 a = np.zeros((n,no))
                 mu_psi = self.pca.psi_mu
-                vec = np.zeros((M,n))
-                TT = self.time.shape[0]
-                psi = np.zeros((TT,n))
                 binsize = np.mean(np.diff(self.time))
-                for i in range(0,n):
-                    psi[:,i] = np.sqrt(np.gradient(gam[:,i],binsize))
-                    vec[:,i] = geo.inv_exp_map(mu_psi, psi[:,i])
+                psi = np.sqrt(np.gradient(gam, binsize, axis=0))
+                vec, theta = geo.inv_exp_map(mu_psi, psi)
                 
                 vm = self.pca.vec.mean(axis=1)
 
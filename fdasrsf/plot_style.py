@@ -1,8 +1,5 @@
-import matplotlib
-import pylab
 import fdasrsf.curve_functions as cf
 from numpy import tile, array, arange
-import matplotlib.pyplot as plt
 
 
 def rstyle(ax, pres=False):
@@ -11,6 +8,9 @@ def rstyle(ax, pres=False):
     Must be called after all plot and axis manipulation operations have been
     carried out (needs to know final tick spacing)
     """
+    import matplotlib
+    import pylab
+    import matplotlib.pyplot as plt
     #Set the style of the major and minor grid lines, filled blocks
     if pres:
         ax.grid(True, 'major', color='w', linestyle='-', linewidth=0.7)
@@ -61,6 +61,8 @@ def rstyle_bw(ax):
     Must be called after all plot and axis manipulation operations have been
     carried out (needs to know final tick spacing)
     """
+    import pylab
+    import matplotlib.pyplot as plt
     #Set the style of the major and minor grid lines, filled blocks
     ax.grid(True, 'major', color='0.88', linestyle='-', linewidth=0.7)
     ax.grid(True, 'minor', color='0.95', linestyle='-', linewidth=0.4)
@@ -106,6 +108,7 @@ def f_plot(time, f, title="Data", bw=False, pres=False):
     :return ax: axes definition
 
     """
+    import matplotlib.pyplot as plt
 
     fig, ax = plt.subplots()
     ax.plot(time, f)
@@ -124,6 +127,7 @@ def plot_curve(beta):
     :return fig: figure defintion
     :return ax: axes
     """
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     ax.plot(beta[0, :], beta[1, :], 'r', linewidth=2)
     ax.set_aspect('equal')
@@ -143,6 +147,7 @@ def plot_reg_open_curve(beta1, beta2n):
     :return ax: axes definition
 
     """
+    import matplotlib.pyplot as plt
     T = beta1.shape[1]
     centroid1 = cf.calculatecentroid(beta1)
     beta1 = beta1 - tile(centroid1, [T, 1]).T
@@ -178,6 +183,7 @@ def plot_geod_open_curve(PsiX):
     :return ax: axes definition
 
     """
+    import matplotlib.pyplot as plt
     k = PsiX.shape[2]
     fig, ax = plt.subplots()
     fig.hold()
@@ -201,6 +207,7 @@ def plot_geod_close_curve(pathsqnc):
     :return ax: axes definition
 
     """
+    import matplotlib.pyplot as plt
     i = pathsqnc.shape[3]
     k = pathsqnc.shape[2]
     if i > 1:
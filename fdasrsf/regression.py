@@ -7,14 +7,15 @@ moduleauthor:: J. Derek Tucker <jdtuck@sandia.gov>
 
 import numpy as np
 import fdasrsf.utility_functions as uf
+import fdasrsf.parallel as par
 from scipy import dot
 from scipy.optimize import fmin_l_bfgs_b
 from scipy.integrate import trapz
 from scipy.linalg import inv, norm
 from patsy import bs
-from joblib import Parallel, delayed
 import mlogit_warp as mw
 import collections
+from contextlib import ExitStack
 
 
 def elastic_regression(f, y, time, B=None, lam=0, df=20, max_itr=20,
@@ -76,63 +77,60 @@ def elastic_regression(f, y, time, B=None, lam=0, df=20, max_itr=20,
     gamma = np.tile(np.linspace(0, 1, M), (N, 1))
     gamma = gamma.transpose()
 
-    itr = 1
-    SSE = np.zeros(max_itr)
-    while itr <= max_itr:
-        print("Iteration: %d" % itr)
-        # align data
-        fn = np.zeros((M, N))
-        qn = np.zeros((M, N))
-        for ii in range(0, N):
-            fn[:, ii] = np.interp((time[-1] - time[0]) * gamma[:, ii] +
-                                  time[0], time, f[:, ii])
-            qn[:, ii] = uf.warp_q_gamma(time, q[:, ii], gamma[:, ii])
-
-        # OLS using basis
-        Phi = np.ones((N, Nb+1))
-        for ii in range(0, N):
-            for jj in range(1, Nb+1):
-                Phi[ii, jj] = trapz(qn[:, ii] * B[:, jj-1], time)
-
-        R = np.zeros((Nb+1, Nb+1))
-        for ii in range(1, Nb+1):
-            for jj in range(1, Nb+1):
-                R[ii, jj] = trapz(Bdiff[:, ii-1] * Bdiff[:, jj-1], time)
-
-        xx = dot(Phi.T, Phi)
-        inv_xx = inv(xx + lam * R)
-        xy = dot(Phi.T, y)
-        b = dot(inv_xx, xy)
-
-        alpha = b[0]
-        beta = B.dot(b[1:Nb+1])
-        beta = beta.reshape(M)
-
-        # compute the SSE
-        int_X = np.zeros(N)
-        for ii in range(0, N):
-            int_X[ii] = trapz(qn[:, ii] * beta, time)
-
-        SSE[itr - 1] = sum((y.reshape(N) - alpha - int_X) ** 2)
-
-        # find gamma
-        gamma_new = np.zeros((M, N))
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(regression_warp)(beta,
-                                         time, q[:, n], y[n], alpha) for n in range(N))
-            gamma_new = np.array(out)
-            gamma_new = gamma_new.transpose()
-        else:
+    with par.Pool(cores, q=q, y=np.ravel(y)) if parallel else ExitStack() as pool:
+        itr = 1
+        SSE = np.zeros(max_itr)
+        while itr <= max_itr:
+            print("Iteration: %d" % itr)
+            # align data
+            fn = uf.warp_f_gamma(time, f, gamma)
+            qn = uf.warp_q_gamma(time, q, gamma)
+
+            # OLS using basis
+            Phi = np.ones((N, Nb+1))
             for ii in range(0, N):
-                gamma_new[:, ii] = regression_warp(beta, time, q[:, ii],
-                                                   y[ii], alpha)
+                for jj in range(1, Nb+1):
+                    Phi[ii, jj] = trapz(qn[:, ii] * B[:, jj-1], time)
 
-        if norm(gamma - gamma_new) < 1e-5:
-            break
-        else:
-            gamma = gamma_new
+            R = np.zeros((Nb+1, Nb+1))
+            for ii in range(1, Nb+1):
+                for jj in range(1, Nb+1):
+                    R[ii, jj] = trapz(Bdiff[:, ii-1] * Bdiff[:, jj-1], time)
 
-        itr += 1
+            xx = dot(Phi.T, Phi)
+            inv_xx = inv(xx + lam * R)
+            xy = dot(Phi.T, y)
+            b = dot(inv_xx, xy)
+
+            alpha = b[0]
+            beta = B.dot(b[1:Nb+1])
+            beta = beta.reshape(M)
+
+            # compute the SSE
+            int_X = np.zeros(N)
+            for ii in range(0, N):
+                int_X[ii] = trapz(qn[:, ii] * beta, time)
+
+            SSE[itr - 1] = sum((y.reshape(N) - alpha - int_X) ** 2)
+
+            # find gamma
+            gamma_new = np.zeros((M, N))
+            if parallel:
+                out = pool.map(regression_warp, beta, time, par.col('q'),
+                               par.col('y'), alpha)
+                gamma_new = np.array(out)
+                gamma_new = gamma_new.transpose()
+            else:
+                for ii in range(0, N):
+                    gamma_new[:, ii] = regression_warp(beta, time, q[:, ii],
+                                                       y[ii], alpha)
+
+            if norm(gamma - gamma_new) < 1e-5:
+                break
+            else:
+                gamma = gamma_new
+
+            itr += 1
 
     # Last Step with centering of gam
     gamI = uf.SqrtMeanInverse(gamma_new)
@@ -208,53 +206,49 @@ def elastic_logistic(f, y, time, B=None, df=20, max_itr=20, cores=-1,
     gamma = np.tile(np.linspace(0, 1, M), (N, 1))
     gamma = gamma.transpose()
 
-    itr = 1
-    LL = np.zeros(max_itr)
-    while itr <= max_itr:
-        print("Iteration: %d" % itr)
-        # align data
-        fn = np.zeros((M, N))
-        qn = np.zeros((M, N))
-        for ii in range(0, N):
-            fn[:, ii] = np.interp((time[-1] - time[0]) * gamma[:, ii] +
-                                  time[0], time, f[:, ii])
-            qn[:, ii] = uf.warp_q_gamma(time, q[:, ii], gamma[:, ii])
-
-        Phi = np.ones((N, Nb+1))
-        for ii in range(0, N):
-            for jj in range(1, Nb+1):
-                Phi[ii, jj] = trapz(qn[:, ii] * B[:, jj-1], time)
-
-        # Find alpha and beta using l_bfgs
-        b0 = np.zeros(Nb+1)
-        out = fmin_l_bfgs_b(logit_loss, b0, fprime=logit_gradient,
-                            args=(Phi, y), pgtol=1e-10, maxiter=200,
-                            maxfun=250, factr=1e-30)
-        b = out[0]
-        alpha = b[0]
-        beta = B.dot(b[1:Nb+1])
-        beta = beta.reshape(M)
-
-        # compute the logistic loss
-        LL[itr - 1] = logit_loss(b, Phi, y)
-
-        # find gamma
-        gamma_new = np.zeros((M, N))
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(logistic_warp)(beta, time,
-                                         q[:, n], y[n]) for n in range(N))
-            gamma_new = np.array(out)
-            gamma_new = gamma_new.transpose()
-        else:
-            for ii in range(0, N):
-                gamma_new[:, ii] = logistic_warp(beta, time, q[:, ii], y[ii])
-
-        if norm(gamma - gamma_new) < 1e-5:
-            break
-        else:
-            gamma = gamma_new
+    with par.Pool(cores, q=q, y=np.ravel(y)) if parallel else ExitStack() as pool:
+        itr = 1
+        LL = np.zeros(max_itr)
+        while itr <= max_itr:
+            print("Iteration: %d" % itr)
+            # align data
+            fn = uf.warp_f_gamma(time, f, gamma)
+            qn = uf.warp_q_gamma(time, q, gamma)
 
-        itr += 1
+            Phi = np.ones((N, Nb+1))
+            for ii in range(0, N):
+                for jj in range(1, Nb+1):
+                    Phi[ii, jj] = trapz(qn[:, ii] * B[:, jj-1], time)
+
+            # Find alpha and beta using l_bfgs
+            b0 = np.zeros(Nb+1)
+            out = fmin_l_bfgs_b(logit_loss, b0, fprime=logit_gradient,
+                                args=(Phi, y), pgtol=1e-10, maxiter=200,
+                                maxfun=250, factr=1e-30)
+            b = out[0]
+            alpha = b[0]
+            beta = B.dot(b[1:Nb+1])
+            beta = beta.reshape(M)
+
+            # compute the logistic loss
+            LL[itr - 1] = logit_loss(b, Phi, y)
+
+            # find gamma
+            gamma_new = np.zeros((M, N))
+            if parallel:
+                out = pool.map(logistic_warp, beta, time, par.col('q'), par.col('y'))
+                gamma_new = np.array(out)
+                gamma_new = gamma_new.transpose()
+            else:
+                for ii in range(0, N):
+                    gamma_new[:, ii] = logistic_warp(beta, time, q[:, ii], y[ii])
+
+            if norm(gamma - gamma_new) < 1e-5:
+                break
+            else:
+                gamma = gamma_new
+
+            itr += 1
 
     # Last Step with centering of gam
     gamma = gamma_new
@@ -329,56 +323,53 @@ def elastic_mlogistic(f, y, time, B=None, df=20, max_itr=20, cores=-1,
     gamma = np.tile(np.linspace(0, 1, M), (N, 1))
     gamma = gamma.transpose()
 
-    itr = 1
-    LL = np.zeros(max_itr)
-    while itr <= max_itr:
-        print("Iteration: %d" % itr)
-        # align data
-        fn = np.zeros((M, N))
-        qn = np.zeros((M, N))
-        for ii in range(0, N):
-            fn[:, ii] = np.interp((time[-1] - time[0]) * gamma[:, ii] +
-                                  time[0], time, f[:, ii])
-            qn[:, ii] = uf.warp_q_gamma(time, q[:, ii], gamma[:, ii])
-
-        Phi = np.ones((N, Nb+1))
-        for ii in range(0, N):
-            for jj in range(1, Nb+1):
-                Phi[ii, jj] = trapz(qn[:, ii] * B[:, jj-1], time)
-
-        # Find alpha and beta using l_bfgs
-        b0 = np.zeros(m * (Nb+1))
-        out = fmin_l_bfgs_b(mlogit_loss, b0, fprime=mlogit_gradient,
-                            args=(Phi, Y), pgtol=1e-10, maxiter=200,
-                            maxfun=250, factr=1e-30)
-        b = out[0]
-        B0 = b.reshape(Nb+1, m)
-        alpha = B0[0, :]
-        beta = np.zeros((M, m))
-        for i in range(0, m):
-            beta[:, i] = B.dot(B0[1:Nb+1, i])
-
-        # compute the logistic loss
-        LL[itr - 1] = mlogit_loss(b, Phi, Y)
-
-        # find gamma
-        gamma_new = np.zeros((M, N))
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(mlogit_warp_grad)(alpha, beta,
-                                         time, q[:, n], Y[n, :], delta=delta) for n in range(N))
-            gamma_new = np.array(out)
-            gamma_new = gamma_new.transpose()
-        else:
-            for ii in range(0, N):
-                gamma_new[:, ii] = mlogit_warp_grad(alpha, beta, time,
-                                                    q[:, ii], Y[ii, :], delta=delta)
+    with par.Pool(cores, q=q, Y=Y.T) if parallel else ExitStack() as pool:
+        itr = 1
+        LL = np.zeros(max_itr)
+        while itr <= max_itr:
+            print("Iteration: %d" % itr)
+            # align data
+            fn = uf.warp_f_gamma(time, f, gamma)
+            qn = uf.warp_q_gamma(time, q, gamma)
 
-        if norm(gamma - gamma_new) < 1e-5:
-            break
-        else:
-            gamma = gamma_new
-
-        itr += 1
+            Phi = np.ones((N, Nb+1))
+            for ii in range(0, N):
+                for jj in range(1, Nb+1):
+                    Phi[ii, jj] = trapz(qn[:, ii] * B[:, jj-1], time)
+
+            # Find alpha and beta using l_bfgs
+            b0 = np.zeros(m * (Nb+1))
+            out = fmin_l_bfgs_b(mlogit_loss, b0, fprime=mlogit_gradient,
+                                args=(Phi, Y), pgtol=1e-10, maxiter=200,
+                                maxfun=250, factr=1e-30)
+            b = out[0]
+            B0 = b.reshape(Nb+1, m)
+            alpha = B0[0, :]
+            beta = np.zeros((M, m))
+            for i in range(0, m):
+                beta[:, i] = B.dot(B0[1:Nb+1, i])
+
+            # compute the logistic loss
+            LL[itr - 1] = mlogit_loss(b, Phi, Y)
+
+            # find gamma
+            gamma_new = np.zeros((M, N))
+            if parallel:
+                out = pool.map(mlogit_warp_grad, alpha, beta, time, par.col('q'),
+                               par.col('Y'), delta=delta)
+                gamma_new = np.array(out)
+                gamma_new = gamma_new.transpose()
+            else:
+                for ii in range(0, N):
+                    gamma_new[:, ii] = mlogit_warp_grad(alpha, beta, time,
+                                                        q[:, ii], Y[ii, :], delta=delta)
+
+            if norm(gamma - gamma_new) < 1e-5:
+                break
+            else:
+                gamma = gamma_new
+
+            itr += 1
 
     # Last Step with centering of gam
     gamma = gamma_new
@@ -435,11 +426,13 @@ def elastic_prediction(f, time, model, y=None, smooth=False):
         m = model.n_classes
         y_pred = np.zeros((n, m))
 
+    # warp every function by the warping of its nearest training SRSF
+    dist = ((model.q * model.q).sum(axis=0)[:, np.newaxis] - 2 * model.q.T @ q +
+            (q * q).sum(axis=0))
+    qw = uf.warp_q_gamma(time, q, model.gamma[:, dist.argmin(axis=0)])
+
     for ii in range(0, n):
-        diff = model.q - q[:, ii][:, np.newaxis]
-        dist = np.sum(np.abs(diff) ** 2, axis=0) ** (1. / 2)
-        q_tmp = uf.warp_q_gamma(time, q[:, ii],
-                                model.gamma[:, dist.argmin()])
+        q_tmp = qw[:, ii]
         if model.type == 'linear':
             y_pred[ii] = model.alpha + trapz(q_tmp * model.beta, time)
         elif model.type == 'logistic':
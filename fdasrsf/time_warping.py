@@ -5,10 +5,10 @@ moduleauthor:: J. Derek Tucker <jdtuck@sandia.gov>
 
 """
 import numpy as np
-import matplotlib.pyplot as plt
 import fdasrsf.utility_functions as uf
 import fdasrsf.fPCA as fpca
 import fdasrsf.geometry as geo
+import fdasrsf.parallel as par
 from scipy.integrate import trapz, cumtrapz
 from scipy.interpolate import interp1d
 from scipy.linalg import svd
@@ -21,6 +21,7 @@ import fdasrsf.plot_style as plot
 import fpls_warp as fpls
 import cbayesian as bay
 import collections
+import os
 
 
 class fdawarp:
@@ -58,9 +59,13 @@ class fdawarp:
     def __init__(self, f, time):
         """
         Construct an instance of the fdawarp class
-        :param f: numpy ndarray of shape (M,N) of N functions with M samples
+        :param f: numpy ndarray of shape (M,N) of N functions with M samples, which
+                  can be a numpy.memmap or the path of a .npy file opened as one,
+                  to be aligned with srsf_align(method="sgd") only
         :param time: vector of size M describing the sample points
         """
+        if isinstance(f, str):
+            f = np.load(f, mmap_mode="r")
         a = time.shape[0]
 
         if f.shape[0] != a:
@@ -69,19 +74,47 @@ class fdawarp:
         self.f = f
         self.time = time
         self.rsamps = False
+        self.buffers = None
     
 
-    def srsf_align(self, method="mean", omethod="DP", smoothdata=False, parallel=False, lam=0.0, cores=-1):
+    def srsf_align(self, method="mean", omethod="DP", smoothdata=False, parallel=False, lam=0.0, cores=-1,
+                   band=None, keep_history=False, warm_start=None, skip_tol=0.0,
+                   batch_size=100, passes=2, seed=None, final_pass=True, out=None,
+                   deriv="spline"):
         """
         This function aligns a collection of functions using the elastic
         square-root slope (srsf) framework.
 
-        :param method: (string) warp calculate Karcher Mean or Median (options = "mean" or "median") (default="mean")
-        :param omethod: optimization method (DP, DP2, RBFGS) (default = DP)
+        :param method: (string) warp calculate Karcher Mean or Median (options = "mean", "median" or "sgd") (default="mean"),
+                       "sgd" estimates the Karcher Mean from random mini-batches, see :meth:`srsf_align_sgd`
+        :param omethod: optimization method (DP, DPmr, DP2, RBFGS) (default = DP)
         :param smoothdata: Smooth the data using a box filter (default = F)
         :param parallel: run in parallel (default = F)
         :param lam: controls the elasticity (default = 0)
         :param cores: number of cores for parallel (default = -1 (all))
+        :param band: restricts the DP search to warpings with abs(gam(t) - t) <= band,
+                     as a fraction of the domain, see :func:`utility_functions.optimum_reparam`
+                     (default = None, no restriction)
+        :param keep_history: store the warped functions and SRSFs of every iteration in
+                             f_history and q_history of shape (M,N,iterations), which needs
+                             about 2*(MaxItr+2) copies of the data (default = F)
+        :param warm_start: seeds the DP of every iteration with the previous warpings,
+                           searching only +/- warm_start (fraction of the domain) around
+                           them, see :func:`utility_functions.optimum_reparam_warm`.
+                           Only supported with omethod "DP" (default = None, align from scratch)
+        :param skip_tol: with warm_start, functions whose distance to the template changed
+                         by less than skip_tol (relative) since the last iteration keep
+                         their warping (default = 0, realign all)
+        :param batch_size: number of functions per mini-batch of method "sgd" (default = 100)
+        :param passes: number of passes over the data of method "sgd" (default = 2)
+        :param seed: seed of the random mini-batches of method "sgd" (default = None)
+        :param final_pass: with method "sgd", align all functions to the estimated
+                           template to compute gam, fn and qn (default = T)
+        :param out: with method "sgd", directory where q0, gam, fn and qn are written
+                    as memory-mapped .npy files (default = None, in memory)
+        :param deriv: differentiation of the SRSFs, "spline" or "fd" for finite
+                      differences on densely sampled smooth data, see
+                      :func:`utility_functions.gradient_spline` (default = "spline")
         :type lam: double
         :type smoothdata: bool
 
@@ -95,9 +128,24 @@ class fdawarp:
         >>> obj.srsf_align()
 
         """
+        if method == "sgd":
+            return self.srsf_align_sgd(omethod, smoothdata, lam, cores, band,
+                                       batch_size, passes, seed, final_pass, out, deriv)
+
         M = self.f.shape[0]
         N = self.f.shape[1]
         self.lam = lam
+        self.buffers = None
+        self.smoothdata = smoothdata
+        self.deriv = deriv
+        self.band = band
+
+        if isinstance(self.f, np.memmap):
+            raise Exception('memory mapped data is only supported with method "sgd"')
+        if band is not None and omethod != "DP":
+            raise Exception('band is only supported with omethod "DP"')
+        if warm_start is not None and omethod != "DP":
+            raise Exception('warm_start is only supported with omethod "DP"')
 
         if M > 500:
             parallel = True
@@ -119,7 +167,7 @@ class fdawarp:
             method = method[0]
 
         # Compute SRSF function from data
-        f, g, g2 = uf.gradient_spline(self.time, self.f, smoothdata)
+        f, g, g2 = uf.gradient_spline(self.time, self.f, smoothdata, deriv)
         q = g / np.sqrt(abs(g) + eps)
 
         print("Initializing...")
@@ -132,144 +180,183 @@ class fdawarp:
         mq = q[:, min_ind]
         mf = f[:, min_ind]
 
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(uf.optimum_reparam)(mq, self.time,
-                                    q[:, n], omethod, lam, mf[0], f[0,n]) for n in range(N))
-            gam = np.array(out)
-            gam = gam.transpose()
-        else:
-            gam = np.zeros((M,N))
-            for k in range(0,N):
-                gam[:,k] = uf.optimum_reparam(mq,self.time,q[:,k],omethod,lam,mf[0],f[0,k])
-
-        gamI = uf.SqrtMeanInverse(gam)
-        mf = np.interp((self.time[-1] - self.time[0]) * gamI + self.time[0], self.time, mf)
-        mq = uf.f_to_srsf(mf, self.time)
-
-        # Compute Karcher Mean
-        if method == 0:
-            print("Compute Karcher Mean of %d function in SRSF space..." % N)
-        if method == 1:
-            print("Compute Karcher Median of %d function in SRSF space..." % N)
-
-        MaxItr = 20
-        ds = np.repeat(0.0, MaxItr + 2)
-        ds[0] = np.inf
-        qun = np.repeat(0.0, MaxItr + 1)
-        tmp = np.zeros((M, MaxItr + 2))
-        tmp[:, 0] = mq
-        mq = tmp
-        tmp = np.zeros((M, MaxItr+2))
-        tmp[:,0] = mf
-        mf = tmp
-        tmp = np.zeros((M, N, MaxItr + 2))
-        tmp[:, :, 0] = self.f
-        f = tmp
-        tmp = np.zeros((M, N, MaxItr + 2))
-        tmp[:, :, 0] = q
-        q = tmp
-
-        for r in range(0, MaxItr):
-            print("updating step: r=%d" % (r + 1))
-            if r == (MaxItr - 1):
-                print("maximal number of iterations is reached")
-
-            # Matching Step
-            if parallel:
-                out = Parallel(n_jobs=cores)(delayed(uf.optimum_reparam)(mq[:, r],
-                                        self.time, q[:, n, 0], omethod, lam, mf[0,r],
-                                        f[0,n,0] ) for n in range(N))
-                gam = np.array(out)
+        # the worker processes of the parallel branch are stopped whatever
+        # happens during the iterations
+        pool = None
+        try:
+            # DP and DP2 align all columns in one native multi-threaded call, DP
+            # reusing the same buffers in every iteration
+            nthreads = cores if parallel else 1
+            if omethod in ("DP", "DPmr"):
+                ws = uf.DPWorkspace(M, nthreads=nthreads)
+                gam = uf.optimum_reparam(mq, self.time, q, omethod, lam, workspace=ws,
+                                         band=band)
+            elif omethod == "DP2":
+                gam = uf.optimum_reparam(mq, self.time, q, omethod, lam, cores=nthreads)
+            elif parallel:
+                # the workers attach once to the data, every iteration only
+                # sends the new template
+                pool = par.Pool(cores, q=q, f=f[0, :], fo=self.f[0, :])
+                res = pool.map(uf.optimum_reparam, mq, self.time, par.col('q'),
+                               omethod, lam, mf[0], par.col('f'))
+                gam = np.array(res)
                 gam = gam.transpose()
             else:
+                gam = np.zeros((M,N))
                 for k in range(0,N):
-                    gam[:,k] = uf.optimum_reparam(mq[:, r], self.time, q[:, k, 0],
-                            omethod, lam, mf[0,r], f[0,k,0])
-
-            gam_dev = np.zeros((M, N))
-            vtil = np.zeros((M,N))
-            dtil = np.zeros(N)
-            for k in range(0, N):
-                f[:, k, r + 1] = np.interp((self.time[-1] - self.time[0]) * gam[:, k]
-                                        + self.time[0], self.time, f[:, k, 0])
-                q[:, k, r + 1] = uf.f_to_srsf(f[:, k, r + 1], self.time)
-                gam_dev[:, k] = np.gradient(gam[:, k], 1 / float(M - 1))
-                v = q[:, k, r + 1] - mq[:,r]
-                d = np.sqrt(trapz(v*v, self.time))
-                vtil[:,k] = v/d
-                dtil[k] = 1.0/d
-
-            mqt = mq[:, r]
-            a = mqt.repeat(N)
-            d1 = a.reshape(M, N)
-            d = (q[:, :, r + 1] - d1) ** 2
-            if method == 0:
-                d1 = sum(trapz(d, self.time, axis=0))
-                d2 = sum(trapz((1 - np.sqrt(gam_dev)) ** 2, self.time, axis=0))
-                ds_tmp = d1 + lam * d2
-                ds[r + 1] = ds_tmp
-
-                # Minimization Step
-                # compute the mean of the matched function
-                qtemp = q[:, :, r + 1]
-                ftemp = f[:, :, r + 1]
-                mq[:, r + 1] = qtemp.mean(axis=1)
-                mf[:, r + 1] = ftemp.mean(axis=1)
+                    gam[:,k] = uf.optimum_reparam(mq,self.time,q[:,k],omethod,lam,mf[0],f[0,k])
 
-                qun[r] = norm(mq[:, r + 1] - mq[:, r]) / norm(mq[:, r])
+            gamI = uf.SqrtMeanInverse(gam)
+            mf = np.interp((self.time[-1] - self.time[0]) * gamI + self.time[0], self.time, mf)
+            mq = uf.f_to_srsf(mf, self.time, deriv=deriv)
 
+            # Compute Karcher Mean
+            if method == 0:
+                print("Compute Karcher Mean of %d function in SRSF space..." % N)
             if method == 1:
-                d1 = np.sqrt(sum(trapz(d, self.time, axis=0)))
-                d2 = sum(trapz((1 - np.sqrt(gam_dev)) ** 2, self.time, axis=0))
-                ds_tmp = d1 + lam * d2
-                ds[r + 1] = ds_tmp
-
-                # Minimization Step
-                # compute the mean of the matched function
-                stp = .3
-                vbar = vtil.sum(axis=1)*(1/dtil.sum())
-                qtemp = q[:, :, r + 1] 
-                ftemp = f[:, :, r + 1] 
-                mq[:, r + 1] = mq[:,r] + stp*vbar
-                tmp = np.zeros(M)
-                tmp[1:] = cumtrapz(mq[:, r + 1] * np.abs(mq[:, r + 1]), self.time)
-                mf[:, r + 1] = np.median(f0[1, :])+tmp
-
-                qun[r] = norm(mq[:, r + 1] - mq[:, r]) / norm(mq[:, r])
-
-            if qun[r] < 1e-2 or r >= MaxItr:
-                break
-
-        # Last Step with centering of gam
-        r += 1
-        if parallel:
-            out = Parallel(n_jobs=cores)(delayed(uf.optimum_reparam)(mq[:, r], self.time,
-                q[:, n, 0], omethod, lam, mf[0,r], f[0,n,0]) for n in range(N))
-            gam = np.array(out)
-            gam = gam.transpose()
-        else:
-            for k in range(0,N):
-                gam[:,k] = uf.optimum_reparam(mq[:, r], self.time, q[:, k, 0], omethod,
-                        lam, mf[0,r], f[0,k,0])
+                print("Compute Karcher Median of %d function in SRSF space..." % N)
+
+            MaxItr = 20
+            ds = np.repeat(0.0, MaxItr + 2)
+            ds[0] = np.inf
+            qun = np.repeat(0.0, MaxItr + 1)
+            tmp = np.zeros((M, MaxItr + 2))
+            tmp[:, 0] = mq
+            mq = tmp
+            tmp = np.zeros((M, MaxItr+2))
+            tmp[:,0] = mf
+            mf = tmp
+
+            # only the original data and the current iterate are needed
+            q0 = q
+            dprev = None
+            fr = self.f
+            qr = q
+            if keep_history:
+                f_history = np.zeros((M, N, MaxItr + 2))
+                f_history[:, :, 0] = self.f
+                q_history = np.zeros((M, N, MaxItr + 2))
+                q_history[:, :, 0] = q
+
+            for r in range(0, MaxItr):
+                print("updating step: r=%d" % (r + 1))
+                if r == (MaxItr - 1):
+                    print("maximal number of iterations is reached")
+
+                # Matching Step
+                if warm_start is not None:
+                    gam = warm_reparam(mq[:, r], self.time, q0, qr, gam, dprev, lam,
+                                       ws, band, warm_start, skip_tol)
+                elif omethod in ("DP", "DPmr"):
+                    gam = uf.optimum_reparam(mq[:, r], self.time, q0, omethod,
+                                             lam, workspace=ws, band=band)
+                elif omethod == "DP2":
+                    gam = uf.optimum_reparam(mq[:, r], self.time, q0, omethod,
+                                             lam, cores=nthreads)
+                elif parallel:
+                    res = pool.map(uf.optimum_reparam, mq[:, r], self.time,
+                                   par.col('q'), omethod, lam, mf[0,r], par.col('fo'))
+                    gam = np.array(res)
+                    gam = gam.transpose()
+                else:
+                    for k in range(0,N):
+                        gam[:,k] = uf.optimum_reparam(mq[:, r], self.time, q0[:, k],
+                                omethod, lam, mf[0,r], self.f[0,k])
+
+                fr = uf.interp_batch((self.time[-1] - self.time[0]) * gam + self.time[0],
+                                     self.time, self.f)
+                qr = uf.f_to_srsf(fr, self.time, deriv=deriv)
+                gam_dev = np.gradient(gam, 1 / float(M - 1), axis=0)
+                v = qr - mq[:, r][:, np.newaxis]
+                d = np.sqrt(trapz(v*v, self.time, axis=0))
+                vtil = v/d
+                dtil = 1.0/d
+                dprev = 1.0/dtil
+                if keep_history:
+                    f_history[:, :, r + 1] = fr
+                    q_history[:, :, r + 1] = qr
+
+                mqt = mq[:, r]
+                a = mqt.repeat(N)
+                d1 = a.reshape(M, N)
+                d = (qr - d1) ** 2
+                if method == 0:
+                    d1 = sum(trapz(d, self.time, axis=0))
+                    d2 = sum(trapz((1 - np.sqrt(gam_dev)) ** 2, self.time, axis=0))
+                    ds_tmp = d1 + lam * d2
+                    ds[r + 1] = ds_tmp
+
+                    # Minimization Step
+                    # compute the mean of the matched function
+                    mq[:, r + 1] = qr.mean(axis=1)
+                    mf[:, r + 1] = fr.mean(axis=1)
+
+                    qun[r] = norm(mq[:, r + 1] - mq[:, r]) / norm(mq[:, r])
+
+                if method == 1:
+                    d1 = np.sqrt(sum(trapz(d, self.time, axis=0)))
+                    d2 = sum(trapz((1 - np.sqrt(gam_dev)) ** 2, self.time, axis=0))
+                    ds_tmp = d1 + lam * d2
+                    ds[r + 1] = ds_tmp
+
+                    # Minimization Step
+                    # compute the mean of the matched function
+                    stp = .3
+                    vbar = vtil.sum(axis=1)*(1/dtil.sum())
+                    mq[:, r + 1] = mq[:,r] + stp*vbar
+                    tmp = np.zeros(M)
+                    tmp[1:] = cumtrapz(mq[:, r + 1] * np.abs(mq[:, r + 1]), self.time)
+                    mf[:, r + 1] = np.median(f0[1, :])+tmp
+
+                    qun[r] = norm(mq[:, r + 1] - mq[:, r]) / norm(mq[:, r])
+
+                if qun[r] < 1e-2 or r >= MaxItr:
+                    break
+
+            # Last Step with centering of gam
+            r += 1
+            if warm_start is not None:
+                gam = warm_reparam(mq[:, r], self.time, q0, qr, gam, dprev, lam, ws,
+                                   band, warm_start, skip_tol)
+            elif omethod in ("DP", "DPmr"):
+                gam = uf.optimum_reparam(mq[:, r], self.time, q0, omethod, lam,
+                                         workspace=ws, band=band)
+            elif omethod == "DP2":
+                gam = uf.optimum_reparam(mq[:, r], self.time, q0, omethod, lam,
+                                         cores=nthreads)
+            elif parallel:
+                res = pool.map(uf.optimum_reparam, mq[:, r], self.time, par.col('q'),
+                               omethod, lam, mf[0,r], par.col('fo'))
+                gam = np.array(res)
+                gam = gam.transpose()
+            else:
+                for k in range(0,N):
+                    gam[:,k] = uf.optimum_reparam(mq[:, r], self.time, q0[:, k], omethod,
+                            lam, mf[0,r], self.f[0,k])
 
-        gam_dev = np.zeros((M, N))
-        for k in range(0, N):
-            gam_dev[:, k] = np.gradient(gam[:, k], 1 / float(M - 1))
+        finally:
+            if pool is not None:
+                pool.close()
 
         gamI = uf.SqrtMeanInverse(gam)
         gamI_dev = np.gradient(gamI, 1 / float(M - 1))
         time0 = (self.time[-1] - self.time[0]) * gamI + self.time[0]
         mq[:, r + 1] = np.interp(time0, self.time, mq[:, r]) * np.sqrt(gamI_dev)
 
-        for k in range(0, N):
-            q[:, k, r + 1] = np.interp(time0, self.time, q[:, k, r]) * np.sqrt(gamI_dev)
-            f[:, k, r + 1] = np.interp(time0, self.time, f[:, k, r])
-            gam[:, k] = np.interp(time0, self.time, gam[:, k])
+        qn = uf.interp_batch(time0, self.time, qr) * np.sqrt(gamI_dev)[:, np.newaxis]
+        fn = uf.interp_batch(time0, self.time, fr)
+        gam = uf.interp_batch(time0, self.time, gam)
+
+        if keep_history:
+            f_history[:, :, r + 1] = fn
+            q_history[:, :, r + 1] = qn
+            self.f_history = f_history[:, :, 0:r + 2]
+            self.q_history = q_history[:, :, 0:r + 2]
 
         # Aligned data & stats
-        self.fn = f[:, :, r + 1]
-        self.qn = q[:, :, r + 1]
-        self.q0 = q[:, :, 0]
+        self.fn = fn
+        self.qn = qn
+        self.q0 = q0
         mean_f0 = f0.mean(axis=1)
         std_f0 = f0.std(axis=1)
         mean_fn = self.fn.mean(axis=1)
@@ -280,10 +367,7 @@ class fdawarp:
         tmp[1:] = cumtrapz(self.mqn * np.abs(self.mqn), self.time)
         self.fmean = np.mean(f0[1, :]) + tmp
 
-        fgam = np.zeros((M, N))
-        for k in range(0, N):
-            time0 = (self.time[-1] - self.time[0]) * gam[:, k] + self.time[0]
-            fgam[:, k] = np.interp(time0, self.time, self.fmean)
+        fgam = warp_mean(self.time, self.fmean, gam)
 
         var_fgam = fgam.var(axis=1)
         self.orig_var = trapz(std_f0 ** 2, self.time)
@@ -293,12 +377,255 @@ class fdawarp:
         return
 
 
+    def srsf_align_sgd(self, omethod="DP", smoothdata=False, lam=0.0, cores=-1, band=None,
+                       batch_size=100, passes=2, seed=None, final_pass=True, out=None,
+                       deriv="spline"):
+        """
+        This function estimates the Karcher Mean of the SRSFs from random
+        mini-batches of functions, for collections too large for srsf_align.
+        Each step aligns one mini-batch to the current template and moves the
+        template towards the mean of the aligned batch with the decaying step
+        size 1/(t+1)**0.6, so a step costs the same whatever the number of
+        functions. The data is only read batch_size columns at a time, so f
+        can be a numpy.memmap, and with out the outputs are written to disk
+        and the statistics are computed in a single streaming pass.
+
+        :param omethod: optimization method (DP, DPmr, DP2, RBFGS) (default = DP)
+        :param smoothdata: Smooth the data using a box filter (default = F)
+        :param lam: controls the elasticity (default = 0)
+        :param cores: number of threads of the DP (default = -1 (all))
+        :param band: restricts the DP search to warpings with abs(gam(t) - t) <= band,
+                     as a fraction of the domain (default = None, no restriction)
+        :param batch_size: number of functions per mini-batch (default = 100)
+        :param passes: number of passes over the data (default = 2)
+        :param seed: seed of the random mini-batches (default = None)
+        :param final_pass: align all functions to the estimated template to
+                           compute gam, fn, qn and the variances, otherwise only
+                           mqn and fmean are set (default = T)
+        :param out: directory where q0, gam, fn and qn are written as memory-mapped
+                    .npy files (default = None, in memory)
+        :param deriv: differentiation of the SRSFs ("spline" or "fd") (default = "spline")
+        :type lam: double
+        :type smoothdata: bool
+
+        """
+        M = self.f.shape[0]
+        N = self.f.shape[1]
+        self.lam = lam
+        self.buffers = None
+        self.smoothdata = smoothdata
+        self.deriv = deriv
+        self.band = band
+
+        if band is not None and omethod != "DP":
+            raise Exception('band is only supported with omethod "DP"')
+
+        eps = np.finfo(np.double).eps
+        f0 = self.f
+        self.method = omethod
+        self.type = "sgd"
+        rng = np.random.RandomState(seed)
+        batch_size = min(batch_size, N)
+        ws = None
+        if omethod in ("DP", "DPmr"):
+            ws = uf.DPWorkspace(M, nthreads=cores)
+
+        # start from the function of a random batch closest to its mean
+        print("Initializing...")
+        idx = np.sort(rng.choice(N, batch_size, replace=False))
+        f, g, g2 = uf.gradient_spline(self.time, f0[:, idx], smoothdata, deriv)
+        q = g / np.sqrt(abs(g) + eps)
+        dqq = np.sqrt(((q - q.mean(axis=1)[:, np.newaxis]) ** 2).sum(axis=0))
+        mq = q[:, dqq.argmin()]
+
+        print("Compute Karcher Mean of %d function in SRSF space from mini-batches of %d..."
+              % (N, batch_size))
+        qun = []
+        itr = 0
+        for p in range(0, passes):
+            perm = rng.permutation(N)
+            for b in range(0, N, batch_size):
+                idx = np.sort(perm[b:b + batch_size])
+                f, g, g2 = uf.gradient_spline(self.time, f0[:, idx], smoothdata, deriv)
+                q = g / np.sqrt(abs(g) + eps)
+                gam = uf.optimum_reparam(mq, self.time, q, omethod, lam,
+                                         workspace=ws, band=band).reshape(M, idx.size)
+                fr = uf.warp_f_gamma(self.time, f0[:, idx], gam)
+                qr = uf.f_to_srsf(fr, self.time, deriv=deriv)
+
+                stp = 1.0 / (itr + 1) ** 0.6
+                mq_new = mq + stp * (qr.mean(axis=1) - mq)
+                qun.append(norm(mq_new - mq) / norm(mq))
+                mq = mq_new
+                itr += 1
+
+        self.qun = np.array(qun)
+
+        if not final_pass:
+            self.mqn = mq
+            tmp = np.zeros(M)
+            tmp[1:] = cumtrapz(self.mqn * np.abs(self.mqn), self.time)
+            self.fmean = np.mean(f0[1, :]) + tmp
+            return
+
+        # Last Step with centering of gam, in chunks of batch_size columns
+        # with streaming statistics
+        if out is None:
+            q0 = np.zeros((M, N))
+            gam = np.zeros((M, N))
+            fn = np.zeros((M, N))
+            qn = np.zeros((M, N))
+        else:
+            q0, gam, fn, qn = [np.lib.format.open_memmap(os.path.join(out, name + ".npy"),
+                                                         mode="w+", shape=(M, N))
+                               for name in ("q0", "gam", "fn", "qn")]
+        mom_f0 = (0, 0, 0)
+        for b in range(0, N, batch_size):
+            f, g, g2 = uf.gradient_spline(self.time, f0[:, b:b + batch_size], smoothdata, deriv)
+            q0[:, b:b + batch_size] = g / np.sqrt(abs(g) + eps)
+            gam[:, b:b + batch_size] = uf.optimum_reparam(mq, self.time,
+                                                          q0[:, b:b + batch_size],
+                                                          omethod, lam, workspace=ws,
+                                                          band=band)
+            mom_f0 = uf.update_moments(*mom_f0, f0[:, b:b + batch_size])
+
+        # the Karcher mean of the warpings reads them batch_size columns at
+        # a time, the same way whether gam is in memory or on disk
+        gamI = uf.SqrtMeanInverse(gam, chunk=batch_size)
+        gamI_dev = np.gradient(gamI, 1 / float(M - 1))
+        time0 = (self.time[-1] - self.time[0]) * gamI + self.time[0]
+        mq = np.interp(time0, self.time, mq) * np.sqrt(gamI_dev)
+
+        self.mqn = mq
+        tmp = np.zeros(M)
+        tmp[1:] = cumtrapz(self.mqn * np.abs(self.mqn), self.time)
+        self.fmean = mom_f0[1][1] + tmp
+
+        mom_fn = (0, 0, 0)
+        mom_fgam = (0, 0, 0)
+        for b in range(0, N, batch_size):
+            cols = slice(b, b + batch_size)
+            fr = uf.warp_f_gamma(self.time, f0[:, cols], gam[:, cols])
+            qr = uf.f_to_srsf(fr, self.time, deriv=deriv)
+            qn[:, cols] = uf.interp_batch(time0, self.time, qr) * np.sqrt(gamI_dev)[:, np.newaxis]
+            fn[:, cols] = uf.interp_batch(time0, self.time, fr)
+            gam[:, cols] = uf.interp_batch(time0, self.time, gam[:, cols])
+            fgam = warp_mean(self.time, self.fmean, gam[:, cols])
+            mom_fn = uf.update_moments(*mom_fn, fn[:, cols])
+            mom_fgam = uf.update_moments(*mom_fgam, fgam)
+
+        if out is not None:
+            for a in (q0, gam, fn, qn):
+                a.flush()
+
+        # Aligned data & stats
+        self.fn = fn
+        self.qn = qn
+        self.q0 = q0
+        self.gam = gam
+        self.orig_var = trapz(mom_f0[2] / N, self.time)
+        self.amp_var = trapz(mom_fn[2] / N, self.time)
+        self.phase_var = trapz(mom_fgam[2] / N, self.time)
+
+        return
+
+
+    def partial_fit(self, f_new, drift=0.02, cores=1):
+        """
+        This function aligns new functions to the current template and adds
+        them to the aligned data. The Karcher Mean and the variances are
+        updated incrementally, and the warpings are only re-centered with
+        SqrtMeanInverse once their mean has drifted away from the identity,
+        so an update costs O(K) for K new functions instead of a new
+        srsf_align over the whole history. The new functions are smoothed,
+        differentiated and aligned with the smoothdata, deriv and band of
+        the last srsf_align.
+
+        Usage:  obj.srsf_align()
+                obj.partial_fit(f_new)
+
+        :param f_new: numpy ndarray of shape (M,K) of K new functions with M samples
+        :param drift: largest angle between the mean SRSF of the warpings and the
+                      identity before all warpings are re-centered (default = 0.02)
+        :param cores: number of threads of the DP (default = 1)
+
+        """
+        if not hasattr(self, 'gam'):
+            raise Exception('srsf_align must be run before partial_fit')
+        if f_new.ndim == 1:
+            f_new = f_new.reshape(-1, 1)
+        M = self.time.shape[0]
+        if f_new.shape[0] != M:
+            raise Exception('Columns of f and time must be equal')
+        K = f_new.shape[1]
+        binsize = 1 / float(M - 1)
+
+        # the summaries and the buffers are rebuilt once after every fit,
+        # which resets self.buffers
+        if self.buffers is None:
+            self.moments = {"f0": uf.update_moments(0, 0, 0, self.f),
+                            "fn": uf.update_moments(0, 0, 0, self.fn),
+                            "fgam": uf.update_moments(0, 0, 0, warp_mean(self.time, self.fmean, self.gam)),
+                            "psi": np.sqrt(np.gradient(self.gam, binsize, axis=0)).sum(axis=1)}
+            self.buffers = {"n": self.f.shape[1]}
+        N = self.buffers["n"]
+
+        eps = np.finfo(np.double).eps
+        f, g, g2 = uf.gradient_spline(self.time, f_new, self.smoothdata, self.deriv)
+        q = g / np.sqrt(abs(g) + eps)
+        gam = uf.optimum_reparam(self.mqn, self.time, q, self.method, self.lam,
+                                 cores=cores, band=self.band).reshape(M, K)
+        fn = uf.warp_f_gamma(self.time, f_new, gam)
+        qn = uf.f_to_srsf(fn, self.time, deriv=self.deriv).reshape(M, K)
+
+        for name, x in (("f", f_new), ("fn", fn), ("qn", qn), ("q0", q), ("gam", gam)):
+            buf = append_columns(self.buffers.get(name, getattr(self, name)), N, x)
+            self.buffers[name] = buf
+            setattr(self, name, buf[:, 0:N + K])
+        self.buffers["n"] = N + K
+
+        # running Karcher Mean and moments
+        self.mqn = self.mqn + K / float(N + K) * (qn.mean(axis=1) - self.mqn)
+        for name, x in (("f0", f_new), ("fn", fn)):
+            self.moments[name] = uf.update_moments(*self.moments[name], x)
+        tmp = np.zeros(M)
+        tmp[1:] = cumtrapz(self.mqn * np.abs(self.mqn), self.time)
+        self.fmean = self.moments["f0"][1][1] + tmp
+        self.moments["fgam"] = uf.update_moments(*self.moments["fgam"],
+                                                 warp_mean(self.time, self.fmean, gam))
+        self.moments["psi"] = self.moments["psi"] + np.sqrt(np.gradient(gam, binsize, axis=0)).sum(axis=1)
+
+        # angle between the mean psi and the psi of the identity
+        mu = self.moments["psi"] / geo.L2norm(self.moments["psi"])
+        theta = np.arccos(np.clip(trapz(mu, np.linspace(0, 1, M)), -1, 1))
+        if theta > drift:
+            gamI = uf.SqrtMeanInverse(self.gam)
+            gamI_dev = np.gradient(gamI, binsize)
+            time0 = (self.time[-1] - self.time[0]) * gamI + self.time[0]
+            self.mqn = np.interp(time0, self.time, self.mqn) * np.sqrt(gamI_dev)
+            self.qn[:] = uf.interp_batch(time0, self.time, self.qn) * np.sqrt(gamI_dev)[:, np.newaxis]
+            self.fn[:] = uf.interp_batch(time0, self.time, self.fn)
+            self.gam[:] = uf.interp_batch(time0, self.time, self.gam)
+            tmp[1:] = cumtrapz(self.mqn * np.abs(self.mqn), self.time)
+            self.fmean = self.moments["f0"][1][1] + tmp
+            self.moments["fn"] = uf.update_moments(0, 0, 0, self.fn)
+            self.moments["fgam"] = uf.update_moments(0, 0, 0, warp_mean(self.time, self.fmean, self.gam))
+            self.moments["psi"] = np.sqrt(np.gradient(self.gam, binsize, axis=0)).sum(axis=1)
+
+        self.orig_var = trapz(self.moments["f0"][2] / (N + K), self.time)
+        self.amp_var = trapz(self.moments["fn"][2] / (N + K), self.time)
+        self.phase_var = trapz(self.moments["fgam"][2] / (N + K), self.time)
+
+        return
+
+
     def plot(self):
         """
         plot plot functional alignment results
         
         Usage: obj.plot()
         """
+        import matplotlib.pyplot as plt
 
         M = self.f.shape[0]
         plot.f_plot(self.time, self.f, title="f Original Data")
@@ -326,16 +653,19 @@ class fdawarp:
 
         return
     
-    def gauss_model(self, n=1, sort_samples=False):
+    def gauss_model(self, n=1, sort_samples=False, rng=None):
         """
         This function models the functional data using a Gaussian model
         extracted from the principal components of the srvfs
 
         :param n: number of random samples
         :param sort_samples: sort samples (default = T)
+        :param rng: numpy.random.Generator (default = None, global numpy.random state)
         :type n: integer
         :type sort_samples: bool
         """
+        if rng is None:
+            rng = np.random
         fn = self.fn
         time = self.time
         qn = self.qn
@@ -349,13 +679,13 @@ class fdawarp:
 
         # compute mean and covariance in q-domain
         mq_new = qn.mean(axis=1)
-        mididx = np.round(time.shape[0] / 2)
+        mididx = int(np.round(time.shape[0] / 2))
         m_new = np.sign(fn[mididx, :]) * np.sqrt(np.abs(fn[mididx, :]))
         mqn = np.append(mq_new, m_new.mean())
         qn2 = np.vstack((qn, m_new))
         C = np.cov(qn2)
 
-        q_s = np.random.multivariate_normal(mqn, C, n)
+        q_s = rng.multivariate_normal(mqn, C, n)
         q_s = q_s.transpose()
 
         # compute the correspondence to the original function domain
@@ -371,10 +701,8 @@ class fdawarp:
         fs += err
 
         # random warping generation
-        rgam = uf.randomGamma(gam, n)
-        gams = np.zeros((M, n))
-        for k in range(0, n):
-            gams[:, k] = uf.invertGamma(rgam[:, k])
+        rgam = uf.randomGamma(gam, n, rng)
+        gams = uf.invertGamma(rgam)
 
         # sort functions and warping
         if sort_samples:
@@ -382,40 +710,19 @@ class fdawarp:
             seq1 = mx.argsort()
 
             # compute the psi-function
-            fy = np.gradient(rgam, binsize)
+            fy = np.gradient(rgam, binsize, axis=0)
             psi = fy / np.sqrt(abs(fy) + eps)
-            ip = np.zeros(n)
-            len = np.zeros(n)
-            for i in range(0, n):
-                tmp = np.ones(M)
-                ip[i] = tmp.dot(psi[:, i] / M)
-                len[i] = np.arccos(tmp.dot(psi[:, i] / M))
+            ip = psi.sum(axis=0) / M
+            len = np.arccos(ip)
 
             seq2 = len.argsort()
 
             # combine x-variability and y-variability
-            ft = np.zeros((M, n))
-            for k in range(0, n):
-                ft[:, k] = np.interp(gams[:, seq2[k]], np.arange(0, M) /
-                                    np.double(M - 1), fs[:, seq1[k]])
-                tmp = np.isnan(ft[:, k])
-                while tmp.any():
-                    rgam2 = uf.randomGamma(gam, 1)
-                    ft[:, k] = np.interp(gams[:, seq2[k]], np.arange(0, M) /
-                                        np.double(M - 1), uf.invertGamma(rgam2))
+            ft = uf.warp_f_gamma(np.linspace(0, 1, M), fs[:, seq1], gams[:, seq2])
         else:
             # combine x-variability and y-variability
-            ft = np.zeros((M, n))
-            for k in range(0, n):
-                ft[:, k] = np.interp(gams[:, k], np.arange(0, M) /
-                                    np.double(M - 1), fs[:, k])
-                tmp = np.isnan(ft[:, k])
-                while tmp.any():
-                    rgam2 = uf.randomGamma(gam, 1)
-                    ft[:, k] = np.interp(gams[:, k], np.arange(0, M) /
-                                        np.double(M - 1), uf.invertGamma(rgam2))
+            ft = uf.warp_f_gamma(np.linspace(0, 1, M), fs, gams)
 
-        
         self.rsamps = True
         self.fs = fs
         self.gams = rgam
@@ -425,16 +732,19 @@ class fdawarp:
         return
 
 
-    def joint_gauss_model(self, n=1, no=3):
+    def joint_gauss_model(self, n=1, no=3, rng=None):
         """
         This function models the functional data using a joint Gaussian model
         extracted from the principal components of the srsfs
 
         :param n: number of random samples
         :param no: number of principal components (default = 3)
+        :param rng: numpy.random.Generator (default = None, global numpy.random state)
         :type n: integer
         :type no: integer
         """
+        if rng is None:
+            rng = np.random
 
         # Parameters
         fn = self.fn
@@ -459,24 +769,20 @@ class fdawarp:
         mqn = np.append(mq_new, m_new.mean())
 
         # generate random samples
-        vals = np.random.multivariate_normal(np.zeros(s.shape), np.diag(s), n)
+        vals = rng.multivariate_normal(np.zeros(s.shape), np.diag(s), n)
         
         tmp = np.matmul(U, np.transpose(vals))
         qhat = np.tile(mqn.T,(n,1)).T + tmp[0:M+1,:]
         tmp = np.matmul(U, np.transpose(vals)/C)
         vechat = tmp[(M+1):,:]
-        psihat = np.zeros((M,n))
-        gamhat = np.zeros((M,n))
-        for ii in range(n):
-            psihat[:,ii] = geo.exp_map(mu_psi,vechat[:,ii])
-            gam_tmp = cumtrapz(psihat[:,ii]**2,np.linspace(0,1,M),initial=0.0)
-            gamhat[:,ii] = (gam_tmp - gam_tmp.min())/(gam_tmp.max()-gam_tmp.min())
+        psihat = geo.exp_map(mu_psi,vechat)
+        gam_tmp = cumtrapz(psihat**2,np.linspace(0,1,M),axis=0,initial=0.0)
+        gamhat = (gam_tmp - gam_tmp.min(axis=0))/(gam_tmp.max(axis=0)-gam_tmp.min(axis=0))
         
-        ft = np.zeros((M,n))
         fhat = np.zeros((M,n))
         for ii in range(n):
             fhat[:,ii] = uf.cumtrapzmid(time, qhat[0:M,ii]*np.fabs(qhat[0:M,ii]), np.sign(qhat[M,ii])*(qhat[M,ii]*qhat[M,ii]), mididx)
-            ft[:,ii] = uf.warp_f_gamma(np.linspace(0,1,M),fhat[:,ii],gamhat[:,ii])
+        ft = uf.warp_f_gamma(np.linspace(0,1,M),fhat,gamhat)
 
 
         self.rsamps = True
@@ -510,6 +816,10 @@ class fdawarp:
         M = self.f.shape[0]
         N = self.f.shape[1]
         self.lam = lam
+        self.buffers = None
+        self.smoothdata = smoothdata
+        self.deriv = "spline"
+        self.band = None
 
         if M > 500:
             parallel = True
@@ -526,7 +836,10 @@ class fdawarp:
 
         mq = uf.f_to_srsf(mu, self.time)
 
-        if parallel:
+        if omethod == "DP":
+            gam = uf.optimum_reparam(mq, self.time, q, omethod, lam,
+                                     cores=cores if parallel else 1)
+        elif parallel:
             out = Parallel(n_jobs=cores)(delayed(uf.optimum_reparam)(mq, self.time,
                                     q[:, n], omethod, lam, mu[0], f[0,n]) for n in range(N))
             gam = np.array(out)
@@ -566,11 +879,140 @@ class fdawarp:
         var_fgam = fgam.var(axis=1)
         self.orig_var = trapz(std_f0 ** 2, self.time)
         self.amp_var = trapz(std_fn ** 2, self.time)
-        self.phase_var = trapz(var_fgam, self.time)            
+        self.phase_var = trapz(var_fgam, self.time)
 
         return
 
 
+    def template(self):
+        """
+        This function returns the fitted template of srsf_align or
+        multiple_align_functions as an :class:`fdatemplate`, which aligns new
+        functions and can be saved to disk
+
+        Usage:  model = obj.template()
+
+        :rtype: fdatemplate
+        """
+        if not hasattr(self, 'mqn'):
+            raise Exception('srsf_align or multiple_align_functions must be run first')
+        return fdatemplate(self.mqn, self.fmean, self.time, self.lam, self.method,
+                           self.smoothdata, self.deriv, self.band)
+
+
+class fdatemplate:
+    """
+    This class provides a fitted alignment template: the Karcher Mean of the
+    SRSFs and the options of the fit, which aligns new functions the way the
+    training data was aligned without keeping it, and can be saved to and
+    loaded from a .npz file
+
+    Usage:  model = obj.template()
+            model.save("model.npz")
+            model = fdatemplate.load("model.npz")
+            fn, gam = model.transform(f_new)
+
+    :param mqn: mean srvf
+    :param fmean: function mean
+    :param time: time vector of length M
+    :param lam: controls the elasticity
+    :param omethod: optimization method
+    :param smoothdata: smooth the data
+    :param deriv: differentiation of the SRSFs
+    :param band: bound of the DP search
+    """
+
+    def __init__(self, mqn, fmean, time, lam=0.0, omethod="DP", smoothdata=False,
+                 deriv="spline", band=None):
+        """
+        Construct an instance of the fdatemplate class
+        :param mqn: vector of size M of the mean srvf
+        :param fmean: vector of size M of the function mean
+        :param time: vector of size M describing the sample points
+        :param lam: controls the elasticity (default = 0)
+        :param omethod: optimization method (DP, DPmr, DP2, RBFGS) (default = DP)
+        :param smoothdata: Smooth the data using a box filter (default = F)
+        :param deriv: differentiation of the SRSFs ("spline" or "fd") (default = "spline")
+        :param band: restricts the DP search to warpings with abs(gam(t) - t) <= band,
+                     as a fraction of the domain (default = None, no restriction)
+        """
+        self.mqn = mqn
+        self.fmean = fmean
+        self.time = time
+        self.lam = lam
+        self.omethod = omethod
+        self.smoothdata = smoothdata
+        self.deriv = deriv
+        self.band = band
+        self.workspace = None
+
+    def save(self, filename):
+        """
+        saves the template to a .npz file
+
+        :param filename: file name
+        """
+        band = np.nan if self.band is None else self.band
+        np.savez(filename, mqn=self.mqn, fmean=self.fmean, time=self.time,
+                 lam=self.lam, omethod=self.omethod, smoothdata=self.smoothdata,
+                 deriv=self.deriv, band=band)
+
+    @staticmethod
+    def load(filename):
+        """
+        loads a template saved by :meth:`save`
+
+        :param filename: file name
+        :rtype: fdatemplate
+        """
+        with np.load(filename) as data:
+            opts = {}
+            if "deriv" in data.files:
+                band = float(data["band"])
+                opts = {"smoothdata": bool(data["smoothdata"]),
+                        "deriv": str(data["deriv"]),
+                        "band": None if np.isnan(band) else band}
+            return fdatemplate(data["mqn"], data["fmean"], data["time"],
+                               float(data["lam"]), str(data["omethod"]), **opts)
+
+    def transform(self, f, cores=1):
+        """
+        aligns functions to the template, all columns in one batched DP call,
+        with the smoothdata, deriv and band of the fit
+
+        :param f: numpy ndarray of shape (M,N) of N functions with M samples
+        :param cores: number of threads of the DP, fixed by the first call (default = 1)
+
+        :rtype: tuple of numpy ndarray
+        :return fn: aligned functions
+        :return gam: warping functions
+        """
+        single = f.ndim == 1
+        f = f.reshape(self.time.shape[0], -1)
+        M, N = f.shape
+        eps = np.finfo(np.double).eps
+        f0, g, g2 = uf.gradient_spline(self.time, f, self.smoothdata, self.deriv)
+        q = g / np.sqrt(abs(g) + eps)
+
+        workspace = None
+        if self.omethod in ("DP", "DPmr"):
+            if self.workspace is None:
+                self.workspace = uf.DPWorkspace(M, nthreads=cores)
+            workspace = self.workspace
+        gam = uf.optimum_reparam(self.mqn, self.time, q, self.omethod, self.lam,
+                                 cores=cores, workspace=workspace,
+                                 band=self.band).reshape(M, N)
+
+        fn = np.zeros((M, N))
+        for k in range(0, N):
+            fn[:, k] = np.interp((self.time[-1] - self.time[0]) * gam[:, k]
+                                 + self.time[0], self.time, f[:, k])
+
+        if single:
+            return fn[:, 0], gam[:, 0]
+        return fn, gam
+
+
 def pairwise_align_bayes(f1i, f2i, time, mcmcopts=None):
     """
     This function aligns two functions using Bayesian framework. It will align
@@ -744,15 +1186,14 @@ def pairwise_align_bayes(f1i, f2i, time, mcmcopts=None):
         M,N = pw_sim_est_psi_matrix.shape
         gamma_mat = np.zeros((time.shape[0],N))
         one_v = np.ones(M)
-        Dx = np.zeros(N)
-        Dy = Dx
+        v, theta = geo.inv_exp_map(one_v, pw_sim_est_psi_matrix)
+        Dx = np.sqrt(trapz(v**2, pw_sim_global_domain_par, axis=0))
+        Dy = np.zeros(N)
         for ii in range(0,N):
             interp = interp1d(np.linspace(0,1,result_posterior_psi_simDomain.shape[0]), pw_sim_est_psi_matrix[:,ii], fill_value="extrapolate")
             result_i = interp(time)
             tmp = uf.f_phiinv(result_i)
             gamma_mat[:,ii] = uf.norm_gam(tmp)
-            v, theta = geo.inv_exp_map(one_v,pw_sim_est_psi_matrix[:,ii])
-            Dx[ii] = np.sqrt(trapz(v**2,pw_sim_global_domain_par))
             q2warp = uf.warp_q_gamma(pw_sim_global_domain_par,q2,gamma_mat[:,ii])
             Dy[ii] = np.sqrt(trapz((q1i-q2warp)**2,time))
 
@@ -820,6 +1261,77 @@ def f_updateg_pw(g_coef_curr,g_basis,var1_curr,q1,q2,SSE_curr,propose_g_coef):
 
     return g_coef, logl, SSE, accept, zpcnInd
 
+def warp_mean(time, f, gam):
+    """
+    warps the function f by each of the warping functions gam
+
+    :param time: vector of size M describing the sample points
+    :param f: vector of size M
+    :param gam: numpy ndarray of shape (M,N) of N warping functions
+
+    :rtype: numpy ndarray
+    :return fgam: numpy ndarray of shape (M,N) of the warped functions
+    """
+    return uf.interp_batch((time[-1] - time[0]) * gam + time[0], time, f)
+
+def append_columns(buf, n, x):
+    """
+    writes the columns of x after the first n columns of buf, doubling the
+    capacity of buf when it is full so that appending is amortized O(size of x)
+
+    The caller keeps the length n, the capacity is buf.shape[1]; the returned
+    buffer is a new array whenever the capacity grew.
+
+    :param buf: numpy ndarray of shape (M,C) of capacity C >= n
+    :param n: length, number of used columns of buf
+    :param x: numpy ndarray of shape (M,K)
+
+    :rtype: numpy ndarray
+    :return buf: buffer of capacity >= n+K holding the n+K columns
+    """
+    K = x.shape[1]
+    if buf.shape[1] < n + K:
+        tmp = np.zeros((buf.shape[0], max(2 * buf.shape[1], n + K)))
+        tmp[:, 0:n] = buf[:, 0:n]
+        buf = tmp
+    buf[:, n:n + K] = x
+    return buf
+
+def warm_reparam(mq, time, q0, qr, gam, dprev, lam, workspace, band, radius, tol):
+    """
+    realigns the SRSFs q0 to the template mq with DP seeded by their
+    previous warpings gam
+
+    :param mq: vector of size M of the template SRSF
+    :param time: vector of size M describing the sample points
+    :param q0: numpy ndarray of shape (M,N) of the original SRSFs
+    :param qr: numpy ndarray of shape (M,N) of the SRSFs warped by gam
+    :param gam: numpy ndarray of shape (M,N) of the previous warpings
+    :param dprev: vector of size N of the distances of qr to the previous
+                  template (None to realign all functions)
+    :param lam: controls the elasticity
+    :param workspace: :class:`DPWorkspace` whose buffers are reused
+    :param band: restricts the DP to abs(gam(t) - t) <= band (or None)
+    :param radius: half width of the corridor around gam as a fraction of the domain
+    :param tol: functions whose distance to the template changed by less than
+                tol relative to dprev keep their warping
+
+    :rtype: numpy ndarray
+    :return gam: warping functions
+    """
+    N = q0.shape[1]
+    todo = np.arange(N)
+    if dprev is not None and tol > 0:
+        d = np.sqrt(trapz((qr - mq[:, np.newaxis]) ** 2, time, axis=0))
+        todo = (np.abs(d - dprev) >= tol * dprev).nonzero()[0]
+
+    gam = gam.copy()
+    if todo.size > 0:
+        gam[:, todo] = uf.optimum_reparam_warm(mq, time, q0[:, todo], gam[:, todo],
+                                               radius, lam, workspace=workspace,
+                                               band=band)
+    return gam
+
 def align_fPCA(f, time, num_comp=3, showplot=True, smoothdata=False, cores=-1):
     """
     aligns a collection of functions while extracting principal components.
@@ -895,6 +1407,7 @@ def align_fPCA(f, time, num_comp=3, showplot=True, smoothdata=False, cores=-1):
     qi[:, :, 0] = q
     gam = np.zeros((M, N, MaxItr + 1))
     cost = np.zeros(MaxItr + 1)
+    ws = uf.DPWorkspace(M, nthreads=cores if parallel else 1)
 
     while itr < MaxItr:
         print("updating step: r=%d" % (itr + 1))
@@ -918,14 +1431,8 @@ def align_fPCA(f, time, num_comp=3, showplot=True, smoothdata=False, cores=-1):
         qhat = d1 + tmp
 
         # Matching Step
-        if parallel:
-            out = Parallel(n_jobs=cores)(
-                delayed(uf.optimum_reparam)(qhat[:, n], time, qi[:, n, itr],
-                                            "DP", lam) for n in range(N))
-            gam_t = np.array(out)
-            gam[:, :, itr] = gam_t.transpose()
-        else:
-            gam[:, :, itr] = uf.optimum_reparam(qhat, time, qi[:, :, itr], "DP",  lam)
+        gam[:, :, itr] = uf.optimum_reparam(qhat, time, qi[:, :, itr], "DP", lam,
+                                            workspace=ws)
 
         for k in range(0, N):
             time0 = (time[-1] - time[0]) * gam[:, k, itr] + time[0]
@@ -1011,6 +1518,7 @@ def align_fPCA(f, time, num_comp=3, showplot=True, smoothdata=False, cores=-1):
             c[l, k] = sum((np.append(qn[:, l], m_new[l]) - mqn2) * U[:, k])
 
     if showplot:
+        import matplotlib.pyplot as plt
         CBcdict = {
             'Bl': (0, 0, 0),
             'Or': (.9, .6, 0),
@@ -1243,6 +1751,7 @@ def align_fPLS(f, g, time, comps=3, showplot=True, smoothdata=False,
     gam_f = gam[:, :, itr + 1]
 
     if showplot:
+        import matplotlib.pyplot as plt
         # Align Plots
         fig, ax = plot.f_plot(np.arange(0, M) / float(M - 1), gam_f,
                               title="Warping Functions")
@@ -5,7 +5,7 @@ moduleauthor:: J. Derek Tucker <jdtuck@sandia.gov>
 
 """
 
-from scipy.interpolate import UnivariateSpline, interp1d
+from scipy.interpolate import UnivariateSpline, interp1d, make_interp_spline
 from scipy.integrate import trapz, cumtrapz
 from scipy.linalg import norm, svd, cholesky, inv
 from scipy.stats.mstats import mquantiles
@@ -13,14 +13,19 @@ from numpy import zeros, interp, finfo, double, sqrt, diff, linspace
 from numpy import arccos, sin, cos, arange, ascontiguousarray, round
 from numpy import ones, real, pi, cumsum, fabs, cov, diagflat, inner
 from numpy import gradient, column_stack, append, mean, hstack
-from numpy import insert, vectorize, ceil, mod, array, quantile, dot
+from numpy import insert, vectorize, ceil, mod, array, quantile, dot, intc
+from numpy import floor, argsort, maximum, minimum, searchsorted, take_along_axis
+from numpy import newaxis, where, clip, inf, repeat, tile, asarray, tensordot
 import numpy.random as rn
 import optimum_reparamN2 as orN2
 import optimum_reparam_N as orN
+from optimum_reparam_N import DPWorkspace
 import optimum_reparam_Ng as orNg
+import warp_batch as wb
 import cbayesian as bay
 import fdasrsf.geometry as geo
 import sys
+import warnings
 
 
 def smooth_data(f, sparam):
@@ -45,13 +50,75 @@ def smooth_data(f, sparam):
     return fo
 
 
-def gradient_spline(time, f, smooth=False):
+def gradient_fd(time, f):
+    """
+    This function takes the gradient of f along axis 0 with fourth order
+    finite differences
+
+    Every sample is differentiated with the 5-point Lagrange stencil of its
+    neighbours on the (possibly non-uniform) grid time, centred in the
+    interior and one-sided on the first and last two samples. Grids of
+    fewer than 5 points fall back to the second order numpy.gradient.
+
+    :param time: vector of size M describing the sample points
+    :param f: numpy ndarray of shape (M,...) of samples
+
+    :rtype: numpy ndarray
+    :return g: derivative of f
+    """
+    M = time.shape[0]
+    if M < 5:
+        return gradient(f, time, axis=0, edge_order=2)
+
+    # stencil of each sample and the weights of the derivative of the
+    # Lagrange polynomial through it, evaluated at the sample
+    start = clip(arange(M) - 2, 0, M - 5)
+    idx = start[:, newaxis] + arange(5)
+    X = time[idx]
+    x = time
+    w = zeros((M, 5))
+    for j in range(5):
+        for m in range(5):
+            if m == j:
+                continue
+            term = 1 / (X[:, j] - X[:, m])
+            for l in range(5):
+                if l != j and l != m:
+                    term = term * (x - X[:, l]) / (X[:, j] - X[:, l])
+            w[:, j] += term
+
+    f = asarray(f, dtype=double)
+    shape = (-1,) + (1,) * (f.ndim - 1)
+    g = zeros(f.shape)
+    for j in range(5):
+        g[2:M - 2] += w[2:M - 2, j].reshape(shape) * f[j:M - 4 + j]
+    for i in (0, 1, M - 2, M - 1):
+        g[i] = tensordot(w[i], f[idx[i]], axes=1)
+    return g
+
+
+def gradient_spline(time, f, smooth=False, deriv="spline"):
     """
     This function takes the gradient of f using b-spline smoothing
 
+    Without smoothing all functions share the cubic interpolating spline
+    operator of time, so they are interpolated in one batched call.
+    Smoothing chooses the knots of every function separately and is done
+    function by function.
+
+    With deriv = "fd" the derivatives are the fourth order finite
+    differences of :func:`gradient_fd` on the (possibly non-uniform) grid
+    time, a few times faster than the batched spline on large matrices.
+    Their error decreases as the fourth power of the sampling step like the
+    interpolating spline, but with a larger constant, and the second
+    derivative differentiates the first one, so they are meant for densely
+    sampled smooth data; the samples are returned unchanged and cannot be
+    smoothed.
+
     :param time: vector of size N describing the sample points
     :param f: numpy ndarray of shape (M,N) of M functions with N samples
     :param smooth: smooth data (default = F)
+    :param deriv: differentiation method ("spline" or "fd") (default = "spline")
 
     :rtype: tuple of numpy ndarray
     :return f0: smoothed functions functions
@@ -61,25 +128,32 @@ def gradient_spline(time, f, smooth=False):
     """
     M = f.shape[0]
 
-    if f.ndim > 1:
+    if deriv == "fd":
+        if smooth:
+            raise Exception('smoothing is only supported with deriv "spline"')
+        f0 = f
+        g = gradient_fd(time, f)
+        g2 = gradient_fd(time, g)
+    elif deriv != "spline":
+        raise Exception('deriv must be "spline" or "fd"')
+    elif not smooth:
+        tmp_spline = make_interp_spline(time, f, k=3, axis=0)
+        f0 = tmp_spline(time)
+        g = tmp_spline(time, 1)
+        g2 = tmp_spline(time, 2)
+    elif f.ndim > 1:
         N = f.shape[1]
         f0 = zeros((M, N))
         g = zeros((M, N))
         g2 = zeros((M, N))
         for k in range(0, N):
-            if smooth:
-                spar = time.shape[0] * (.025 * fabs(f[:, k]).max()) ** 2
-            else:
-                spar = 0
+            spar = time.shape[0] * (.025 * fabs(f[:, k]).max()) ** 2
             tmp_spline = UnivariateSpline(time, f[:, k], s=spar)
             f0[:, k] = tmp_spline(time)
             g[:, k] = tmp_spline(time, 1)
             g2[:, k] = tmp_spline(time, 2)
     else:
-        if smooth:
-            spar = time.shape[0] * (.025 * fabs(f).max()) ** 2
-        else:
-            spar = 0
+        spar = time.shape[0] * (.025 * fabs(f).max()) ** 2
         tmp_spline = UnivariateSpline(time, f, s=spar)
         f0 = tmp_spline(time)
         g = tmp_spline(time, 1)
@@ -88,19 +162,25 @@ def gradient_spline(time, f, smooth=False):
     return f0, g, g2
 
 
-def f_to_srsf(f, time, smooth=False):
+def f_to_srsf(f, time, smooth=False, deriv="spline"):
     """
     converts f to a square-root slope function (SRSF)
 
     :param f: vector of size N samples
     :param time: vector of size N describing the sample points
+    :param smooth: smooth data (default = F)
+    :param deriv: differentiation method ("spline" or "fd"), see
+                  :func:`gradient_spline` (default = "spline")
 
     :rtype: vector
     :return q: srsf of f
 
     """
     eps = finfo(double).eps
-    f0, g, g2 = gradient_spline(time, f, smooth)
+    if deriv == "fd" and not smooth:
+        g = gradient_fd(time, f)
+    else:
+        f0, g, g2 = gradient_spline(time, f, smooth, deriv)
     q = g / sqrt(fabs(g) + eps)
     return q
 
@@ -122,45 +202,105 @@ def srsf_to_f(q, time, f0=0.0):
     return f
 
 
-def optimum_reparam(q1, time, q2, method="DP", lam=0.0, f1o=0.0, f2o=0.0):
+def dp_band(M, band):
+    """
+    computes the search corridor of the DP alignment for a diagonal band
+
+    :param M: number of samples
+    :param band: half width of the band as a fraction of the domain, i.e.
+                 the largest allowed deviation of gam(t) from t
+
+    :rtype: tuple of numpy arrays
+    :return lo: lowest sample index of the warping at each sample
+    :return hi: highest sample index of the warping at each sample
+
+    """
+    if band <= 0:
+        raise Exception('band must be positive')
+    w = max(int(ceil(band * (M - 1))), 1)
+    j = arange(M, dtype=intc)
+    lo = (j - w).clip(0, M - 1)
+    hi = (j + w).clip(0, M - 1)
+    return lo, hi
+
+
+def optimum_reparam(q1, time, q2, method="DP", lam=0.0, f1o=0.0, f2o=0.0, cores=1,
+                    workspace=None, band=None, tv1=None, tv2=None):
     """
     calculates the warping to align srsf q2 to q1
 
     :param q1: vector of size N or array of NxM samples of first SRSF
     :param time: vector of size N describing the sample points
     :param q2: vector of size N or array of NxM samples samples of second SRSF
-    :param method: method to apply optimization (default="DP") options are "DP", "DP2" and "RBFGS"
+    :param method: method to apply optimization (default="DP") options are "DP", "DPmr", "DP2" and "RBFGS"
     :param lam: controls the amount of elasticity (default = 0.0)
+    :param cores: number of native threads used to align the columns of an
+                  array q2 with methods "DP" and "DP2" (default = 1, -1 uses all cores)
+    :param workspace: :class:`DPWorkspace` whose buffers are reused by method
+                      "DP"; its thread count overrides cores (default = None)
+    :param band: restricts method "DP" to warpings with
+                 abs(gam(t) - t) <= band, as a fraction of the domain. This
+                 reduces time and memory from O(N^2) to O(band*N^2). A
+                 warning is issued if an optimal warping touches the band
+                 edge, in which case band should be increased
+                 (default = None, no restriction)
+    :param tv1: increasing, possibly non-uniform grid from time[0] to
+                time[-1] searched by method "DP2" on the time scale of q1.
+                A coarser grid trades accuracy for speed (default = None, time)
+    :param tv2: grid of method "DP2" on the time scale of q2 (default = None, time)
 
     :rtype: vector
     :return gam: describing the warping function used to align q2 with q1
 
     """
 
+    if band is not None and method != "DP":
+        raise Exception('band is only supported with method "DP"')
+
+    if (tv1 is not None or tv2 is not None) and method != "DP2":
+        raise Exception('tv1 and tv2 are only supported with method "DP2"')
+
     if method == "DP":
+        lo = hi = edge = None
+        if band is not None:
+            lo, hi = dp_band(time.shape[0], band)
+            edge = zeros(1 if q2.ndim == 1 else q2.shape[1], dtype=intc)
+
         if q1.ndim == 1 and q2.ndim == 1:
             gam = orN.coptimum_reparam(ascontiguousarray(q1), time,
-                                    ascontiguousarray(q2), lam)
+                                    ascontiguousarray(q2), lam, workspace,
+                                    lo, hi, edge)
 
         if q1.ndim == 1 and q2.ndim == 2:
             gam = orN.coptimum_reparam_N(ascontiguousarray(q1), time,
-                                        ascontiguousarray(q2), lam)
+                                        ascontiguousarray(q2), lam, cores,
+                                        workspace, lo, hi, edge)
 
         if q1.ndim == 2 and q2.ndim == 2:
             gam = orN.coptimum_reparam_N2(ascontiguousarray(q1), time,
-                                        ascontiguousarray(q2), lam)
+                                        ascontiguousarray(q2), lam, cores,
+                                        workspace, lo, hi, edge)
+
+        if edge is not None and edge.any():
+            warnings.warn('optimal warping touches the band edge in %d of %d '
+                          'alignments, consider increasing band'
+                          % (edge.sum(), edge.shape[0]), RuntimeWarning)
+    elif method == "DPmr":
+        gam = optimum_reparam_mr(q1, time, q2, lam, cores, workspace)
     elif method == "DP2":
         if q1.ndim == 1 and q2.ndim == 1:
             gam = orN2.coptimum_reparam(ascontiguousarray(q1), time,
-                                    ascontiguousarray(q2), lam)
+                                    ascontiguousarray(q2), lam, tv1, tv2)
 
         if q1.ndim == 1 and q2.ndim == 2:
             gam = orN2.coptimum_reparamN(ascontiguousarray(q1), time,
-                                        ascontiguousarray(q2), lam)
+                                        ascontiguousarray(q2), lam, tv1, tv2,
+                                        cores)
 
         if q1.ndim == 2 and q2.ndim == 2:
             gam = orN2.coptimum_reparamN2(ascontiguousarray(q1), time,
-                                        ascontiguousarray(q2), lam)
+                                        ascontiguousarray(q2), lam, tv1, tv2,
+                                        cores)
     elif method == "RBFGS":
         onlyDP=False
         rotated=False
@@ -203,6 +343,153 @@ def optimum_reparam(q1, time, q2, method="DP", lam=0.0, f1o=0.0, f2o=0.0):
     return gam
 
 
+def optimum_reparam_mr(q1, time, q2, lam=0.0, cores=1, workspace=None,
+                       coarsest=64, radius=8):
+    """
+    calculates the warping to align srsf q2 to q1 with coarse-to-fine DP
+
+    The DP is solved on the full grid of a downsampled pair of SRSFs only.
+    The resolution is then doubled level by level up to the original
+    sampling, where each level searches a corridor of +/- radius samples
+    around the warping of the previous level projected onto the finer grid.
+    Alignments whose warping touches the corridor edge are repeated with a
+    wider corridor, so the result stays close to the full grid "DP"
+    optimum at a cost that grows about linearly with N.
+
+    :param q1: vector of size N or array of NxM samples of first SRSF
+    :param time: vector of size N describing the sample points
+    :param q2: vector of size N or array of NxM samples samples of second SRSF
+    :param lam: controls the amount of elasticity (default = 0.0)
+    :param cores: number of native threads used to align the columns of an
+                  array q2 (default = 1, -1 uses all cores)
+    :param workspace: :class:`DPWorkspace` whose buffers are reused (default = None)
+    :param coarsest: smallest number of samples of the coarsest level (default = 64)
+    :param radius: half width of the corridor in samples (default = 8)
+
+    :rtype: vector
+    :return gam: describing the warping function used to align q2 with q1
+
+    """
+    N = time.shape[0]
+    sizes = [N]
+    while (sizes[-1] - 1) // 2 + 1 >= coarsest:
+        sizes.append((sizes[-1] - 1) // 2 + 1)
+    sizes.reverse()
+
+    single = q2.ndim == 1
+    q2 = q2.reshape(N, -1)
+    M = q2.shape[1]
+
+    gam = None
+    for n in sizes:
+        if n < N:
+            t = linspace(time[0], time[-1], n)
+            q1n = interp1d(time, q1, axis=0)(t)
+            q2n = interp1d(time, q2, axis=0)(t)
+        else:
+            t, q1n, q2n = time, q1, q2
+
+        if gam is None:
+            gam = optimum_reparam(q1n, t, q2n, "DP", lam, cores=cores,
+                                  workspace=workspace).reshape(n, M)
+            continue
+
+        # projected warping in samples of this level and the corridor
+        # around it, each column also covers the neighbouring columns
+        c = interp1d(linspace(0, 1, gam.shape[0]), gam, axis=0)(linspace(0, 1, n)) * (n - 1)
+        cl = floor(insert(c[:-1], 0, c[0], axis=0))
+        ch = ceil(append(c[1:], c[-1:], axis=0))
+        gam = zeros((n, M))
+        r = zeros(M, dtype=int) + radius
+        todo = arange(M)
+        while todo.size > 0:
+            lo = (cl[:, todo] - r[todo]).clip(0, n - 1).astype(intc)
+            hi = (ch[:, todo] + r[todo]).clip(0, n - 1).astype(intc)
+            edge = zeros(todo.size, dtype=intc)
+            if q1n.ndim == 1:
+                gam[:, todo] = orN.coptimum_reparam_N(ascontiguousarray(q1n), t,
+                                    ascontiguousarray(q2n[:, todo]), lam, cores,
+                                    workspace, lo, hi, edge)
+            else:
+                gam[:, todo] = orN.coptimum_reparam_N2(ascontiguousarray(q1n[:, todo]),
+                                    t, ascontiguousarray(q2n[:, todo]), lam, cores,
+                                    workspace, lo, hi, edge)
+            todo = todo[edge != 0]
+            r[todo] *= 4
+
+    if single:
+        gam = gam[:, 0]
+
+    return gam
+
+
+def optimum_reparam_warm(q1, time, q2, gam0, radius=0.05, lam=0.0, cores=1,
+                         workspace=None, band=None):
+    """
+    calculates the warping to align srsf q2 to q1 with DP seeded by a
+    previous warping
+
+    The DP only searches a corridor of +/- radius around gam0, which costs
+    O(radius*N^2) instead of O(N^2). Alignments whose warping touches the
+    corridor edge are repeated on the full grid, so a good seed gives the
+    full grid "DP" optimum.
+
+    :param q1: vector of size N or array of NxM samples of first SRSF
+    :param time: vector of size N describing the sample points
+    :param q2: vector of size N or array of NxM samples samples of second SRSF
+    :param gam0: vector of size N or array of NxM samples of previous warpings
+    :param radius: half width of the corridor as a fraction of the domain (default = 0.05)
+    :param lam: controls the amount of elasticity (default = 0.0)
+    :param cores: number of native threads used to align the columns of an
+                  array q2 (default = 1, -1 uses all cores)
+    :param workspace: :class:`DPWorkspace` whose buffers are reused (default = None)
+    :param band: also restricts the search to abs(gam(t) - t) <= band,
+                 see :func:`optimum_reparam` (default = None)
+
+    :rtype: vector
+    :return gam: describing the warping function used to align q2 with q1
+
+    """
+    N = time.shape[0]
+    single = q2.ndim == 1
+    q2 = q2.reshape(N, -1)
+    M = q2.shape[1]
+
+    # each column of the corridor also covers the neighbouring columns
+    w = max(int(ceil(radius * (N - 1))), 1)
+    c = gam0.reshape(N, M) * (N - 1)
+    cl = floor(insert(c[:-1], 0, c[0], axis=0))
+    ch = ceil(append(c[1:], c[-1:], axis=0))
+    lo = (cl - w).clip(0, N - 1).astype(intc)
+    hi = (ch + w).clip(0, N - 1).astype(intc)
+    if band is not None:
+        blo, bhi = dp_band(N, band)
+        lo = maximum(lo, blo[:, None])
+        hi = minimum(hi, bhi[:, None])
+
+    edge = zeros(M, dtype=intc)
+    if q1.ndim == 1:
+        gam = orN.coptimum_reparam_N(ascontiguousarray(q1), time,
+                                     ascontiguousarray(q2), lam, cores,
+                                     workspace, lo, hi, edge)
+    else:
+        gam = orN.coptimum_reparam_N2(ascontiguousarray(q1), time,
+                                      ascontiguousarray(q2), lam, cores,
+                                      workspace, lo, hi, edge)
+
+    redo = edge.nonzero()[0]
+    if redo.size > 0:
+        q1r = q1 if q1.ndim == 1 else q1[:, redo]
+        gam[:, redo] = optimum_reparam(q1r, time, q2[:, redo], "DP", lam,
+                                       cores=cores, workspace=workspace,
+                                       band=band).reshape(N, -1)
+
+    if single:
+        gam = gam[:, 0]
+
+    return gam
+
+
 def optimum_reparam_pair(q, time, q1, q2, lam=0.0):
     """
     calculates the warping to align srsf pair q1 and q2 to q
@@ -230,7 +517,7 @@ def optimum_reparam_pair(q, time, q1, q2, lam=0.0):
     return gam
 
 
-def elastic_distance(f1, f2, time, method="DP", lam=0.0):
+def elastic_distance(f1, f2, time, method="DP", lam=0.0, band=None):
     """"
     calculates the distances between function, where f1 is aligned to
     f2. In other words
@@ -240,6 +527,8 @@ def elastic_distance(f1, f2, time, method="DP", lam=0.0):
     :param f2: vector of size N
     :param time: vector of size N describing the sample points
     :param lam: controls the elasticity (default = 0.0)
+    :param band: restricts the "DP" search to warpings within band of the
+                 identity, see :func:`optimum_reparam` (default = None)
 
     :rtype: scalar
     :return Dy: amplitude distance
@@ -249,7 +538,7 @@ def elastic_distance(f1, f2, time, method="DP", lam=0.0):
     q1 = f_to_srsf(f1, time)
     q2 = f_to_srsf(f2, time)
 
-    gam = optimum_reparam(q1, time, q2, method, lam)
+    gam = optimum_reparam(q1, time, q2, method, lam, band=band)
     fw = interp((time[-1] - time[0]) * gam + time[0], time, f2)
     qw = f_to_srsf(fw, time)
 
@@ -262,16 +551,308 @@ def elastic_distance(f1, f2, time, method="DP", lam=0.0):
     return Dy, Dx
 
 
-def invertGamma(gam):
+def elastic_distance_batch(q1, f2, q2, time, method="DP", lam=0.0,
+                           workspace=None, band=None, gam=None):
+    """
+    calculates the elastic distances of the columns of f2 aligned to a
+    single function with SRSF q1, or to the columns of q1, as
+    :func:`elastic_distance`
+
+    :param q1: vector of size M, SRSF of the first function, or numpy
+               ndarray of shape (M,N) of one SRSF per column of f2
+    :param f2: numpy ndarray of shape (M,N) of N functions with M samples
+    :param q2: numpy ndarray of shape (M,N), SRSFs of f2
+    :param time: vector of size M describing the sample points
+    :param method: optimization method (default="DP"), see :func:`optimum_reparam`
+    :param lam: controls the elasticity (default = 0.0)
+    :param workspace: :class:`DPWorkspace` used by method "DP" (default = None)
+    :param band: restricts the "DP" search to warpings within band of the
+                 identity, see :func:`optimum_reparam` (default = None)
+    :param gam: numpy ndarray of shape (M,N) of warpings already computed,
+                f2 is then not aligned again (default = None)
+
+    :rtype: tuple of numpy ndarray
+    :return Dy: amplitude distances
+    :return Dx: phase distances
+
+    """
+    M, N = f2.shape
+    if gam is None:
+        gam = optimum_reparam(q1, time, q2, method, lam, workspace=workspace,
+                              band=band)
+    fw = warp_f_gamma(time, f2, gam)
+    qw = f_to_srsf(fw, time)
+
+    Dy = sqrt(trapz((qw - q1.reshape(M, -1)) ** 2, time, axis=0))
+    psi = sqrt(diff(gam, axis=0) * (M - 1))
+    Dx = real(arccos(psi.sum(axis=0) / double(M - 1)))
+
+    return Dy, Dx
+
+
+def elastic_distance_matrix(f, time, method="DP", lam=0.0, cores=1, band=None,
+                            out=None):
+    """
+    calculates the pairwise elastic distances between the columns of f
+
+    The SRSFs are computed once, and for each function all functions with a
+    larger index are aligned to it in one batch call of
+    :func:`optimum_reparam`. Only these N(N-1)/2 pairs are computed, the
+    distance of f[:, j] aligned to f[:, i] is used for both entries (i, j)
+    and (j, i). Rows are written to the output as soon as they are
+    complete, so `out` can be memory mapped arrays for large N.
+
+    :param f: numpy ndarray of shape (M,N) of N functions with M samples
+    :param time: vector of size M describing the sample points
+    :param method: optimization method (default="DP"), see :func:`optimum_reparam`
+    :param lam: controls the elasticity (default = 0.0)
+    :param cores: number of native threads used by method "DP" (default = 1,
+                  -1 uses all cores)
+    :param band: restricts the "DP" search to warpings within band of the
+                 identity, see :func:`optimum_reparam` (default = None)
+    :param out: tuple (Dy, Dx) of arrays of shape (N,N) the distances are
+                written to, e.g. numpy.memmap (default = None)
+
+    :rtype: tuple of numpy ndarray
+    :return Dy: amplitude distance matrix
+    :return Dx: phase distance matrix
+
+    """
+    M, N = f.shape
+    if out is None:
+        Dy = zeros((N, N))
+        Dx = zeros((N, N))
+    else:
+        Dy, Dx = out
+
+    q = f_to_srsf(f, time)
+    ws = DPWorkspace(M, nthreads=cores) if method == "DP" else None
+
+    Dy[N - 1, N - 1] = 0
+    Dx[N - 1, N - 1] = 0
+    for i in range(0, N - 1):
+        dy, dx = elastic_distance_batch(q[:, i], f[:, i + 1:], q[:, i + 1:],
+                                        time, method, lam, ws, band)
+        Dy[i, i] = 0
+        Dx[i, i] = 0
+        Dy[i, i + 1:] = dy
+        Dx[i, i + 1:] = dx
+        Dy[i + 1:, i] = dy
+        Dx[i + 1:, i] = dx
+
+    if hasattr(Dy, 'flush'):
+        Dy.flush()
+    if hasattr(Dx, 'flush'):
+        Dx.flush()
+
+    return Dy, Dx
+
+
+def elastic_cdist(fq, fr, time, method="DP", lam=0.0, cores=1, band=None,
+                  k=None, chunk=1000):
+    """
+    calculates the elastic distances between query functions and reference
+    functions
+
+    Each reference function is aligned to the query function, i.e. entry
+    (i, j) equals elastic_distance(fq[:, i], fr[:, j], time). The queries
+    are processed in blocks of about chunk / R functions (R references, at
+    least one query per block, the references are then split into blocks of
+    chunk functions), the SRSFs of a block are computed when it is reached
+    and all its query-reference pairs are aligned in one DP batch. With k
+    given only the k nearest references of each query are kept, so the full
+    distance matrix is never stored.
+
+    :param fq: numpy ndarray of shape (M,Q) of Q query functions with M samples
+    :param fr: numpy ndarray of shape (M,R) of R reference functions with M samples
+    :param time: vector of size M describing the sample points
+    :param method: optimization method (default="DP"), see :func:`optimum_reparam`
+    :param lam: controls the elasticity (default = 0.0)
+    :param cores: number of native threads used by method "DP" (default = 1,
+                  -1 uses all cores)
+    :param band: restricts the "DP" search to warpings within band of the
+                 identity, see :func:`optimum_reparam` (default = None)
+    :param k: number of nearest references returned per query, in terms of
+              the amplitude distance (default = None, all)
+    :param chunk: largest number of pairs aligned in one batch (default = 1000)
+
+    :rtype: tuple of numpy ndarray
+    :return Dy: amplitude distances, shape (Q,R) or (Q,k) sorted increasingly
+    :return Dx: phase distances, shape (Q,R) or (Q,k)
+    :return idx: indices of the k nearest references, shape (Q,k), only
+                 returned if k is given
+
+    """
+    M, Q = fq.shape
+    R = fr.shape[1]
+    ws = DPWorkspace(M, nthreads=cores) if method == "DP" else None
+    qb = max(1, chunk // R)
+    rb = min(R, chunk)
+
+    if k is None:
+        Dy = zeros((Q, R))
+        Dx = zeros((Q, R))
+    else:
+        k = min(k, R)
+        Dy = zeros((Q, k))
+        Dx = zeros((Q, k))
+        idx = zeros((Q, k), dtype=int)
+
+    for i0 in range(0, Q, qb):
+        i1 = min(i0 + qb, Q)
+        nq = i1 - i0
+        qq = f_to_srsf(fq[:, i0:i1], time)
+        if k is not None:
+            dy = zeros((nq, 0))
+            dx = zeros((nq, 0))
+            di = zeros((nq, 0), dtype=int)
+        for j0 in range(0, R, rb):
+            j1 = min(j0 + rb, R)
+            nr = j1 - j0
+            qr = f_to_srsf(fr[:, j0:j1], time)
+            # all pairs of the two blocks, the query varies slowest
+            cy, cx = elastic_distance_batch(repeat(qq, nr, axis=1),
+                                            tile(fr[:, j0:j1], nq), tile(qr, nq),
+                                            time, method, lam, ws, band)
+            cy = cy.reshape(nq, nr)
+            cx = cx.reshape(nq, nr)
+            if k is None:
+                Dy[i0:i1, j0:j1] = cy
+                Dx[i0:i1, j0:j1] = cx
+            else:
+                # keep the k best of the references seen so far
+                dy = hstack((dy, cy))
+                dx = hstack((dx, cx))
+                di = hstack((di, tile(arange(j0, j1), (nq, 1))))
+                best = argsort(dy, axis=1, kind="stable")[:, :k]
+                dy = take_along_axis(dy, best, axis=1)
+                dx = take_along_axis(dx, best, axis=1)
+                di = take_along_axis(di, best, axis=1)
+        if k is not None:
+            Dy[i0:i1], Dx[i0:i1], idx[i0:i1] = dy, dx, di
+
+    if k is None:
+        return Dy, Dx
+
+    return Dy, Dx, idx
+
+
+def elastic_knn(fq, fr, time, k=1, lam=0.0, cores=1, chunk=8, slack=None):
+    """
+    finds the k nearest reference functions of each query function in terms
+    of the elastic amplitude distance
+
+    The references are visited in increasing order of abs(||q1|| - ||q2||)
+    and are pruned as soon as it exceeds the current k-th smallest distance.
+    This is a lower bound of the exact elastic distance, which preserves the
+    norm of q2, but the distances here warp f2 and recompute its SRSF as
+    :func:`elastic_distance_batch` does, so it only holds up to the
+    discretization error and the pruning is approximate: a reference whose
+    distance is within that error of the k-th smallest one can be missed.
+    Otherwise the neighbors are those of :func:`elastic_cdist` with k given.
+
+    With slack given, the DP alignments are also abandoned once their partial
+    cost suggests that the distance exceeds (1 + slack) times the k-th
+    smallest distance. That test relates the DP cost to the distance only
+    approximately and is not a lower bound, so true neighbors can be dropped
+    and the result is approximate.
+
+    :param fq: numpy ndarray of shape (M,Q) of Q query functions with M samples
+    :param fr: numpy ndarray of shape (M,R) of R reference functions with M samples
+    :param time: vector of size M describing the sample points
+    :param k: number of nearest neighbors (default = 1)
+    :param lam: controls the elasticity (default = 0.0)
+    :param cores: number of native threads (default = 1, -1 uses all cores)
+    :param chunk: number of references aligned in one batch (default = 8)
+    :param slack: relative margin of the approximate early abandoning
+                  (default = None, no abandoning and exact neighbors)
+
+    :rtype: tuple of numpy ndarray
+    :return Dy: amplitude distances of the neighbors, shape (Q,k) sorted increasingly
+    :return Dx: phase distances of the neighbors, shape (Q,k)
+    :return idx: indices of the neighbors, shape (Q,k)
+    :return prune: fraction of references of each query whose distance was
+                   not computed in full
+
+    """
+    M, Q = fq.shape
+    R = fr.shape[1]
+    k = min(k, R)
+    dt = mean(diff(time))
+    qq = f_to_srsf(fq, time)
+    qr = f_to_srsf(fr, time)
+    ws = DPWorkspace(M, nthreads=cores)
+
+    # norms for the lower bound and for the abandoning threshold
+    nr = sqrt(trapz(qr ** 2, time, axis=0))
+    Br = norm(qr, axis=0)
+
+    Dy = zeros((Q, k))
+    Dx = zeros((Q, k))
+    idx = zeros((Q, k), dtype=int)
+    prune = zeros(Q)
+    for i in range(0, Q):
+        q1 = ascontiguousarray(qq[:, i])
+        A = norm(q1)
+        lb = fabs(sqrt(trapz(q1 ** 2, time)) - nr)
+        order = argsort(lb, kind="stable")
+
+        dy = array([])
+        dx = array([])
+        di = array([], dtype=int)
+        done = 0
+        pos = 0
+        while pos < R:
+            if dy.shape[0] == k and lb[order[pos]] >= dy[-1]:
+                break
+            blk = order[pos:pos + chunk]
+            pos += blk.shape[0]
+
+            thr = None
+            if slack is not None and dy.shape[0] == k:
+                # heuristic Dy^2 ~ dt((A - B)^2 + A B cost), not a bound
+                d = (1 + slack) * dy[-1]
+                thr = (d ** 2 / dt - (A - Br[blk]) ** 2) / (A * Br[blk])
+            flag = zeros(blk.shape[0], dtype=intc)
+            gam = orN.coptimum_reparam_N(q1, time, ascontiguousarray(qr[:, blk]),
+                                         lam, cores, ws, None, None, flag, thr)
+            keep = flag >= 0
+            blk = blk[keep]
+            gam = gam[:, keep]
+            if blk.shape[0] == 0:
+                continue
+            done += blk.shape[0]
+
+            cy, cx = elastic_distance_batch(q1, fr[:, blk], qr[:, blk], time,
+                                            lam=lam, gam=gam)
+
+            dy = hstack((dy, cy))
+            dx = hstack((dx, cx))
+            di = hstack((di, blk))
+            best = argsort(dy, kind="stable")[:k]
+            dy, dx, di = dy[best], dx[best], di[best]
+
+        Dy[i, :], Dx[i, :], idx[i, :] = dy, dx, di
+        prune[i] = 1 - done / double(R)
+
+    return Dy, Dx, idx, prune
+
+
+def invertGamma(gam, cores=1):
     """
     finds the inverse of the diffeomorphism gamma
 
-    :param gam: vector describing the warping function
+    :param gam: vector describing the warping function, or numpy ndarray of
+                shape (M,N) of N warping functions inverted at once by the
+                compiled batch kernel
+    :param cores: number of threads of the batch kernel (default = 1, -1 uses all)
 
     :rtype: vector
     :return gamI: inverse of gam
 
     """
+    if gam.ndim > 1:
+        return wb.invert_gamma(gam, cores)
     N = gam.size
     x = linspace(0,1,N)
     s = interp1d(gam, x)
@@ -280,12 +861,63 @@ def invertGamma(gam):
     return gamI
 
 
-def SqrtMeanInverse(gam):
+def _shooting(mu, psi, w):
+    # angles between mu and every column of psi, and the coefficients c of
+    # the shooting vectors c * (psi - cos(theta) * mu)
+    theta = arccos(clip(geo.inner_product(mu, psi, w), -1, 1))
+    c = zeros(theta.shape)
+    nz = theta >= 1e-10
+    c[nz] = theta[nz] / sin(theta[nz])
+    return theta, c
+
+
+def _sqrt_mean(blocks, n, w):
+    # Karcher mean of n psi functions given by blocks(), which iterates over
+    # their columns in blocks. Every iteration needs two matrix-vector
+    # products with psi, the mean shooting vector being
+    # psi @ c / n - mu * (c . cos(theta)) / n.
+    mnpsi = sum(p.sum(axis=1) for p in blocks()) / n
+    dmin = inf
+    for p in blocks():
+        dqq = sqrt(((p - mnpsi[:, newaxis]) ** 2).sum(axis=0))
+        if dqq.min() < dmin:
+            dmin = dqq.min()
+            mu = p[:, dqq.argmin()].copy()
+
+    def mean_shooting(mu):
+        v = zeros(mu.shape[0])
+        s = 0.0
+        for p in blocks():
+            theta, c = _shooting(mu, p, w)
+            v += p @ c
+            s += c @ cos(theta)
+        return (v - mu * s) / n
+
+    maxiter = 501
+    lvm = zeros(maxiter)
+    stp = .3
+    itr = 0
+
+    vbar = mean_shooting(mu)
+    lvm[itr] = geo.L2norm(vbar, w)
+
+    while (lvm[itr] > 0.00000001) and (itr<maxiter):
+        mu = geo.exp_map(mu, stp*vbar, w)
+        itr += 1
+        vbar = mean_shooting(mu)
+        lvm[itr] = geo.L2norm(vbar, w)
+
+    return mu
+
+
+def SqrtMeanInverse(gam, chunk=None):
     """
     finds the inverse of the mean of the set of the diffeomorphisms gamma
 
     :param gam: numpy ndarray of shape (M,N) of M warping functions
                 with N samples
+    :param chunk: number of warping functions whose srsfs are held in memory
+                  at once, gam can then be a numpy.memmap (default = None, all)
 
     :rtype: vector
     :return gamI: inverse of gam
@@ -295,43 +927,13 @@ def SqrtMeanInverse(gam):
     (T,n) = gam.shape
     time = linspace(0,1,T)
     binsize = mean(diff(time))
-    psi = zeros((T, n))
-    for k in range(0, n):
-        psi[:, k] = sqrt(gradient(gam[:, k],binsize))
-
-    # Find Direction
-    mnpsi = psi.mean(axis=1)
-    a = mnpsi.repeat(n)
-    d1 = a.reshape(T, n)
-    d = (psi - d1) ** 2
-    dqq = sqrt(d.sum(axis=0))
-    min_ind = dqq.argmin()
-    mu = psi[:, min_ind]
-    maxiter = 501
-    tt = 1
-    lvm = zeros(maxiter)
-    vec = zeros((T, n))
-    stp = .3
-    itr = 0
-
-    for i in range(0,n):
-        out, theta = geo.inv_exp_map(mu,psi[:,i])
-        vec[:,i] = out
-
-    vbar = vec.mean(axis=1)
-    lvm[itr] = geo.L2norm(vbar)
-
-    while (lvm[itr] > 0.00000001) and (itr<maxiter):
-        mu = geo.exp_map(mu, stp*vbar)
-        itr += 1
-        for i in range(0,n):
-            out, theta = geo.inv_exp_map(mu,psi[:,i])
-            vec[:,i] = out
-
-        vbar = vec.mean(axis=1)
-        lvm[itr] = geo.L2norm(vbar)
+    chunk = n if chunk is None else chunk
 
+    def blocks():
+        for b in range(0, n, chunk):
+            yield sqrt(gradient(gam[:, b:b + chunk], binsize, axis=0))
 
+    mu = _sqrt_mean(blocks, n, geo.quadrature_weights(T))
     gam_mu = cumtrapz(mu*mu, time, initial=0)
     gam_mu = (gam_mu - gam_mu.min()) / (gam_mu.max() - gam_mu.min())
     gamI = invertGamma(gam_mu)
@@ -342,6 +944,10 @@ def SqrtMean(gam):
     """
     calculates the srsf of warping functions with corresponding shooting vectors
 
+    All functions are handled at once: every iteration needs two
+    matrix-vector products with psi, the mean shooting vector being
+    psi @ c / N - mu * (c . cos(theta)) / N.
+
     :param gam: numpy ndarray of shape (M,N) of M warping functions
                 with N samples
 
@@ -356,42 +962,12 @@ def SqrtMean(gam):
     (T,n) = gam.shape
     time = linspace(0,1,T)
     binsize = mean(diff(time))
-    psi = zeros((T, n))
-    for k in range(0, n):
-        psi[:, k] = sqrt(gradient(gam[:, k],binsize))
-
-    # Find Direction
-    mnpsi = psi.mean(axis=1)
-    a = mnpsi.repeat(n)
-    d1 = a.reshape(T, n)
-    d = (psi - d1) ** 2
-    dqq = sqrt(d.sum(axis=0))
-    min_ind = dqq.argmin()
-    mu = psi[:, min_ind]
-    maxiter = 501
-    tt = 1
-    lvm = zeros(maxiter)
-    vec = zeros((T, n))
-    stp = .3
-    itr = 0
+    w = geo.quadrature_weights(T)
+    psi = sqrt(gradient(gam, binsize, axis=0))
 
-    for i in range(0,n):
-        out, theta = geo.inv_exp_map(mu,psi[:,i])
-        vec[:,i] = out
-
-    vbar = vec.mean(axis=1)
-    lvm[itr] = geo.L2norm(vbar)
-
-    while (lvm[itr] > 0.00000001) and (itr<maxiter):
-        mu = geo.exp_map(mu, stp*vbar)
-        itr += 1
-        for i in range(0,n):
-            out, theta = geo.inv_exp_map(mu,psi[:,i])
-            vec[:,i] = out
-
-        vbar = vec.mean(axis=1)
-        lvm[itr] = geo.L2norm(vbar)
+    mu = _sqrt_mean(lambda: (psi,), n, w)
 
+    vec, theta = geo.inv_exp_map(mu, psi, w)
 
     gam_mu = cumtrapz(mu*mu, time, initial=0)
     gam_mu = (gam_mu - gam_mu.min()) / (gam_mu.max() - gam_mu.min())
@@ -416,6 +992,7 @@ def SqrtMedian(gam):
 
     (T,n) = gam.shape
     time = linspace(0,1,T)
+    w = geo.quadrature_weights(T)
 
     # Initialization
     psi_median = ones(T)
@@ -426,34 +1003,30 @@ def SqrtMedian(gam):
 
     # compute psi function
     binsize = mean(diff(time))
-    psi = zeros((T, n))
-    v = zeros((T,n))
-    vtil = zeros((T,n))
-    d = zeros(n)
-    dtil = zeros(n)
-    for k in range(0, n):
-        psi[:, k] = sqrt(gradient(gam[:, k],binsize))
-        v[:,k], d[k] = geo.inv_exp_map(psi_median,psi[:,k])
-        vtil[:,k] = v[:,k]/d[k]
-        dtil[k] = 1/d[k]
-
-    vbar = vtil.sum(axis=1)*dtil.sum()**(-1)
-    vbar_norm[r] = geo.L2norm(vbar)
+    psi = sqrt(gradient(gam, binsize, axis=0))
+
+    # the shooting vectors divided by their lengths theta are
+    # (psi - cos(theta) * mu) / sin(theta), functions at distance 0 of
+    # the median are left out
+    def median_step(mu):
+        theta, c = _shooting(mu, psi, w)
+        ctil = zeros(n)
+        nz = c > 0
+        ctil[nz] = c[nz] / theta[nz]
+        vbar = (psi @ ctil - mu * (ctil @ cos(theta))) / (1 / theta[nz]).sum()
+        return vbar, theta, c
+
+    vbar, theta, c = median_step(psi_median)
+    vbar_norm[r] = geo.L2norm(vbar, w)
 
     # compute phase median by iterative algorithm
     while (vbar_norm[r] > 0.00000001) and (r<maxiter):
-        psi_median = geo.exp_map(psi_median, stp*vbar)
+        psi_median = geo.exp_map(psi_median, stp*vbar, w)
         r += 1
-        for k in range(0,n):
-            v[:,k], tmp = geo.inv_exp_map(psi_median,psi[:,k])
-            d[k] = arccos(geo.inner_product(psi_median,psi[:,k]))
-            vtil[:,k] = v[:,k]/d[k]
-            dtil[k] = 1/d[k]
-
-        vbar = vtil.sum(axis=1)*dtil.sum()**(-1)
-        vbar_norm[r] = geo.L2norm(vbar)
+        vbar, theta, c = median_step(psi_median)
+        vbar_norm[r] = geo.L2norm(vbar, w)
 
-    vec = v
+    vec, theta = geo.inv_exp_map(psi_median, psi, w)
     gam_median = cumtrapz(psi_median**2,time,initial=0.0)
 
     return gam_median, psi_median, psi, vec
@@ -487,44 +1060,42 @@ def cumtrapzmid(x, y, c, mid):
     return fa
 
 
-def rgam(N, sigma, num):
+def rgam(N, sigma, num, rng=None):
     """
     Generates random warping functions
 
+    All functions are drawn at once, the draws of the k-th function are the
+    k-th row of a (num,10) array of coefficients, so the result is the same
+    as drawing the functions one after the other.
+
     :param N: length of warping function
     :param sigma: variance of warping functions
     :param num: number of warping functions
+    :param rng: numpy.random.Generator (default = None, global numpy.random state)
     :return: gam: numpy ndarray of warping functions
 
     """
+    if rng is None:
+        rng = rn
     gam = zeros((N, num))
 
     TT = N - 1
     time = linspace(0, 1, TT)
-    mu = sqrt(ones(N - 1) * TT / double(N - 1))
+    mu = sqrt(ones(TT) * TT / double(N - 1))
     omega = (2 * pi) / double(TT)
-    for k in range(0, num):
-        alpha_i = rn.normal(scale=sqrt(sigma))
-        v = alpha_i * ones(TT)
-        cnt = 1
-        for l in range(2, 11):
-            alpha_i = rn.normal(scale=sqrt(sigma))
-            #odd
-            if l % 2 != 0:
-                v = v + alpha_i * sqrt(2) * cos(cnt * omega * time)
-                cnt += 1
-
-            #even
-            if l % 2 == 0:
-                v = v + alpha_i * sqrt(2) * cos(cnt * omega * time)
-        v = v.reshape((TT, 1))
-        mu = mu.reshape((TT, 1))
-        tmp = mu.dot(v.transpose())
-        v = v - tmp.dot(mu) / double(TT)
-        vn = norm(v) / sqrt(TT)
-        psi = cos(vn) * mu + sin(vn) * v / vn
-        gam[1:, k] = cumsum(psi * psi) / double(TT)
-        gam[:, k] = (gam[:, k] - gam[0, k]) / (gam[-1, k] - gam[0, k])
+
+    # constant and cosine basis with frequencies 1, 1, 2, 2, ..., 5
+    cnt = array([1] + [l // 2 for l in range(2, 11)])
+    B = sqrt(2) * cos(omega * time[:, newaxis] * cnt)
+    B[:, 0] = 1
+    alpha = rng.normal(scale=sqrt(sigma), size=(num, 10))
+    v = B.dot(alpha.T)
+
+    v = v - mu[:, newaxis] * (mu.dot(v) / double(TT))
+    vn = norm(v, axis=0) / sqrt(TT)
+    psi = cos(vn) * mu[:, newaxis] + sin(vn) * v / vn
+    gam[1:, :] = cumsum(psi * psi, axis=0) / double(TT)
+    gam = (gam - gam[0, :]) / (gam[-1, :] - gam[0, :])
 
     return gam
 
@@ -558,36 +1129,42 @@ def outlier_detection(q, time, mq, k=1.5):
     return q_outlier
 
 
-def randomGamma(gam, num):
+def randomGamma(gam, num, rng=None):
     """
     generates random warping functions
 
+    The functions are drawn at once from the first 5 principal directions
+    of the shooting vectors of gam, mapped to the sphere by a batched
+    exponential map at their Karcher mean.
+
+    Earlier versions returned M + 1 points: they scaled the shooting vector
+    by norm(v) / sqrt(M + 1) and integrated psi**2 with cumsum / (M + 1).
+    The functions now have the M points of gam, the exponential map uses the
+    trapezoidal norm of the shooting vector and psi**2 is integrated with
+    cumtrapz, so the samples for a given seed differ from those versions.
+
     :param gam: numpy ndarray of N x M of M of warping functions
     :param num: number of random functions
+    :param rng: numpy.random.Generator (default = None, global numpy.random state)
 
     :return: rgam: random warping functions
 
     """
+    if rng is None:
+        rng = rn
     mu, gam_mu, psi, vec = SqrtMean(gam)
     K = cov(vec)
 
     U, s, V = svd(K)
     n = 5
-    TT = vec.shape[0] + 1
-    vm = vec.mean(axis=1)
-
-    rgam = zeros((TT, num))
-    for k in range(0, num):
-        a = rn.standard_normal(n)
-        v = zeros(vm.size)
-        for i in range(0, n):
-            v = v + a[i] * sqrt(s[i]) * U[:, i]
-
-        vn = norm(v) / sqrt(TT)
-        psi = cos(vn) * mu + sin(vn) * v / vn
-        tmp = zeros(TT)
-        tmp[1:TT] = cumsum(psi * psi) / TT
-        rgam[:, k] = (tmp - tmp[0]) / (tmp[-1] - tmp[0])
+    TT = vec.shape[0]
+
+    a = rng.standard_normal((num, n))
+    v = U[:, 0:n].dot(sqrt(s[0:n])[:, newaxis] * a.T)
+
+    psi = geo.exp_map(mu, v, geo.quadrature_weights(TT))
+    tmp = cumtrapz(psi * psi, linspace(0, 1, TT), axis=0, initial=0)
+    rgam = (tmp - tmp[0, :]) / (tmp[-1, :] - tmp[0, :])
 
     return rgam
 
@@ -718,44 +1295,134 @@ def innerprod_q(time, q1, q2):
     return val
 
 
-def warp_q_gamma(time, q, gam):
+def update_moments(n, mu, m2, x):
+    """
+    updates the pointwise mean and sum of squared deviations of n functions
+    with the columns of x, so that the variance of a large set of functions
+    can be accumulated chunk by chunk (start with n = mu = m2 = 0)
+
+    :param n: number of functions seen so far
+    :param mu: vector of size M of their mean
+    :param m2: vector of size M of their sum of squared deviations
+    :param x: numpy ndarray of shape (M,K) of K new functions
+
+    :rtype: tuple
+    :return n: updated number of functions
+    :return mu: updated mean
+    :return m2: updated sum of squared deviations, the variance is m2/n
+
+    """
+    k = x.shape[1]
+    mx = x.mean(axis=1)
+    m2x = ((x - mx[:, None]) ** 2).sum(axis=1)
+    if n == 0:
+        return k, mx, m2x
+    delta = mx - mu
+    tot = n + k
+    mu = mu + delta * k / tot
+    m2 = m2 + m2x + delta ** 2 * n * k / tot
+    return tot, mu, m2
+
+
+def warp_q_gamma(time, q, gam, cores=1):
     """
     warps a srsf q by gam
 
     :param time vector describing time samples
-    :param q vector describing srsf
-    :param gam vector describing warping function
+    :param q vector describing srsf, or numpy ndarray of shape (M,N)
+    :param gam vector describing warping function, or numpy ndarray of shape (M,N)
+               of the warping functions of the columns of q
+    :param cores number of threads of the batch kernel (default = 1, -1 uses all)
 
     :rtype: numpy ndarray
     :return q_temp: warped srsf
 
     """
-    M = gam.size
-    gam_dev = gradient(gam, 1 / double(M - 1))
-    tmp = interp((time[-1] - time[0]) * gam + time[0], time, q)
+    M = gam.shape[0]
+    gam_dev = gradient(gam, 1 / double(M - 1), axis=0)
+    if gam.ndim > 1 or q.ndim > 1:
+        tmp = wb.approx(time, q, (time[-1] - time[0]) * gam + time[0], cores)
+    else:
+        tmp = interp((time[-1] - time[0]) * gam + time[0], time, q)
 
+    if gam.ndim == 1 and q.ndim > 1:
+        # one warping function shared by all columns of q
+        gam_dev = gam_dev[:, newaxis]
     q_temp = tmp * sqrt(gam_dev)
 
     return q_temp
 
-def warp_f_gamma(time, f, gam):
+def warp_f_gamma(time, f, gam, cores=1):
     """
     warps a function f by gam
 
     :param time vector describing time samples
-    :param q vector describing srsf
-    :param gam vector describing warping function
+    :param f vector describing function, or numpy ndarray of shape (M,N)
+    :param gam vector describing warping function, or numpy ndarray of shape (M,N)
+               of the warping functions of the columns of f
+    :param cores number of threads of the batch kernel (default = 1, -1 uses all)
 
     :rtype: numpy ndarray
     :return f_temp: warped srsf
 
     """
-    M = gam.size
+    if gam.ndim > 1 or f.ndim > 1:
+        return wb.approx(time, f, (time[-1] - time[0]) * gam + time[0], cores)
     f_temp = interp((time[-1] - time[0]) * gam + time[0], time, f)
 
     return f_temp
 
 
+def compose_gamma(gam1, gam2, cores=1):
+    """
+    composition of warping functions gam1(gam2) on [0,1]
+
+    :param gam1: vector or numpy ndarray of shape (M,N) of warping functions
+    :param gam2: vector or numpy ndarray of shape (M,N) of warping functions
+    :param cores: number of threads of the batch kernel (default = 1, -1 uses all)
+
+    :rtype: numpy ndarray
+    :return gam: warping functions gam1(gam2(t)), of shape (M,N) if either is
+    """
+    M = gam1.shape[0]
+    gam = wb.approx(linspace(0, 1, M), gam1, gam2, cores)
+    if gam1.ndim == 1 and gam2.ndim == 1:
+        gam = gam[:, 0]
+    return gam
+
+
+def interp_batch(x, xp, fp):
+    """
+    linear interpolation of every column, numpy.interp(x[:, k], xp, fp[:, k])
+    for all k at once. x or fp can also be a vector shared by all columns
+
+    :param x: vector of size M or numpy ndarray of shape (M,N) of evaluation points
+    :param xp: increasing vector of size P of sample points
+    :param fp: vector of size P or numpy ndarray of shape (P,N) of values
+
+    :rtype: numpy ndarray
+    :return f: numpy ndarray of shape (M,N) of interpolated values
+
+    """
+    P = xp.shape[0]
+    j = (searchsorted(xp, x, side='right') - 1).clip(0, P - 2)
+    if x.ndim == 2 and fp.ndim == 2:
+        f0 = take_along_axis(fp, j, axis=0)
+        f1 = take_along_axis(fp, j + 1, axis=0)
+    else:
+        f0 = fp[j]
+        f1 = fp[j + 1]
+    if x.ndim == 1 and fp.ndim == 2:
+        x = x[:, newaxis]
+        j = j[:, newaxis]
+    slope = (f1 - f0) / (xp[j + 1] - xp[j])
+    f = slope * (x - xp[j]) + f0
+    # constant extrapolation and exact end points, as numpy.interp
+    f = where(x <= xp[0], fp[0], f)
+    f = where(x >= xp[-1], fp[-1], f)
+    return f
+
+
 def f_K_fold(Nobs, K=5):
     """
     generates sample indices for K-fold cross validation
@@ -50,13 +50,15 @@ class build_ext_subclass( build_ext_with_blas ):
         compiler = self.compiler.compiler_type
         if compiler == 'msvc': # visual studio
             for e in self.extensions:
-                e.extra_compile_args += ['/O2']
+                e.extra_compile_args += ['/O2', '/openmp']
         else: # everything else that cares about following standards
             for e in self.extensions:
                 if platform.system() == 'Darwin':
+                    # Apple clang ships without OpenMP, batch kernels run serially
                     e.extra_compile_args += ['-stdlib=libc++']
                 else:
-                    e.extra_compile_args += ['-std=c++11']
+                    e.extra_compile_args += ['-std=c++11', '-fopenmp']
+                    e.extra_link_args += ['-fopenmp']
 
         build_ext_with_blas.build_extensions(self)
 
@@ -87,6 +89,11 @@ extensions = [
         include_dirs=[numpy.get_include()],
         language="c"
     ),
+    Extension(name="warp_batch",
+        sources=["src/warp_batch.pyx", "src/misc_funcs.c"],
+        include_dirs=[numpy.get_include()],
+        language="c"
+    ),
     Extension(name="optimum_reparam_N",
         sources=["src/optimum_reparam_N.pyx", "src/DP.c"],
         include_dirs=[numpy.get_include()],
@@ -1,5 +1,9 @@
 #include <math.h>
 #include <stdlib.h>
+#include "DP.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 // #define NNBRS	23
 
@@ -41,108 +45,303 @@ const int Nbrs[NNBRS][2] = {
 	{ 10,  3 }, { 10,  7 }, { 10,  9 }
 };
 
+// largest step in Nbrs along either axis
+#define MAXSTEP	10
+
+// number of columns of the cost table kept while sweeping, one more than
+// the largest column step in Nbrs
+#define NCOLS	(MAXSTEP+1)
+
+// Path entry of grid points that have no predecessor
+#define NOPATH	255
+
 int xycompare(const void *x1, const void *x2);
-double CostFn2(const double *q1L, const double *q2L, int k, int l, int i, int j, int n, int scl, double lam);
+double CostFn2(const double *q1L, const double *q2L, int n, const int *off, int len, double sqrtm);
 void thomas(double *x, const double *a, const double *b, double *c, int n);
-void spline(double *D, const double *y, int n);
+void spline(double *D, const double *y, int n, double *work);
 void lookupspline(double *t, int *k, double dist, double len, int n);
 double evalspline(double t, const double D[2], const double y[2]);
 
-void DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, double *yy) {
-	int i, j, k, l, n, M, N, Eidx, Fidx, Ftmp, Fmin, Num, *Path, *xy, x, y, cnt;
-	const int scl = 5;
-	double *q1L, *q2L, *D1, *D2, *tmp1, *tmp2, *E, Etmp, Emin, t, a, b, lam=0;
+#define SCL	5
+
+DPWorkspace *DP_workspace_alloc(int n, int N) {
+	DPWorkspace *ws = calloc(1, sizeof(DPWorkspace));
+
+	if (ws != NULL && DP_workspace_reserve(ws, n, N) != 0) {
+		DP_workspace_free(ws);
+		ws = NULL;
+	}
+
+	return ws;
+}
+
+int DP_workspace_reserve(DPWorkspace *ws, int n, int N) {
+	size_t M = (size_t)SCL*(N-1)+1;
+	void *p;
+
+	// buffers only ever grow, so a workspace sized for the largest problem
+	// can be reused for any smaller one
+	if ((size_t)n*M > ws->nL) {
+		if ((p = realloc(ws->q1L, (size_t)n*M*sizeof(double))) == NULL) return -1;
+		ws->q1L = p;
+		if ((p = realloc(ws->q2L, (size_t)n*M*sizeof(double))) == NULL) return -1;
+		ws->q2L = p;
+		ws->nL = (size_t)n*M;
+	}
+
+	if ((size_t)N > ws->nN) {
+		if ((p = realloc(ws->D, 7*(size_t)N*sizeof(double))) == NULL) return -1;
+		ws->D = p;
+		if ((p = realloc(ws->E, NCOLS*(size_t)N*sizeof(double))) == NULL) return -1;
+		ws->E = p;
+		if ((p = realloc(ws->xy, 2*(size_t)N*sizeof(int))) == NULL) return -1;
+		ws->xy = p;
+		ws->nN = N;
+	}
+
+	return 0;
+}
+
+// the backpointers depend on the search corridor, DP_ws() reserves them
+// on first use
+int DP_workspace_reserve_path(DPWorkspace *ws, size_t size) {
+	void *p;
+
+	if (size > ws->nP) {
+		if ((p = realloc(ws->Path, size*sizeof(unsigned char))) == NULL) return -1;
+		ws->Path = p;
+		ws->nP = size;
+	}
+
+	return 0;
+}
+
+void DP_workspace_free(DPWorkspace *ws) {
+	if (ws == NULL)
+		return;
+
+	free(ws->q1L);
+	free(ws->q2L);
+	free(ws->D);
+	free(ws->E);
+	free(ws->Path);
+	free(ws->xy);
+	free(ws);
+}
+
+// returns DP_ENOMEM if the buffers could not be allocated, 0 otherwise
+int DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, double *yy) {
+	DPWorkspace *ws = DP_workspace_alloc(*n1, *N1);
+	int e;
+
+	if (ws == NULL)
+		return DP_ENOMEM;
+
+	e = DP_ws(q1, q2, *n1, *N1, *lam1, NULL, NULL, ws, yy);
 
-	n = *n1;
-	N = *N1;
-	lam = *lam1;
+	DP_workspace_free(ws);
 
-	M = scl*(N-1)+1;
+	return (e == DP_ENOMEM) ? e : 0;
+}
+
+// lo and hi restrict the search to the grid points (i,j) with
+// lo[j] <= i <= hi[j], where i indexes q1 and j indexes q2; both NULL
+// searches the full grid. The bounds must be nondecreasing in j and contain
+// (0,0) and (N-1,N-1). Returns 1 if the optimal path touches a corridor edge
+// that is not an edge of the full grid, DP_ENOMEM if the buffers could not
+// be allocated and 0 otherwise.
+int DP_ws(double *q1, double *q2, int n, int N, double lam, const int *lo, const int *hi,
+           DPWorkspace *ws, double *yy) {
+	if (DP_workspace_reserve(ws, n, N) != 0)
+		return DP_ENOMEM;
+
+	DP_interp(q1, n, N, ws->D, ws->q1L);
+	DP_interp(q2, n, N, ws->D, ws->q2L);
+
+	return DP_solve(ws->q1L, ws->q2L, n, N, lam, lo, hi, -1, ws, yy);
+}
 
-	q1L = malloc(n*M*sizeof(double));
-	q2L = malloc(n*M*sizeof(double));
+// spline interpolates the n-dimensional function q (N samples) onto the fine
+// grid of SCL*(N-1)+1 points used by the DP. work holds 5*N doubles.
+void DP_interp(const double *q, int n, int N, double *work, double *qL) {
+	int i, j, k, M;
+	double *D, *tmp, t;
 
-	D1 = malloc(4*N*sizeof(double));
-	tmp1 = D1 + N;
-	D2 = D1 + 2*N;
-	tmp2 = D2 + N;
+	M = SCL*(N-1)+1;
+	D = work;
+	tmp = work + N;
 
 	for (i = 0; i < n; ++i) {
 
-		for (j = 0; j < N; ++j) {
-			tmp1[j] = q1[n*j + i];
-			tmp2[j] = q2[n*j + i];
-		}
+		for (j = 0; j < N; ++j)
+			tmp[j] = q[n*j + i];
 
-		spline(D1, tmp1, N);
-		spline(D2, tmp2, N);
+		spline(D, tmp, N, work + 2*N);
 
 		// for each point in fine discretization
 		for (j = 0; j < M; ++j) {
 			lookupspline(&t, &k, j/(M-1.0), 1, N);
-			q1L[n*j + i] = evalspline(t, D1+k, tmp1+k);
-			q2L[n*j + i] = evalspline(t, D2+k, tmp2+k);
+			qL[n*j + i] = evalspline(t, D+k, tmp+k);
 		}
 	}
+}
 
-	free(D1);
+// the DP of DP_ws() on fine grid interpolants q1L and q2L from DP_interp().
+// If abandon >= 0 the DP stops as soon as every remaining path costs more
+// than abandon times the number of fine grid points per sample, i.e. about
+// abandon in terms of the sum of squares of the samples of the normalized
+// SRSFs; yy is then set to NaN and -1 is returned. DP_ENOMEM is returned if
+// the backpointers could not be allocated.
+int DP_solve(const double *q1L, const double *q2L, int n, int N, double lam, const int *lo,
+             const int *hi, double abandon, DPWorkspace *ws, double *yy) {
+	int i, j, k, l, Eidx, Fidx, Ftmp, Fmin, Num, *xy, x, y, cnt, ilo, ihi, stride, edge, s;
+	const int scl = SCL;
+	double *E, *Ej, Etmp, Emin, a, b;
+	unsigned char *Path, idx;
+	// per neighbor constants of the edge cost: square root of the slope,
+	// number of fine grid points along the step and the offsets of the
+	// nearest fine grid points on the q2 axis
+	double sqrtm[NNBRS];
+	int len[NNBRS], off[NNBRS][MAXSTEP*SCL+1];
+	// costs and corridor of the columns j-1, ..., j-MAXSTEP
+	double *El[MAXSTEP+1];
+	int klo[MAXSTEP+1], khi[MAXSTEP+1];
+	// smallest cost in each of the last NCOLS columns, every path has a
+	// grid point in any MAXSTEP consecutive columns
+	double Ecmin[NCOLS], Elb;
+
+	for (Num = 0; Num < NNBRS; ++Num) {
+		sqrtm[Num] = sqrt(Nbrs[Num][1]/(double)Nbrs[Num][0]);
+		len[Num] = Nbrs[Num][0]*scl + 1;
+		for (s = 0; s < len[Num]; ++s)
+			off[Num][s] = (2*s*Nbrs[Num][1] + Nbrs[Num][0]) / (2*Nbrs[Num][0]);
+	}
 
-	E = calloc(N*N, sizeof(double));
-	Path = malloc(2*N*N*sizeof(int));
+	// Path keeps stride entries per column, starting at row lo[j]
+	stride = N;
+	if (lo != NULL) {
+		stride = 1;
+		for (j = 0; j < N; ++j) {
+			if (hi[j] - lo[j] + 1 > stride)
+				stride = hi[j] - lo[j] + 1;
+		}
+	}
 
-	for (i = 0; i < N; ++i) {
-		E[N*i + 0] = 50000000000;
-		E[N*0 + i] = 50000000000;
-		Path[N*(N*0 + i) + 0] = -1;
-		Path[N*(N*0 + 0) + i] = -1;
-		Path[N*(N*1 + i) + 0] = -1;
-		Path[N*(N*1 + 0) + i] = -1;
+	if (DP_workspace_reserve_path(ws, (size_t)stride*N) != 0)
+		return DP_ENOMEM;
+
+	// E holds the costs of the last NCOLS columns only, column j lives in
+	// E + N*(j % NCOLS). Path stores for every grid point of the corridor the
+	// index into Nbrs of the step that reached it, one byte per point, at
+	// Path[(size_t)stride*j + i - lo[j]].
+	E = ws->E;
+	Path = ws->Path;
+
+	ihi = (hi != NULL) ? hi[0] : N-1;
+	for (i = 0; i <= ihi; ++i) {
+		E[i] = 50000000000;
+		Path[i] = NOPATH;
 	}
-	E[N*0 + 0] = 0;
+	E[0] = 0;
+	Ecmin[0] = 0;
 
 	for (j = 1; j < N; ++j) {
-		for (i = 1; i < N; ++i) {
+		Ej = E + N*(j % NCOLS);
+
+		for (l = 1; l <= MAXSTEP; ++l) {
+			if (j-l >= 0) {
+				El[l] = E + N*((j-l) % NCOLS);
+				klo[l] = (lo != NULL) ? lo[j-l] : 0;
+				khi[l] = (hi != NULL) ? hi[j-l] : N-1;
+			}
+			else {
+				El[l] = E;
+				klo[l] = N;
+				khi[l] = -1;
+			}
+		}
+
+		ilo = (lo != NULL) ? lo[j] : 0;
+		ihi = (hi != NULL) ? hi[j] : N-1;
+
+		if (ilo == 0) {
+			Ej[0] = 50000000000;
+			Path[(size_t)stride*j] = NOPATH;
+			ilo = 1;
+		}
+
+		for (i = ilo; i <= ihi; ++i) {
 
 			Emin = 100000;
-			Eidx = 0;
+			Eidx = -1;
 
 			for (Num = 0; Num < NNBRS; ++Num) {
 				k = i - Nbrs[Num][0];
-				l = j - Nbrs[Num][1];
+				l = Nbrs[Num][1];
 
-				if (k >= 0 && l >= 0) {
-					Etmp = E[N*l + k] + CostFn2(q1L,q2L,k,l,i,j,n,scl,lam);
-					if (Num == 0 || Etmp < Emin) {
+				if (k >= klo[l] && k <= khi[l]) {
+					Etmp = El[l][k] + CostFn2(q1L + (size_t)n*k*scl, q2L + (size_t)n*(j-l)*scl,
+					                          n, off[Num], len[Num], sqrtm[Num]);
+					if (Eidx < 0 || Etmp < Emin) {
 						Emin = Etmp;
 						Eidx = Num;
 					}
 				}
 			}
 
-			E[N*j + i] = Emin;
-			Path[N*(N*0 + j) + i] = i - Nbrs[Eidx][0];
-			Path[N*(N*1 + j) + i] = j - Nbrs[Eidx][1];
+			if (Eidx < 0) {
+				Ej[i] = 50000000000;
+				Path[(size_t)stride*j + i - ((lo != NULL) ? lo[j] : 0)] = NOPATH;
+			}
+			else {
+				Ej[i] = Emin;
+				Path[(size_t)stride*j + i - ((lo != NULL) ? lo[j] : 0)] = (unsigned char)Eidx;
+			}
 		}
-	}
 
-	free(E);
-	free(q2L);
+		if (abandon >= 0) {
+			Etmp = 50000000000;
+			for (i = (lo != NULL) ? lo[j] : 0; i <= ihi; ++i) {
+				if (Ej[i] < Etmp)
+					Etmp = Ej[i];
+			}
+			Ecmin[j % NCOLS] = Etmp;
 
-	xy = malloc(2*N*sizeof(int));
+			Elb = Etmp;
+			for (l = 1; l < MAXSTEP && l <= j; ++l) {
+				if (Ecmin[(j-l) % NCOLS] < Elb)
+					Elb = Ecmin[(j-l) % NCOLS];
+			}
+
+			if (Elb > abandon*scl) {
+				for (i = 0; i < N; ++i)
+					yy[i] = NAN;
+				return -1;
+			}
+		}
+	}
+
+	xy = ws->xy;
 	xy[2*0 + 0] = N-1;
 	xy[2*0 + 1] = N-1;
 
 	cnt = 1;
+	edge = 0;
 	while (x = xy[2*(cnt-1) + 0], x > 0) {
 		y = xy[2*(cnt-1) + 1];
 
-		xy[2*cnt + 1] = Path[N*(N*0 + x) + y];
-		xy[2*cnt + 0] = Path[N*(N*1 + x) + y];
+		if (lo != NULL && ((y == lo[x] && y > 0) || (y == hi[x] && y < N-1)))
+			edge = 1;
+
+		idx = Path[(size_t)stride*x + y - ((lo != NULL) ? lo[x] : 0)];
+		if (idx == NOPATH)
+			break;
+
+		xy[2*cnt + 1] = y - Nbrs[idx][0];
+		xy[2*cnt + 0] = x - Nbrs[idx][1];
 		++cnt;
 	}
 
-	free(Path);
-
 	qsort(xy, cnt, 2*sizeof(int), xycompare);
 
 	for (i = 0; i < N; ++i) {
@@ -181,24 +380,127 @@ void DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, doubl
 		yy[i] = (yy[i]-yy[0])/(N-1);
 	}
 
-	free(xy);
+	return edge;
+}
+
+// align nfun functions stored contiguously in Q1 (n*N doubles each) to the
+// functions in Q2, where consecutive templates are q2inc doubles apart
+// (q2inc = 0 aligns every function to the same template, whose fine grid
+// interpolant is then computed once and shared by all threads). Each
+// function is handled by DP_ws() independently, spread over nthreads OpenMP threads
+// (nthreads < 1 uses all available threads). Thread t works in ws[t]; when
+// ws is NULL every thread allocates its own workspace for the duration of
+// the call. yy holds N values per function. lo and hi restrict the
+// alignments to a corridor as in DP_ws(), function k uses lo + k*binc and
+// hi + k*binc (binc = 0 shares one corridor). If abandon is not NULL, the
+// DP of function k is abandoned as in DP_solve() with threshold abandon[k].
+// If edge is not NULL, edge[k] is set to the return value of DP_solve() for
+// function k, which is DP_ENOMEM if its buffers could not be allocated.
+// Returns DP_ENOMEM if any function failed that way, 0 otherwise.
+int DP_batch(double *Q1, double *Q2, int q2inc, int n, int N, int nfun, double lam,
+             const int *lo, const int *hi, int binc, const double *abandon, int nthreads,
+             DPWorkspace **ws, double *yy, int *edge) {
+	double *q2L = NULL, *work;
+	int err = 0;
+
+	if (nthreads < 1)
+		nthreads = DP_max_threads();
+
+	if (q2inc == 0) {
+		q2L = malloc((size_t)n*(SCL*(N-1)+1)*sizeof(double));
+		work = malloc(5*(size_t)N*sizeof(double));
+		if (q2L != NULL && work != NULL)
+			DP_interp(Q2, n, N, work, q2L);
+		else {
+			free(q2L);
+			q2L = NULL;
+		}
+		free(work);
+	}
+
+#ifdef _OPENMP
+#pragma omp parallel num_threads(nthreads)
+#endif
+	{
+		int k, e, tid = 0;
+		DPWorkspace *tws;
+
+#ifdef _OPENMP
+		tid = omp_get_thread_num();
+#endif
+		tws = (ws != NULL) ? ws[tid] : DP_workspace_alloc(n, N);
+
+#ifdef _OPENMP
+#pragma omp for schedule(dynamic)
+#endif
+		for (k = 0; k < nfun; ++k) {
+			const int *klo = (lo != NULL) ? lo + (size_t)k*binc : NULL;
+			const int *khi = (hi != NULL) ? hi + (size_t)k*binc : NULL;
+			double kab = (abandon != NULL) ? abandon[k] : -1;
+
+			if (tws == NULL || DP_workspace_reserve(tws, n, N) != 0)
+				e = DP_ENOMEM;
+			else {
+				DP_interp(Q1 + (size_t)k*n*N, n, N, tws->D, tws->q1L);
+				if (q2L != NULL)
+					e = DP_solve(tws->q1L, q2L, n, N, lam, klo, khi, kab, tws, yy + (size_t)k*N);
+				else {
+					DP_interp(Q2 + (size_t)k*q2inc, n, N, tws->D, tws->q2L);
+					e = DP_solve(tws->q1L, tws->q2L, n, N, lam, klo, khi, kab, tws, yy + (size_t)k*N);
+				}
+			}
+			// critical rather than atomic write, which needs OpenMP 3.1
+			// while MSVC only supports OpenMP 2.0
+			if (e == DP_ENOMEM) {
+#ifdef _OPENMP
+#pragma omp critical
+#endif
+				err = DP_ENOMEM;
+			}
+			if (edge != NULL)
+				edge[k] = e;
+		}
+
+		if (ws == NULL)
+			DP_workspace_free(tws);
+	}
+
+	free(q2L);
+
+	return err;
+}
+
+int DP_max_threads(void) {
+#ifdef _OPENMP
+	return omp_get_max_threads();
+#else
+	return 1;
+#endif
 }
 
 int xycompare(const void *x1, const void *x2) {
 	return (*(int *)x1 > *(int *)x2) - (*(int *)x1 < *(int *)x2);
 }
 
-double CostFn2(const double *q1L, const double *q2L, int k, int l, int i, int j, int n, int scl, double lam) {
-	double m = (j-l)/(double)(i-k), sqrtm = sqrt(m), E = 0, y, tmp, ip, fp;
-	int x, idx, d, iL=i*scl, kL=k*scl, lL=l*scl;
-
-	for (x = kL; x <= iL; ++x) {
-		y = (x-kL)*m + lL;
-		fp = modf(y, &ip);
-		idx = (int)(ip + (fp >= 0.5));
+// cost of the step from grid point (k,l) to (i,j), where q1L and q2L point
+// to fine grid point k*scl of q1 and l*scl of q2. The step covers len fine
+// grid points of q1, the s-th of which is matched to fine grid point off[s]
+// of q2 (rounded to nearest, ties up), sqrtm is the square root of its slope.
+double CostFn2(const double *q1L, const double *q2L, int n, const int *off, int len, double sqrtm) {
+	double E = 0, tmp;
+	int s, d;
+
+	if (n == 1) {
+		for (s = 0; s < len; ++s) {
+			tmp = q1L[s] - sqrtm*q2L[off[s]];
+			E += tmp*tmp;
+		}
+		return E;
+	}
 
+	for (s = 0; s < len; ++s) {
 		for (d = 0; d < n; ++d) {
-			tmp = q1L[n*x + d] - sqrtm*q2L[n*idx + d];
+			tmp = q1L[n*s + d] - sqrtm*q2L[n*off[s] + d];
 			E += tmp*tmp;
 		}
 	}
@@ -226,11 +528,12 @@ void thomas(double *x, const double *a, const double *b, double *c, int n) {
 
 // input:  y is array to interpolate, n is array length
 // output: D will be array of spline data
-void spline(double *D, const double *y, int n) {
+// work is scratch space for 3*n doubles
+void spline(double *D, const double *y, int n, double *work) {
 	int i;
 	double *a, *b, *c;
 
-	a = malloc(3*n*sizeof(double));
+	a = work;
 	b = a + n;
 	c = b + n;
 
@@ -265,8 +568,6 @@ void spline(double *D, const double *y, int n) {
 	}
 
 	thomas(D, a, b, c, n);
-
-	free(a);
 }
 
 void lookupspline(double *t, int *k, double dist, double len, int n) {
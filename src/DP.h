@@ -1 +1,37 @@
-void DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, double *yy);
+#include <stddef.h>
+
+/* Buffers used by one DP alignment, reusable across calls.
+ *
+ * For N samples the workspace needs about N*N bytes for the backpointers
+ * plus O(N) doubles, e.g. 100 MB for N = 10,000 and 400 MB for N = 20,000.
+ * Run time still grows as N*N, which is the practical limit beyond a few
+ * thousand samples. Restricting the search to a corridor of width w around
+ * a path (lo/hi in DP_ws) needs N*w bytes and O(N*w) time instead. */
+/* status of DP(), DP_ws(), DP_solve() and of the functions of DP_batch()
+ * when a buffer could not be allocated */
+#define DP_ENOMEM	(-2)
+
+typedef struct {
+	double *q1L, *q2L; /* fine grid spline interpolants of q1 and q2 */
+	double *D; /* spline coefficients and scratch */
+	double *E; /* cost of best path to the grid points of the last columns */
+	unsigned char *Path; /* index of the neighbor step reaching each grid point */
+	int *xy; /* optimal path */
+	size_t nL, nN, nP; /* allocated sizes */
+} DPWorkspace;
+
+DPWorkspace *DP_workspace_alloc(int n, int N);
+int DP_workspace_reserve(DPWorkspace *ws, int n, int N);
+int DP_workspace_reserve_path(DPWorkspace *ws, size_t size);
+void DP_workspace_free(DPWorkspace *ws);
+int DP_max_threads(void);
+
+int DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, double *yy);
+int DP_ws(double *q1, double *q2, int n, int N, double lam, const int *lo, const int *hi,
+          DPWorkspace *ws, double *yy);
+void DP_interp(const double *q, int n, int N, double *work, double *qL);
+int DP_solve(const double *q1L, const double *q2L, int n, int N, double lam, const int *lo,
+             const int *hi, double abandon, DPWorkspace *ws, double *yy);
+int DP_batch(double *Q1, double *Q2, int q2inc, int n, int N, int nfun, double lam,
+             const int *lo, const int *hi, int binc, const double *abandon, int nthreads,
+             DPWorkspace **ws, double *yy, int *edge);
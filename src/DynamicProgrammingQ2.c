@@ -2,6 +2,9 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include "dp_grid.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 void DynamicProgrammingQ2(double *Q1, double *T1, double *Q2, double *T2, int m1, int n1, int n2,
 double *tv1, double *tv2, int n1v, int n2v, double *G, double *T, double *size, double lam1){
@@ -29,3 +32,96 @@ double *tv1, double *tv2, int n1v, int n2v, double *G, double *T, double *size,
   // free allocated memory
   free(idxv1); free(idxv2); free(E); free(P);
 }
+
+/* Piecewise linear interpolation of (x,y)[0..n-1] at xout[0..nout-1], with
+ * the end values outside of [x[0],x[n-1]] as numpy.interp */
+static void interp_gamma(double *x, double *y, int n, double *xout, int nout, double *yout){
+  int i, j = 0;
+
+  for (i=0; i<nout; i++){
+    if (xout[i] <= x[0]) {
+      yout[i] = y[0];
+      continue;
+    }
+    if (xout[i] >= x[n-1]) {
+      yout[i] = y[n-1];
+      continue;
+    }
+    /* the query points are increasing */
+    while (j < n-2 && xout[i] >= x[j+1]) ++j;
+    yout[i] = y[j] + (y[j+1]-y[j])*((xout[i]-x[j])/(x[j+1]-x[j]));
+  }
+}
+
+/* Aligns nfun functions with the DP of DynamicProgrammingQ2() on the grid
+ * tv1 x tv2, spread over nthreads OpenMP threads (nthreads < 1 uses all
+ * available threads). Function k is Q1 + k*q1inc against Q2 + k*q2inc
+ * (an increment of 0 shares the function). The path of function k is
+ * resampled at the nt increasing points time and normalized to [0,1] into
+ * gam + k*nt. Returns -1 if a buffer could not be allocated, the functions
+ * of the threads concerned are then left unset, 0 otherwise. */
+int DynamicProgrammingQ2_batch(double *Q1, int q1inc, double *T1, double *Q2, int q2inc,
+double *T2, int m1, int n1, int n2, double *tv1, double *tv2, int n1v, int n2v,
+double *time, int nt, double *gam, int nfun, double lam1, int nthreads){
+  int *idxv1 = (int*)malloc((n1v)*sizeof(int));
+  int *idxv2 = (int*)malloc((n2v)*sizeof(int));
+  int ng = (n1v > n2v) ? n1v : n2v;
+  int err = 0;
+
+  if (idxv1 == NULL || idxv2 == NULL) {
+    free(idxv1); free(idxv2);
+    return -1;
+  }
+
+  dp_all_indexes( T1, n1, tv1, n1v, idxv1 );
+  dp_all_indexes( T2, n2, tv2, n2v, idxv2 );
+
+#ifdef _OPENMP
+  if (nthreads < 1)
+    nthreads = omp_get_max_threads();
+#pragma omp parallel num_threads(nthreads)
+#endif
+  {
+    int k, size;
+    size_t i;
+    double a, b, *gk;
+    double *E = (double*)malloc((size_t)(n1v)*(n2v)*sizeof(double));
+    int *P = (int*)malloc((size_t)(n1v)*(n2v)*sizeof(int));
+    double *G = (double*)malloc(ng*sizeof(double));
+    double *T = (double*)malloc(ng*sizeof(double));
+    int ok = E != NULL && P != NULL && G != NULL && T != NULL;
+
+    if (!ok) {
+#ifdef _OPENMP
+#pragma omp critical
+#endif
+      err = -1;
+    }
+
+#ifdef _OPENMP
+#pragma omp for schedule(dynamic)
+#endif
+    for (k=0; k<nfun; k++){
+      if (!ok)
+        continue;
+      for (i=0; i<(size_t)(n1v)*(n2v); i++)
+        P[i] = 0;
+      dp_costs( Q1 + (size_t)k*q1inc, T1, n1, Q2 + (size_t)k*q2inc, T2, n2,
+        m1, tv1, idxv1, n1v, tv2, idxv2, n2v, E, P, lam1 );
+      size = dp_build_gamma( P, tv1, n1v, tv2, n2v, G, T );
+
+      gk = gam + (size_t)k*nt;
+      interp_gamma( T, G, size, time, nt, gk );
+      a = gk[0];
+      b = gk[nt-1];
+      for (i=0; i<(size_t)nt; i++)
+        gk[i] = (gk[i]-a)/(b-a);
+    }
+
+    free(E); free(P); free(G); free(T);
+  }
+
+  free(idxv1); free(idxv2);
+
+  return err;
+}
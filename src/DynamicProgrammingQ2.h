@@ -1,2 +1,6 @@
 void DynamicProgrammingQ2(double *Q1, double *T1, double *Q2, double *T2, int m1, int n1, int n2,
-double *tv1, double *tv2, int n1v, int n2v, double *G, double *T, double *size, double lam1);
\ No newline at end of file
+double *tv1, double *tv2, int n1v, int n2v, double *G, double *T, double *size, double lam1);
+
+int DynamicProgrammingQ2_batch(double *Q1, int q1inc, double *T1, double *Q2, int q2inc,
+double *T2, int m1, int n1, int n2, double *tv1, double *tv2, int n1v, int n2v,
+double *time, int nt, double *gam, int nfun, double lam1, int nthreads);
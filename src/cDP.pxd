@@ -1,2 +1,14 @@
 cdef extern from "DP.h":
-    void DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, double *yy)
+    ctypedef struct DPWorkspace:
+        pass
+    DPWorkspace *DP_workspace_alloc(int n, int N)
+    int DP_workspace_reserve(DPWorkspace *ws, int n, int N) nogil
+    void DP_workspace_free(DPWorkspace *ws)
+    int DP_max_threads()
+    enum: DP_ENOMEM
+    int DP(double *q1, double *q2, int *n1, int *N1, double *lam1, int *Disp, double *yy)
+    int DP_ws(double *q1, double *q2, int n, int N, double lam, const int *lo, const int *hi,
+              DPWorkspace *ws, double *yy) nogil
+    int DP_batch(double *Q1, double *Q2, int q2inc, int n, int N, int nfun, double lam,
+                 const int *lo, const int *hi, int binc, const double *abandon, int nthreads,
+                 DPWorkspace **ws, double *yy, int *edge) nogil
@@ -0,0 +1,6 @@
+cdef extern from "misc_funcs.h":
+    void approx_batch(double *x, int xinc, double *y, int yinc, int nxy, double *xout,
+                      int xoutinc, int nout, double *yout, int nfun, int nthreads) nogil
+    void invertGamma_batch(int n, int nfun, double *gam, double *out, int nthreads) nogil
+    int group_action_by_gamma_batch(int n, int T, int nfun, double *q, double *gam,
+                                    double *qn, int nthreads) nogil
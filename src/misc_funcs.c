@@ -2,6 +2,9 @@
 #include <float.h>
 #include <stdio.h>
 #include <stdlib.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 /* Structure of Linear Interpolation */
 typedef struct {
@@ -446,11 +449,9 @@ void invertGamma(int n, double *gam, double *out) {
 	for (k=0; k<n; k++)
 		x[k] = (double)k/((double)(n-1));
 
+	// the result used to be divided by out[n] = 1, written one element
+	// past the output, the values are unchanged without that division
 	approx(gam, x, n, x, out, n, 1, 0, 1, 0);
-	out[n] = 1;
-
-	for (k=0; k<n; k++)
-		out[k] = out[k]/out[n];
 
 	free(x); free(y);
 	return;
@@ -685,3 +686,195 @@ void group_action_by_gamma(int *n1, int *T1, double *q, double *gam, double *qn)
 
     return;
 }
+
+
+/* number of threads of the batch functions, all available if nthreads < 1 */
+static int batch_threads(int nthreads) {
+#ifdef _OPENMP
+    if (nthreads < 1)
+        nthreads = omp_get_max_threads();
+#else
+    nthreads = 1;
+#endif
+    return nthreads;
+}
+
+
+/* Batched linear interpolation, function k interpolates (x + k*xinc, y + k*yinc)
+ * at the nout points xout + k*xoutinc into yout + k*nout, outside of the data
+ * the end values are used as in numpy.interp. An increment of 0 shares the
+ * array between all functions. */
+void approx_batch(double *x, int xinc, double *y, int yinc, int nxy, double *xout,
+                  int xoutinc, int nout, double *yout, int nfun, int nthreads) {
+    int k;
+
+    nthreads = batch_threads(nthreads);
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static) num_threads(nthreads)
+#endif
+    for (k=0; k<nfun; k++) {
+        double *yk = y + (size_t)k*yinc;
+        approx(x + (size_t)k*xinc, yk, nxy, xout + (size_t)k*xoutinc,
+               yout + (size_t)k*nout, nout, 1, yk[0], yk[nxy-1], 0);
+    }
+}
+
+
+/* Batched invertGamma of nfun warping functions of n samples stored
+ * contiguously, each inverse is rescaled to [0,1] as in the Python
+ * invertGamma */
+void invertGamma_batch(int n, int nfun, double *gam, double *out, int nthreads) {
+    int k;
+
+    nthreads = batch_threads(nthreads);
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static) num_threads(nthreads)
+#endif
+    for (k=0; k<nfun; k++) {
+        double *o = out + (size_t)k*n, a, b;
+        int j;
+
+        invertGamma(n, gam + (size_t)k*n, o);
+        a = o[0];
+        b = o[n-1];
+        for (j=0; j<n; j++)
+            o[j] = (o[j]-a)/(b-a);
+    }
+}
+
+
+/* Second derivatives m of the not-a-knot cubic spline through (x, y), n >= 4,
+ * the interpolant of scipy's InterpolatedUnivariateSpline with k = 3. The
+ * end values m[0] and m[n-1] are eliminated with the not-a-knot conditions,
+ * the remaining tridiagonal system is solved in place, work holds 4*n
+ * doubles. */
+static void spline_nak(int n, const double *x, const double *y, double *m, double *work) {
+    double *h = work, *a = work + n, *b = work + 2*n, *c = work + 3*n;
+    int i;
+
+    for (i=0; i<n-1; i++)
+        h[i] = x[i+1] - x[i];
+
+    for (i=1; i<n-1; i++) {
+        a[i] = h[i-1];
+        b[i] = 2*(h[i-1] + h[i]);
+        c[i] = h[i];
+        m[i] = 6*((y[i+1]-y[i])/h[i] - (y[i]-y[i-1])/h[i-1]);
+    }
+    b[1] += h[0]*(h[0]+h[1])/h[1];
+    c[1] -= h[0]*h[0]/h[1];
+    b[n-2] += h[n-2]*(h[n-3]+h[n-2])/h[n-3];
+    a[n-2] -= h[n-2]*h[n-2]/h[n-3];
+
+    for (i=2; i<n-1; i++) {
+        double w = a[i]/b[i-1];
+        b[i] -= w*c[i-1];
+        m[i] -= w*m[i-1];
+    }
+    m[n-2] /= b[n-2];
+    for (i=n-3; i>=1; i--)
+        m[i] = (m[i] - c[i]*m[i+1])/b[i];
+
+    m[0] = ((h[0]+h[1])*m[1] - h[0]*m[2])/h[1];
+    m[n-1] = ((h[n-3]+h[n-2])*m[n-2] - h[n-2]*m[n-3])/h[n-3];
+}
+
+
+/* evaluates the cubic spline through (x, y) with second derivatives m at the
+ * nu points u, beyond the data the end pieces are extended */
+static void spline_nak_eval(int n, const double *x, const double *y, const double *m,
+                            int nu, const double *u, double *v) {
+    int i, j, lo, hi, mid;
+    double h, s, t;
+
+    for (j=0; j<nu; j++) {
+        lo = 0;
+        hi = n-2;
+        while (lo < hi) {
+            mid = (lo + hi + 1)/2;
+            if (x[mid] <= u[j])
+                lo = mid;
+            else
+                hi = mid - 1;
+        }
+        i = lo;
+        h = x[i+1] - x[i];
+        s = x[i+1] - u[j];
+        t = u[j] - x[i];
+        v[j] = (m[i]*s*s*s + m[i+1]*t*t*t)/(6*h) + (y[i]/h - m[i]*h/6)*s
+               + (y[i+1]/h - m[i+1]*h/6)*t;
+    }
+}
+
+
+/* group_action_by_gamma with the not-a-knot spline of the Python
+ * curve_functions.group_action_by_gamma and the norm over all n coordinates,
+ * work holds 9*T doubles */
+static void group_action_nak(int n, int T, const double *q, const double *gam, double *qn,
+                             double *work) {
+    double *ti = work, *gammadot = work + T, *tmp = work + 2*T, *tmp1 = work + 3*T;
+    double *m = work + 4*T, val = 0.0;
+    int j, k;
+
+    linspace(0, 1, T, ti);
+    gammadot[0] = (gam[1] - gam[0])*T;
+    gammadot[T-1] = (gam[T-1] - gam[T-2])*T;
+    for (j=1; j<T-1; j++)
+        gammadot[j] = (gam[j+1] - gam[j-1])*T/2.0;
+
+    for (k=0; k<n; k++) {
+        for (j=0; j<T; j++)
+            tmp[j] = q[n*j+k];
+        spline_nak(T, ti, tmp, m, work + 5*T);
+        spline_nak_eval(T, ti, tmp, m, T, gam, tmp1);
+        for (j=0; j<T; j++)
+            qn[n*j+k] = tmp1[j]*sqrt(gammadot[j]);
+    }
+
+    for (k=0; k<T*n; k++)
+        val += qn[k]*qn[k];
+    val = val/T;
+
+    for (k=0; k<T*n; k++)
+        qn[k] = qn[k]/sqrt(val);
+}
+
+
+/* Batched reparameterization of nfun srvfs of n coordinates and T >= 4
+ * samples, srvf k starts at q + k*n*T and is warped by gam + k*T. Unlike
+ * group_action_by_gamma, which the C gradients use, it interpolates with
+ * the not-a-knot spline and normalizes over all n coordinates, as the
+ * Python curve_functions.group_action_by_gamma. Returns -1 if the work
+ * buffers could not be allocated, 0 otherwise. */
+int group_action_by_gamma_batch(int n, int T, int nfun, double *q, double *gam,
+                                double *qn, int nthreads) {
+    int err = 0;
+
+    nthreads = batch_threads(nthreads);
+#ifdef _OPENMP
+#pragma omp parallel num_threads(nthreads)
+#endif
+    {
+        int k;
+        double *work = malloc(9*(size_t)T*sizeof(double));
+
+#ifdef _OPENMP
+#pragma omp for schedule(static)
+#endif
+        for (k=0; k<nfun; k++) {
+            if (work == NULL)
+                continue;
+            group_action_nak(n, T, q + (size_t)k*n*T, gam + (size_t)k*T,
+                             qn + (size_t)k*n*T, work);
+        }
+        if (work == NULL) {
+#ifdef _OPENMP
+#pragma omp critical
+#endif
+            err = -1;
+        }
+        free(work);
+    }
+
+    return err;
+}
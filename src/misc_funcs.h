@@ -51,3 +51,14 @@ void linspace(double min, double max, int n, double *result);
 
 /* reparameterize srvf q by gamma */
 void group_action_by_gamma(int *n1, int *T1, double *q, double *gam, double *qn);
+
+/* Batched linear interpolation of nfun functions, numpy.interp style ends */
+void approx_batch(double *x, int xinc, double *y, int yinc, int nxy, double *xout,
+                  int xoutinc, int nout, double *yout, int nfun, int nthreads);
+
+/* Batched invertGamma */
+void invertGamma_batch(int n, int nfun, double *gam, double *out, int nthreads);
+
+/* Batched reparameterization of srvfs with the not-a-knot spline */
+int group_action_by_gamma_batch(int n, int T, int nfun, double *q, double *gam,
+                                double *qn, int nthreads);
@@ -5,101 +5,96 @@ from numpy.linalg import norm
 cimport numpy as np
 from cpython cimport array
 
+def _grid(tv, time):
+    # DP grid on the scale of time, defaults to the sample points
+    if tv is None:
+        return time
+    tv = np.array(tv, dtype=np.double)
+    if (not np.allclose(tv[[0, -1]], time[[0, -1]])) or (np.diff(tv) <= 0).any():
+        raise Exception('tv1 and tv2 must be increasing and span time')
+    tv[0], tv[-1] = time[0], time[-1]
+    return tv
+
+
+def _dp2_batch(np.ndarray[double, ndim=2, mode="c"] q1, int q1inc, np.ndarray[double, ndim=2, mode="c"] q2,
+               int q2inc, np.ndarray[double, ndim=1, mode="c"] time, int nfun, double lam, tv1, tv2,
+               int nthreads):
+    cdef int M = time.shape[0]
+    cdef np.ndarray[double, ndim=1, mode="c"] tv1i = _grid(tv1, time)
+    cdef np.ndarray[double, ndim=1, mode="c"] tv2i = _grid(tv2, time)
+    cdef int n1v = tv1i.shape[0]
+    cdef int n2v = tv2i.shape[0]
+    cdef np.ndarray[double, ndim=2, mode="c"] gam = np.zeros((nfun, M))
+    cdef int err
+
+    with nogil:
+        err = cDPQ.DynamicProgrammingQ2_batch(&q1[0, 0], q1inc, &time[0], &q2[0, 0], q2inc, &time[0], 1, M, M,
+                                              &tv1i[0], &tv2i[0], n1v, n2v, &time[0], M, &gam[0, 0], nfun,
+                                              lam, nthreads)
+    if err != 0:
+        raise MemoryError()
+
+    return np.ascontiguousarray(gam.T)
+
+
 def coptimum_reparamN(np.ndarray[double, ndim=1, mode="c"] mq, np.ndarray[double, ndim=1, mode="c"] time,
-                      np.ndarray[double, ndim=2, mode="c"] q, lam1=0.0):
+                      np.ndarray[double, ndim=2, mode="c"] q, lam1=0.0, tv1=None, tv2=None, nthreads=1):
     """
     cython interface calculates the warping to align a set of srfs q to a single srsf mq
 
+    The columns are aligned in one native call without the GIL, spread over
+    nthreads threads, and the optimal paths are resampled at time in C. The
+    DP searches the grid tv1 x tv2, a coarser grid trades accuracy for speed
+    as the cost grows with the product of their sizes.
+
     :param mq: vector of size N samples of first SRSF
     :param time: vector of size N describing the sample points
     :param q: numpy ndarray of shape (M,N) of N srsfs with M samples
     :param lam1: controls the amount of elasticity (default = 0.0)
+    :param tv1: increasing grid of the DP on the time scale of mq, from
+                time[0] to time[-1] (default = None, time)
+    :param tv2: increasing grid of the DP on the time scale of q (default = None, time)
+    :param nthreads: number of threads (default = 1, -1 uses all)
 
     :rtype numpy ndarray
     :return gam: describing the warping functions used to align columns of q with mq
 
     """
-    cdef int M, N, n1
-    cdef double lam
-    mq = mq / norm(mq)
+    cdef int M, N
     M, N = q.shape[0], q.shape[1]
-    n1 = 1
-    lam = lam1
-    cdef np.ndarray[double, ndim=1, mode="c"] G = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] T = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] qi = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] size = np.zeros(1)
-
-    gam = np.zeros((M, N))
-    sizes = np.zeros(N, dtype=np.int32)
-    Go = np.zeros((M, N))
-    To = np.zeros((M, N))
-    for k in xrange(0, N):
-        qi = q[:, k] / norm(q[:, k])
-        qi = np.ascontiguousarray(qi)
-
-        cDPQ.DynamicProgrammingQ2(&mq[0], &time[0], &qi[0], &time[0], n1, M, M, &time[0], &time[0], M, M, &G[0],
-                                  &T[0], &size[0], lam)
-        sizes[k] = np.int32(size)
-        Go[:, k] = G
-        To[:, k] = T
+    cdef np.ndarray[double, ndim=2, mode="c"] mqi = np.ascontiguousarray((mq / norm(mq))[np.newaxis, :])
+    cdef np.ndarray[double, ndim=2, mode="c"] qi = np.ascontiguousarray((q / norm(q, axis=0)).T)
 
-    for k in xrange(0, N):
-        gam0 = np.interp(time, To[0:sizes[k], k], Go[0:sizes[k], k])
-        gam[:, k] = (gam0 - gam0[0]) / (gam0[-1] - gam0[0])
-
-    return gam
+    return _dp2_batch(mqi, 0, qi, M, time, N, lam1, tv1, tv2, nthreads)
 
 def coptimum_reparamN2(np.ndarray[double, ndim=2, mode="c"] q1, np.ndarray[double, ndim=1, mode="c"] time,
-                       np.ndarray[double, ndim=2, mode="c"] q2, lam1=0.0):
+                       np.ndarray[double, ndim=2, mode="c"] q2, lam1=0.0, tv1=None, tv2=None, nthreads=1):
     """
     cython interface calculates the warping to align a set of srsfs q1 to another set of srsfs q2
 
+    The pairs are aligned in one native call as in :func:`coptimum_reparamN`.
+
     :param q1: numpy ndarray of shape (M,N) of M srsfs with N samples
     :param time: vector of size N describing the sample points
     :param q2: numpy ndarray of shape (M,N) of M srsfs with N samples
     :param lam1: controls the amount of elasticity (default = 0.0)
+    :param tv1: increasing grid of the DP on the time scale of q1 (default = None, time)
+    :param tv2: increasing grid of the DP on the time scale of q2 (default = None, time)
+    :param nthreads: number of threads (default = 1, -1 uses all)
 
     :rtype numpy ndarray
     :return gam: describing the warping functions used to align columns of q with mq
 
     """
-    cdef int M, N, n1
-    cdef double lam
-
+    cdef int M, N
     M, N = q1.shape[0], q1.shape[1]
-    n1 = 1
-    lam = lam1
-    cdef np.ndarray[double, ndim=1, mode="c"] G = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] T = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] q1i = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] q2i = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] size = np.zeros(1)
+    cdef np.ndarray[double, ndim=2, mode="c"] q1i = np.ascontiguousarray((q1 / norm(q1, axis=0)).T)
+    cdef np.ndarray[double, ndim=2, mode="c"] q2i = np.ascontiguousarray((q2 / norm(q2, axis=0)).T)
 
-    gam = np.zeros((M, N))
-    sizes = np.zeros(N, dtype=np.int32)
-    Go = np.zeros((M, N))
-    To = np.zeros((M, N))
-    for k in xrange(0, N):
-        q1i = q1[:, k] / norm(q1[:, k])
-        q2i = q2[:, k] / norm(q2[:, k])
-        q1i = np.ascontiguousarray(q1i)
-        q2i = np.ascontiguousarray(q2i)
-
-        cDPQ.DynamicProgrammingQ2(&q1i[0], &time[0], &q2i[0], &time[0], n1, M, M, &time[0], &time[0], M, M, &G[0],
-                                  &T[0], &size[0], lam)
-        sizes[k] = np.int32(size)
-        Go[:, k] = G
-        To[:, k] = T
-
-    for k in xrange(0, N):
-        gam0 = np.interp(time, To[0:sizes[k], k], Go[0:sizes[k], k])
-        gam[:, k] = (gam0 - gam0[0]) / (gam0[-1] - gam0[0])
-
-    return gam
+    return _dp2_batch(q1i, M, q2i, M, time, N, lam1, tv1, tv2, nthreads)
 
 def coptimum_reparam(np.ndarray[double, ndim=1, mode="c"] q1, np.ndarray[double, ndim=1, mode="c"] time,
-                     np.ndarray[double, ndim=1, mode="c"] q2, lam1=0.0):
+                     np.ndarray[double, ndim=1, mode="c"] q2, lam1=0.0, tv1=None, tv2=None):
     """
     cython interface for calculates the warping to align srsf q2 to q1
 
@@ -107,33 +102,16 @@ def coptimum_reparam(np.ndarray[double, ndim=1, mode="c"] q1, np.ndarray[double,
     :param time: vector of size N describing the sample points
     :param q2: vector of size N samples of second SRSF
     :param lam1: controls the amount of elasticity (default = 0.0)
+    :param tv1: increasing grid of the DP on the time scale of q1 (default = None, time)
+    :param tv2: increasing grid of the DP on the time scale of q2 (default = None, time)
 
     :rtype vector
     :return gam: describing the warping function used to align q2 with q1
     """
-    cdef int M, n1
-    cdef double lam
-    M = q1.shape[0]
-    n1 = 1
-    lam = lam1
-    q1 = q1 / norm(q1)
-    q2 = q2 / norm(q2)
-    cdef np.ndarray[double, ndim=1, mode="c"] G = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] T = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] size = np.zeros(1)
+    cdef np.ndarray[double, ndim=2, mode="c"] q1i = np.ascontiguousarray((q1 / norm(q1))[np.newaxis, :])
+    cdef np.ndarray[double, ndim=2, mode="c"] q2i = np.ascontiguousarray((q2 / norm(q2))[np.newaxis, :])
 
-    sizes = np.zeros(1, dtype=np.int32)
-    Go = np.zeros((M, 1))
-    To = np.zeros((M, 1))
-    cDPQ.DynamicProgrammingQ2(&q1[0], &time[0], &q2[0], &time[0], n1, M, M, &time[0], &time[0], M, M, &G[0],
-                              &T[0], &size[0], lam)
-    sizes = np.int32(size)
-    Go[:, 0] = G
-    To[:, 0] = T
-    gam0 = np.interp(time, To[0:sizes[0], 0], Go[0:sizes[0], 0])
-    gam = (gam0 - gam0[0]) / (gam0[-1] - gam0[0])
-
-    return gam
+    return _dp2_batch(q1i, 0, q2i, 0, time, 1, lam1, tv1, tv2, 1)[:, 0]
 
 def coptimum_reparamN2_pair(np.ndarray[double, ndim=2, mode="c"] q, np.ndarray[double, ndim=1, mode="c"] time,
                             np.ndarray[double, ndim=2, mode="c"] q1, np.ndarray[double, ndim=2, mode="c"] q2, lam1=0.0):
@@ -4,6 +4,7 @@ from numpy.linalg import norm
 
 cimport numpy as np
 from cpython cimport array
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 
 # cpdef api  np.ndarray[double, ndim=1, mode="c"] reparm_dp(np.ndarray[double, ndim=1, mode="c"] q1, np.ndarray[double, ndim=1, mode="c"] q2):
 #    cdef int M, n1, disp
@@ -17,79 +18,248 @@ from cpython cimport array
 #    gam = (gami - gami[0]) / (gami[-1] - gami[0])
 #    return gam
 
+cdef int _check(int e) except -1:
+    # the C library returns DP_ENOMEM instead of failing on allocation
+    if e == cDP.DP_ENOMEM:
+        raise MemoryError()
+    return 0
+
+def _corridor(lo, hi, int M, int N):
+    # checks the corridor given by lo and hi of N alignments of M samples,
+    # returns its bounds column by column and the increment between columns
+    if lo is None and hi is None:
+        return None, None, 0
+    if lo is None or hi is None:
+        raise ValueError('lo and hi must be given together')
+    lo = np.asarray(lo, dtype=np.intc)
+    hi = np.asarray(hi, dtype=np.intc)
+    if lo.shape != hi.shape or lo.shape not in ((M,), (M, N)):
+        raise ValueError('lo and hi must be of shape (%d,) or (%d,%d)' % (M, M, N))
+    lo2 = lo.reshape(M, -1)
+    hi2 = hi.reshape(M, -1)
+    if (lo2 < 0).any() or (hi2 > M - 1).any() or (lo2 > hi2).any():
+        raise ValueError('lo and hi must satisfy 0 <= lo <= hi <= M-1')
+    if (np.diff(lo2, axis=0) < 0).any() or (np.diff(hi2, axis=0) < 0).any():
+        raise ValueError('lo and hi must be nondecreasing')
+    if (lo2[0] != 0).any() or (hi2[-1] != M - 1).any():
+        raise ValueError('the corridor must contain (0,0) and (M-1,M-1)')
+    binc = M if lo.ndim == 2 else 0
+    return np.ascontiguousarray(lo2.T).ravel(), np.ascontiguousarray(hi2.T).ravel(), binc
+
+def _per_function(a, int N, name, dtype):
+    # checks an array with one entry per alignment, edge is written to and
+    # must therefore be passed as is
+    if a is None:
+        return None
+    if name == 'edge':
+        if not isinstance(a, np.ndarray) or a.dtype != np.intc or not a.flags.c_contiguous:
+            raise ValueError('edge must be a contiguous numpy array of dtype intc')
+    else:
+        a = np.ascontiguousarray(a, dtype=dtype)
+    if a.shape != (N,):
+        raise ValueError('%s must be of shape (%d,)' % (name, N))
+    return a
+
+cdef class DPWorkspace:
+    """
+    reusable buffers for the DP alignment
+
+    Holds one set of DP buffers (fine grid interpolants, cost and path
+    tables) per thread, so that repeated alignments of the same size do not
+    allocate memory on every call. The buffers grow if a larger problem is
+    aligned with the workspace.
+
+    Each thread needs about M*M bytes (one byte of backpointer per DP grid
+    point), i.e. 100 MB for M = 10,000 and 400 MB for M = 20,000. The run
+    time of the full grid DP grows as M*M, which is the practical limit for
+    long signals rather than memory. A search corridor of width w (see `lo`
+    and `hi` of the alignment functions) needs M*w bytes and O(M*w) time.
+    The backpointers are allocated on first use.
+
+    Usage:  ws = DPWorkspace(M)
+            gam = coptimum_reparam_N(mq, time, q, workspace=ws)
+
+    :param M: number of samples of the SRSFs
+    :param n: dimension of the SRSFs (default = 1)
+    :param nthreads: number of threads the workspace serves (default = 1, -1 uses all cores)
+    """
+    cdef cDP.DPWorkspace **ws
+    cdef readonly int M, n, nthreads
+
+    def __cinit__(self, int M, int n=1, int nthreads=1):
+        cdef int k
+        if nthreads < 1:
+            nthreads = cDP.DP_max_threads()
+        self.M = M
+        self.n = n
+        self.nthreads = nthreads
+        self.ws = <cDP.DPWorkspace **> PyMem_Malloc(nthreads * sizeof(cDP.DPWorkspace *))
+        if self.ws == NULL:
+            raise MemoryError()
+        for k in range(nthreads):
+            self.ws[k] = NULL
+        for k in range(nthreads):
+            self.ws[k] = cDP.DP_workspace_alloc(n, M)
+            if self.ws[k] == NULL:
+                raise MemoryError()
+
+    def __dealloc__(self):
+        cdef int k
+        if self.ws != NULL:
+            for k in range(self.nthreads):
+                cDP.DP_workspace_free(self.ws[k])
+            PyMem_Free(self.ws)
+
 def coptimum_reparam_N(np.ndarray[double, ndim=1, mode="c"] mq, np.ndarray[double, ndim=1, mode="c"] time,
-                      np.ndarray[double, ndim=2, mode="c"] q, lam1=0.0):
+                      np.ndarray[double, ndim=2, mode="c"] q, lam1=0.0, nthreads=1,
+                      DPWorkspace workspace=None, lo=None, hi=None, edge=None, abandon=None):
     """
     cython interface calculates the warping to align a set of SRSFS q to a single SRSF mq
 
+    The columns are aligned in a single call into the C library, which
+    releases the GIL and spreads the columns over `nthreads` native threads
+    (or over the threads of `workspace` when one is given)
+
     :param mq: vector of size N samples of first SRSF
     :param time: vector of size N describing the sample points
     :param q: numpy ndarray of shape (M,N) of N srsfs with M samples
     :param lam1: controls the amount of elasticity (default = 0.0)
+    :param nthreads: number of threads (default = 1, -1 uses all cores)
+    :param workspace: DPWorkspace to reuse (default = None)
+    :param lo: integer vector of size N, lowest sample index of the warping at each sample,
+               or array with one such column per column of q (default = None)
+    :param hi: integer vector of size N, highest sample index of the warping at each sample,
+               or array with one such column per column of q (default = None)
+    :param edge: integer vector with one entry per column of q, set to 1 where the warping touches the corridor given by lo and hi
+                 and to -1 where the alignment was abandoned (default = None)
+    :param abandon: vector with one entry per column of q, the alignment of a column is abandoned and its warping set to
+                    NaN once every warping costs more than this threshold (see DP_solve in DP.c) (default = None)
 
     :rtype numpy ndarray
     :return gam: describing the warping functions used to align columns of q with mq
 
     """
-    cdef int M, N, n1, disp
+    cdef int M, N, n1, nthr
     cdef double lam
     mq = mq / norm(mq)
     M, N = q.shape[0], q.shape[1]
     n1 = 1
-    disp = 0
     lam = lam1
-    cdef np.ndarray[double, ndim=1, mode="c"] gami = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] qi = np.zeros(M)
-
-    gam = np.zeros((M, N))
-    for k in xrange(0, N):
-        qi = q[:, k] / norm(q[:, k])
-        qi = np.ascontiguousarray(qi)
-
-        cDP.DP(&qi[0], &mq[0], &n1, &M, &lam, &disp, &gami[0])
-        gam[:, k] = (gami - gami[0]) / (gami[-1] - gami[0])
-
-    return gam
+    nthr = nthreads
+    cdef cDP.DPWorkspace **wsp = NULL
+    if workspace is not None:
+        nthr = workspace.nthreads
+        wsp = workspace.ws
+    cdef int binc = 0
+    cdef int *plo = NULL
+    cdef int *phi = NULL
+    cdef int *pedge = NULL
+    cdef double *pab = NULL
+    cdef double[::1] abi
+    abandon = _per_function(abandon, N, 'abandon', np.double)
+    if abandon is not None:
+        abi = abandon
+        pab = &abi[0]
+    cdef int[::1] loi, hii, edgei
+    lo, hi, binc = _corridor(lo, hi, M, N)
+    if lo is not None:
+        loi = lo
+        hii = hi
+        plo = &loi[0]
+        phi = &hii[0]
+    edge = _per_function(edge, N, 'edge', np.intc)
+    if edge is not None:
+        edgei = edge
+        pedge = &edgei[0]
+    cdef np.ndarray[double, ndim=2, mode="c"] qi = np.ascontiguousarray((q / norm(q, axis=0)).T)
+    cdef np.ndarray[double, ndim=2, mode="c"] gami = np.zeros((N, M))
+    cdef int err
+
+    with nogil:
+        err = cDP.DP_batch(&qi[0, 0], &mq[0], 0, n1, M, N, lam, plo, phi, binc, pab, nthr, wsp, &gami[0, 0], pedge)
+    _check(err)
+
+    gam = (gami - gami[:, 0:1]) / (gami[:, -1:] - gami[:, 0:1])
+
+    return np.ascontiguousarray(gam.T)
 
 def coptimum_reparam_N2(np.ndarray[double, ndim=2, mode="c"] q1, np.ndarray[double, ndim=1, mode="c"] time,
-                       np.ndarray[double, ndim=2, mode="c"] q2, lam1=0.0):
+                       np.ndarray[double, ndim=2, mode="c"] q2, lam1=0.0, nthreads=1,
+                       DPWorkspace workspace=None, lo=None, hi=None, edge=None, abandon=None):
     """
     cython interface calculates the warping to align a set of SRSFs q1 to another set of SRSFs q2
 
+    The columns are aligned in a single call into the C library, which
+    releases the GIL and spreads the columns over `nthreads` native threads
+    (or over the threads of `workspace` when one is given)
+
     :param q1: numpy ndarray of shape (M,N) of M srsfs with N samples
     :param time: vector of size N describing the sample points
     :param q2: numpy ndarray of shape (M,N) of M srsfs with N samples
     :param lam1: controls the amount of elasticity (default = 0.0)
+    :param nthreads: number of threads (default = 1, -1 uses all cores)
+    :param workspace: DPWorkspace to reuse (default = None)
+    :param lo: integer vector of size N, lowest sample index of the warping at each sample,
+               or array with one such column per column of q (default = None)
+    :param hi: integer vector of size N, highest sample index of the warping at each sample,
+               or array with one such column per column of q (default = None)
+    :param edge: integer vector with one entry per column of q, set to 1 where the warping touches the corridor given by lo and hi
+                 and to -1 where the alignment was abandoned (default = None)
+    :param abandon: vector with one entry per column of q, the alignment of a column is abandoned and its warping set to
+                    NaN once every warping costs more than this threshold (see DP_solve in DP.c) (default = None)
 
     :rtype numpy ndarray
     :return gam: describing the warping functions used to align columns of q with mq
 
     """
-    cdef int M, N, n1, disp
+    cdef int M, N, n1, nthr
     cdef double lam
 
     M, N = q1.shape[0], q1.shape[1]
     n1 = 1
     lam = lam1
-    disp = 0
-    cdef np.ndarray[double, ndim=1, mode="c"] gami = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] q1i = np.zeros(M)
-    cdef np.ndarray[double, ndim=1, mode="c"] q2i = np.zeros(M)
-
-    gam = np.zeros((M, N))
-    for k in xrange(0, N):
-        q1i = q1[:, k] / norm(q1[:, k])
-        q2i = q2[:, k] / norm(q2[:, k])
-        q1i = np.ascontiguousarray(q1i)
-        q2i = np.ascontiguousarray(q2i)
-
-        cDP.DP(&q2i[0], &q1i[0], &n1, &M, &lam, &disp, &gami[0])
-        gam[:, k] = (gami - gami[0]) / (gami[-1] - gami[0])
-
-    return gam
+    nthr = nthreads
+    cdef cDP.DPWorkspace **wsp = NULL
+    if workspace is not None:
+        nthr = workspace.nthreads
+        wsp = workspace.ws
+    cdef int binc = 0
+    cdef int *plo = NULL
+    cdef int *phi = NULL
+    cdef int *pedge = NULL
+    cdef double *pab = NULL
+    cdef double[::1] abi
+    abandon = _per_function(abandon, N, 'abandon', np.double)
+    if abandon is not None:
+        abi = abandon
+        pab = &abi[0]
+    cdef int[::1] loi, hii, edgei
+    lo, hi, binc = _corridor(lo, hi, M, N)
+    if lo is not None:
+        loi = lo
+        hii = hi
+        plo = &loi[0]
+        phi = &hii[0]
+    edge = _per_function(edge, N, 'edge', np.intc)
+    if edge is not None:
+        edgei = edge
+        pedge = &edgei[0]
+    cdef np.ndarray[double, ndim=2, mode="c"] q1i = np.ascontiguousarray((q1 / norm(q1, axis=0)).T)
+    cdef np.ndarray[double, ndim=2, mode="c"] q2i = np.ascontiguousarray((q2 / norm(q2, axis=0)).T)
+    cdef np.ndarray[double, ndim=2, mode="c"] gami = np.zeros((N, M))
+    cdef int err
+
+    with nogil:
+        err = cDP.DP_batch(&q2i[0, 0], &q1i[0, 0], M, n1, M, N, lam, plo, phi, binc, pab, nthr, wsp, &gami[0, 0], pedge)
+    _check(err)
+
+    gam = (gami - gami[:, 0:1]) / (gami[:, -1:] - gami[:, 0:1])
+
+    return np.ascontiguousarray(gam.T)
 
 def coptimum_reparam(np.ndarray[double, ndim=1, mode="c"] q1, np.ndarray[double, ndim=1, mode="c"] time,
-                     np.ndarray[double, ndim=1, mode="c"] q2, lam1=0.0):
+                     np.ndarray[double, ndim=1, mode="c"] q2, lam1=0.0, DPWorkspace workspace=None,
+                     lo=None, hi=None, edge=None):
     """
     cython interface for calculates the warping to align SRSFs q2 to q1
 
@@ -97,6 +267,10 @@ def coptimum_reparam(np.ndarray[double, ndim=1, mode="c"] q1, np.ndarray[double,
     :param time: vector of size N describing the sample points
     :param q2: vector of size N samples of second SRSF
     :param lam1: controls the amount of elasticity (default = 0.0)
+    :param workspace: DPWorkspace to reuse (default = None)
+    :param lo: integer vector of size N, lowest sample index of the warping at each sample (default = None)
+    :param hi: integer vector of size N, highest sample index of the warping at each sample (default = None)
+    :param edge: integer vector of size 1, set to 1 where the warping touches the corridor given by lo and hi (default = None)
 
     :rtype vector
     :return gam: describing the warping function used to align q2 with q1
@@ -109,9 +283,30 @@ def coptimum_reparam(np.ndarray[double, ndim=1, mode="c"] q1, np.ndarray[double,
     disp = 0
     q1 = q1 / norm(q1)
     q2 = q2 / norm(q2)
+    cdef int e
+    cdef int *plo = NULL
+    cdef int *phi = NULL
+    cdef int[::1] loi, hii
+    lo, hi, _ = _corridor(lo, hi, M, 1)
+    if lo is not None:
+        loi = lo
+        hii = hi
+        plo = &loi[0]
+        phi = &hii[0]
+    if edge is not None and len(edge) < 1:
+        raise ValueError('edge must have one entry')
     cdef np.ndarray[double, ndim=1, mode="c"] gami = np.zeros(M)
 
-    cDP.DP(&q2[0], &q1[0], &n1, &M, &lam, &disp, &gami[0])
+    if workspace is None and lo is None:
+        _check(cDP.DP(&q2[0], &q1[0], &n1, &M, &lam, &disp, &gami[0]))
+    else:
+        if workspace is None:
+            workspace = DPWorkspace(M, n1)
+        with nogil:
+            e = cDP.DP_ws(&q2[0], &q1[0], n1, M, lam, plo, phi, workspace.ws[0], &gami[0])
+        _check(e)
+        if edge is not None:
+            edge[0] = e
     gam = (gami - gami[0]) / (gami[-1] - gami[0])
 
     return gam
@@ -149,7 +344,7 @@ def coptimum_reparam_N2_pair(np.ndarray[double, ndim=2, mode="c"] q, np.ndarray[
         q1i = np.ascontiguousarray(q1i)
         q2i = np.ascontiguousarray(q2i)
 
-        cDP.DP(&q2i[0], &q1i[0], &n1, &M, &lam, &disp, &gami[0])
+        _check(cDP.DP(&q2i[0], &q1i[0], &n1, &M, &lam, &disp, &gami[0]))
         gam[:, k] = (gami - gami[0]) / (gami[-1] - gami[0])
 
     return gam
@@ -183,7 +378,7 @@ def coptimum_reparam_pair_q(np.ndarray[double, ndim=2, mode="c"] q1, np.ndarray[
     q1i = np.ascontiguousarray(q1i)
     q2i = np.ascontiguousarray(q2i)
 
-    cDP.DP(&q2i[0], &q1i[0], &N, &M, &lam, &disp, &gami[0])
+    _check(cDP.DP(&q2i[0], &q1i[0], &N, &M, &lam, &disp, &gami[0]))
     gam = (gami - gami[0]) / (gami[-1] - gami[0])
 
     return gam
@@ -217,7 +412,49 @@ def coptimum_reparam_curve(np.ndarray[double, ndim=2, mode="c"] q1, np.ndarray[d
     q1i = np.ascontiguousarray(q1i)
     q2i = np.ascontiguousarray(q2i)
 
-    cDP.DP(&q2i[0], &q1i[0], &n1, &M, &lam, &disp, &gami[0])
+    _check(cDP.DP(&q2i[0], &q1i[0], &n1, &M, &lam, &disp, &gami[0]))
     gam = (gami - gami[0]) / (gami[-1] - gami[0])
 
     return gam
+
+def coptimum_reparam_curve_N(np.ndarray[double, ndim=2, mode="c"] q1, np.ndarray[double, ndim=1, mode="c"] time,
+                             np.ndarray[double, ndim=3, mode="c"] q2, lam1=0.0, nthreads=1,
+                             DPWorkspace workspace=None):
+    """
+    cython interface for calculates the warpings to align a set of curves q2 to q1
+
+    The fine grid interpolant of q1 is computed once and shared by all
+    curves, which are aligned in a single call into the C library as in
+    :func:`coptimum_reparam_N`
+
+    :param q1: matrix of size nxN samples of first SRVF
+    :param time: vector of size N describing the sample points
+    :param q2: array of size nxNxK of K SRVFs
+    :param lam1: controls the amount of elasticity (default = 0.0)
+    :param nthreads: number of threads (default = 1, -1 uses all cores)
+    :param workspace: DPWorkspace to reuse (default = None)
+
+    :rtype numpy ndarray
+    :return gam: array of size NxK describing the warping functions used to align q2 with q1
+    """
+    cdef int M, K, n1, nthr
+    cdef double lam
+    n1, M, K = q2.shape[0], q2.shape[1], q2.shape[2]
+    lam = lam1
+    nthr = nthreads
+    cdef cDP.DPWorkspace **wsp = NULL
+    if workspace is not None:
+        nthr = workspace.nthreads
+        wsp = workspace.ws
+    cdef np.ndarray[double, ndim=1, mode="c"] q1i = np.ascontiguousarray(q1.reshape(M*n1, order='F'))
+    cdef np.ndarray[double, ndim=3, mode="c"] q2i = np.ascontiguousarray(q2.transpose(2, 1, 0))
+    cdef np.ndarray[double, ndim=2, mode="c"] gami = np.zeros((K, M))
+    cdef int err
+
+    with nogil:
+        err = cDP.DP_batch(&q2i[0, 0, 0], &q1i[0], 0, n1, M, K, lam, NULL, NULL, 0, NULL, nthr, wsp, &gami[0, 0], NULL)
+    _check(err)
+
+    gam = (gami - gami[:, 0:1]) / (gami[:, -1:] - gami[:, 0:1])
+
+    return np.ascontiguousarray(gam.T)
@@ -0,0 +1,109 @@
+cimport cmisc
+import numpy as np
+
+cimport numpy as np
+
+
+def _columns(a, N):
+    # functions of a (M,N) array or a shared vector, as contiguous rows
+    # and the increment between them
+    a = np.asarray(a, dtype=np.double)
+    if a.ndim == 1:
+        return np.ascontiguousarray(a), 0
+    if a.shape[1] != N:
+        raise Exception('arrays must have the same number of columns')
+    return np.ascontiguousarray(a.T), a.shape[0]
+
+
+def approx(x, y, xout, int nthreads=1):
+    """
+    cython interface of the batched linear interpolation, numpy.interp(xout[:, k],
+    x[:, k], y[:, k]) for every column k, computed without the GIL
+
+    :param x: numpy ndarray of shape (M,N) or vector of size M shared by all columns
+    :param y: numpy ndarray of shape (M,N) or vector of size M shared by all columns
+    :param xout: numpy ndarray of shape (P,N) or vector of size P shared by all columns
+    :param nthreads: number of threads (default = 1, -1 uses all)
+
+    :rtype numpy ndarray
+    :return yout: numpy ndarray of shape (P,N) of the interpolated values
+    """
+    N = max([a.shape[1] for a in (np.asarray(x), np.asarray(y), np.asarray(xout))
+             if a.ndim > 1] + [1])
+    cdef np.ndarray[double, ndim=1, mode="c"] xi, yi, xouti
+    cdef int xinc, yinc, xoutinc, nxy, nout, nfun
+    x, xinc = _columns(x, N)
+    y, yinc = _columns(y, N)
+    xout, xoutinc = _columns(xout, N)
+    xi = x.ravel()
+    yi = y.ravel()
+    xouti = xout.ravel()
+    nxy = x.shape[x.ndim - 1]
+    nout = xout.shape[xout.ndim - 1]
+    if y.shape[y.ndim - 1] != nxy:
+        raise Exception('x and y must have the same number of samples')
+    nfun = N
+    cdef np.ndarray[double, ndim=2, mode="c"] yout = np.zeros((nfun, nout))
+
+    with nogil:
+        cmisc.approx_batch(&xi[0], xinc, &yi[0], yinc, nxy, &xouti[0], xoutinc, nout,
+                           &yout[0, 0], nfun, nthreads)
+
+    return np.ascontiguousarray(yout.T)
+
+
+def invert_gamma(np.ndarray[double, ndim=2] gam, int nthreads=1):
+    """
+    cython interface of the batched inverse of warping functions, computed
+    without the GIL
+
+    :param gam: numpy ndarray of shape (M,N) of N warping functions on [0,1]
+    :param nthreads: number of threads (default = 1, -1 uses all)
+
+    :rtype numpy ndarray
+    :return gamI: numpy ndarray of shape (M,N) of the inverses
+    """
+    cdef int M = gam.shape[0]
+    cdef int N = gam.shape[1]
+    cdef np.ndarray[double, ndim=2, mode="c"] gami = np.ascontiguousarray(gam.T)
+    cdef np.ndarray[double, ndim=2, mode="c"] out = np.zeros((N, M))
+
+    with nogil:
+        cmisc.invertGamma_batch(M, N, &gami[0, 0], &out[0, 0], nthreads)
+
+    return np.ascontiguousarray(out.T)
+
+
+def group_action_by_gamma(np.ndarray[double, ndim=3] q, np.ndarray[double, ndim=2] gam,
+                          int nthreads=1):
+    """
+    cython interface of the batched reparameterization of srvfs, computed
+    without the GIL with the not-a-knot cubic spline of
+    curve_functions.group_action_by_gamma
+
+    :param q: numpy ndarray of shape (n,T,N) of N srvfs with T samples
+    :param gam: numpy ndarray of shape (T,N) of N warping functions
+    :param nthreads: number of threads (default = 1, -1 uses all)
+
+    :rtype numpy ndarray
+    :return qn: numpy ndarray of shape (n,T,N) of the reparameterized srvfs
+    """
+    cdef int n = q.shape[0]
+    cdef int T = q.shape[1]
+    cdef int N = q.shape[2]
+    if gam.shape[0] != T or gam.shape[1] != N:
+        raise Exception('gam must be of shape (T,N)')
+    if T < 4:
+        raise Exception('at least 4 samples are needed')
+    cdef np.ndarray[double, ndim=3, mode="c"] qi = np.ascontiguousarray(q.transpose(2, 1, 0))
+    cdef np.ndarray[double, ndim=2, mode="c"] gami = np.ascontiguousarray(gam.T)
+    cdef np.ndarray[double, ndim=3, mode="c"] qn = np.zeros((N, T, n))
+    cdef int err
+
+    with nogil:
+        err = cmisc.group_action_by_gamma_batch(n, T, N, &qi[0, 0, 0], &gami[0, 0], &qn[0, 0, 0],
+                                                nthreads)
+    if err != 0:
+        raise MemoryError()
+
+    return np.ascontiguousarray(qn.transpose(2, 1, 0))
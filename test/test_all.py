@@ -1,4 +1,6 @@
 import unittest
+import os
+import tempfile
 import numpy as np
 import fdasrsf as fs  
 
@@ -34,6 +36,382 @@ class TestFDASRSF(unittest.TestCase):
         da, dp = fs.elastic_distance(f1, f1, timet)
         self.assertLessEqual(da, 1e-10)
         self.assertLessEqual(dp, 1e-6)
-  
+
+    def test_reparm_N_threads(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        q1 = np.sin(2*np.pi*timet)
+        q2 = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.0, 1.3)])
+        gam1 = fs.optimum_reparam(q1, timet, q2)
+        gam4 = fs.optimum_reparam(q1, timet, q2, cores=4)
+        self.assertEqual(gam4.shape, (M, 3))
+        self.assertAlmostEqual(np.abs(gam1-gam4).max(), 0)
+        for k in range(3):
+            gamk = fs.optimum_reparam(q1, timet, q2[:,k])
+            self.assertAlmostEqual(np.abs(gamk-gam4[:,k]).max(), 0)
+
+    def test_reparm_workspace(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        q1 = np.sin(2*np.pi*timet)
+        q2 = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.3)])
+        ws = fs.DPWorkspace(M, nthreads=2)
+        gam = fs.optimum_reparam(q1, timet, q2)
+        for k in range(2):
+            gamw = fs.optimum_reparam(q1, timet, q2, workspace=ws)
+            self.assertAlmostEqual(np.abs(gam-gamw).max(), 0)
+        gam1 = fs.optimum_reparam(q1, timet, q2[:,1], workspace=ws)
+        self.assertAlmostEqual(np.abs(gam[:,1]-gam1).max(), 0)
+
+    def test_reparm_band(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        q1 = np.sin(2*np.pi*timet)
+        q2 = np.sin(2*np.pi*timet**1.1)
+        gam = fs.optimum_reparam(q1, timet, q2)
+        gamb = fs.optimum_reparam(q1, timet, q2, band=1.0)
+        self.assertAlmostEqual(np.abs(gam-gamb).max(), 0)
+        with self.assertWarns(RuntimeWarning):
+            gamb = fs.optimum_reparam(q1, timet, q2, band=0.02)
+        self.assertLessEqual(np.abs(gamb-timet).max(), 0.02+1e-10)
+
+    def test_reparm_mr(self):
+        M = 300
+        timet = np.linspace(0,1,M)
+        q1 = np.sin(2*np.pi*timet)
+        q2 = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.3)])
+        gam = fs.optimum_reparam(q1, timet, q2)
+        gammr = fs.optimum_reparam(q1, timet, q2, method="DPmr")
+        self.assertEqual(gammr.shape, (M, 2))
+        self.assertLessEqual(np.abs(gam-gammr).max(), 0.01)
+        gam1 = fs.optimum_reparam(q1, timet, q2[:,1], method="DPmr")
+        self.assertAlmostEqual(np.abs(gammr[:,1]-gam1).max(), 0)
+
+    def test_reparm_corridor_checks(self):
+        import optimum_reparam_N as orN
+        M = 51
+        timet = np.linspace(0,1,M)
+        q1 = np.sin(2*np.pi*timet)
+        q2 = np.column_stack([q1, q1])
+        lo, hi = fs.utility_functions.dp_band(M, 0.2)
+        orN.coptimum_reparam_N(q1, timet, q2, lo=lo, hi=hi)
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam_N(q1, timet, q2, lo=lo)
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam_N(q1, timet, q2, lo=lo[1:], hi=hi[1:])
+        lo1 = lo.copy()
+        lo1[0] = 1
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam_N(q1, timet, q2, lo=lo1, hi=hi)
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam_N(q1, timet, q2, lo=hi[::-1], hi=hi)
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam_N(q1, timet, q2, edge=np.zeros(1, dtype=np.intc))
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam_N(q1, timet, q2, abandon=np.zeros(3))
+        with self.assertRaises(ValueError):
+            orN.coptimum_reparam(q1, timet, q1, lo=lo, hi=np.minimum(hi, M-2))
+
+    def test_distance_matrix(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.0, 1.3)])
+        Dy, Dx = fs.elastic_distance_matrix(f, timet)
+        self.assertEqual(Dy.shape, (3, 3))
+        self.assertAlmostEqual(np.abs(Dy-Dy.T).max(), 0)
+        da, dp = fs.elastic_distance(f[:,0], f[:,2], timet)
+        self.assertAlmostEqual(Dy[0,2], da)
+        self.assertAlmostEqual(Dx[2,0], dp)
+
+    def test_cdist(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        fq = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.9, 1.2)])
+        fr = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.5, 0.8, 1.0, 1.3, 2.0)])
+        Dy, Dx = fs.elastic_cdist(fq, fr, timet)
+        self.assertEqual(Dy.shape, (2, 5))
+        da, dp = fs.elastic_distance(fq[:,1], fr[:,3], timet)
+        self.assertAlmostEqual(Dy[1,3], da)
+        Dyk, Dxk, idx = fs.elastic_cdist(fq, fr, timet, k=2, chunk=2)
+        self.assertEqual(idx.tolist(), np.argsort(Dy, axis=1)[:,:2].tolist())
+        self.assertAlmostEqual(np.abs(Dyk-np.sort(Dy, axis=1)[:,:2]).max(), 0)
+        Dyb, Dxb = fs.elastic_cdist(fq, fr, timet, chunk=10)
+        self.assertAlmostEqual(np.abs(Dyb-Dy).max(), 0)
+        self.assertAlmostEqual(np.abs(Dxb-Dx).max(), 0)
+
+    def test_knn(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        fq = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.9, 1.2)])
+        fr = np.column_stack([a*np.sin(2*np.pi*timet**p) for a in (0.5, 1.0, 2.0)
+                              for p in (0.6, 1.0, 1.5)])
+        Dy, Dx, idx = fs.elastic_cdist(fq, fr, timet, k=2)
+        Dyk, Dxk, idxk, prune = fs.elastic_knn(fq, fr, timet, k=2, chunk=2)
+        self.assertEqual(idx.tolist(), idxk.tolist())
+        self.assertAlmostEqual(np.abs(Dy-Dyk).max(), 0)
+        self.assertTrue(np.all(prune >= 0) and np.all(prune < 1))
+
+    def test_knn_random(self):
+        rng = np.random.RandomState(0)
+        timet = np.linspace(0,1,101)
+        def gen(n):
+            c = 0.3 + 0.4*rng.rand(n)
+            a = rng.randn(2, n)
+            return (np.exp(-(timet[:,None]-c)**2/0.01)*(1+0.5*rng.rand(n)) +
+                    0.1*(a[0]*np.sin(2*np.pi*timet[:,None]) + a[1]*np.cos(2*np.pi*timet[:,None])))
+        fq, fr = gen(4), gen(40)
+        Dy, Dx, idx = fs.elastic_cdist(fq, fr, timet, k=3)
+        Dyk, Dxk, idxk, prune = fs.elastic_knn(fq, fr, timet, k=3, chunk=4)
+        self.assertEqual(idx.tolist(), idxk.tolist())
+        self.assertAlmostEqual(np.abs(Dy-Dyk).max(), 0)
+        # the approximate abandoning skips more alignments, its neighbors
+        # cannot be closer than the exact ones
+        Dya, Dxa, idxa, prunea = fs.elastic_knn(fq, fr, timet, k=3, chunk=4, slack=0.0)
+        self.assertGreater(prunea.sum(), prune.sum())
+        self.assertTrue(np.all(Dya >= Dy - 1e-12))
+
+    def test_reparm_curve_N(self):
+        M = 80
+        t = np.linspace(0,2*np.pi,M)
+        q1 = fs.curve_to_q(np.vstack((np.cos(t), np.sin(2*t))))
+        q2 = np.stack([fs.curve_to_q(np.vstack((np.cos(t+a*np.sin(t)), np.sin(2*(t+a*np.sin(t))))))
+                       for a in (0.1, 0.3)], axis=2)
+        gam = fs.optimum_reparam_curve(q1, q2)
+        self.assertEqual(gam.shape, (M, 2))
+        for k in range(2):
+            gamk = fs.optimum_reparam_curve(q1, q2[:,:,k])
+            self.assertAlmostEqual(np.abs(gamk-gam[:,k]).max(), 0)
+
+    def test_srsf_align_history(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.0, 1.3)])
+        obj = fs.fdawarp(f, timet)
+        obj.srsf_align(keep_history=True)
+        objn = fs.fdawarp(f, timet)
+        objn.srsf_align()
+        self.assertFalse(hasattr(objn, 'f_history') or hasattr(objn, 'q_history'))
+        for a in (objn.fn, objn.qn, objn.q0, objn.gam):
+            self.assertEqual(a.shape, (M, 3))
+        self.assertEqual(obj.f_history.shape[:2], (M, 3))
+        self.assertAlmostEqual(np.abs(obj.f_history[:,:,0]-f).max(), 0)
+        self.assertAlmostEqual(np.abs(obj.f_history[:,:,-1]-obj.fn).max(), 0)
+
+    def test_srsf_align_warm(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.0, 1.3)])
+        obj = fs.fdawarp(f, timet)
+        obj.srsf_align()
+        objw = fs.fdawarp(f, timet)
+        objw.srsf_align(warm_start=0.05)
+        self.assertAlmostEqual(np.abs(obj.fn-objw.fn).max(), 0)
+        with self.assertRaises(Exception):
+            objw.srsf_align(omethod="DP2", warm_start=0.05)
+        with self.assertRaises(Exception):
+            objw.srsf_align(omethod="DPmr", warm_start=0.05)
+
+    def test_srsf_align_sgd(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in np.linspace(0.7, 1.4, 8)])
+        obj = fs.fdawarp(f, timet)
+        obj.srsf_align()
+        objs = fs.fdawarp(f, timet)
+        objs.srsf_align(method="sgd", batch_size=4, passes=3, seed=0)
+        self.assertEqual(objs.fn.shape, (M, 8))
+        self.assertLessEqual(np.linalg.norm(objs.mqn-obj.mqn)/np.linalg.norm(obj.mqn), 0.1)
+
+    def test_srsf_align_memmap(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in np.linspace(0.7, 1.4, 8)])
+        with tempfile.TemporaryDirectory() as tmp:
+            np.save(os.path.join(tmp, "f.npy"), f)
+            obj = fs.fdawarp(os.path.join(tmp, "f.npy"), timet)
+            obj.srsf_align(method="sgd", batch_size=3, seed=0, out=tmp)
+            objs = fs.fdawarp(f, timet)
+            objs.srsf_align(method="sgd", batch_size=3, seed=0)
+            self.assertIsInstance(obj.fn, np.memmap)
+            self.assertAlmostEqual(np.abs(np.load(os.path.join(tmp, "gam.npy"))-obj.gam).max(), 0)
+            for a in ("fn", "qn", "gam", "mqn"):
+                self.assertAlmostEqual(np.abs(getattr(obj, a)-getattr(objs, a)).max(), 0)
+            self.assertAlmostEqual(obj.orig_var, np.trapz(f.var(axis=1), timet))
+            with self.assertRaises(Exception):
+                obj.srsf_align()
+            del obj
+
+    def test_partial_fit(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in np.linspace(0.7, 1.4, 8)])
+        obj = fs.fdawarp(f[:,:4], timet)
+        obj.srsf_align()
+        obj.partial_fit(f[:,4:6])
+        obj.partial_fit(f[:,6:], drift=0)
+        self.assertEqual(obj.fn.shape, (M, 8))
+        self.assertEqual(obj.buffers["n"], 8)
+        self.assertGreaterEqual(obj.buffers["gam"].shape[1], 8)
+        self.assertLessEqual(np.abs(obj.gam[[0, -1]]-[[0], [1]]).max(), 1e-12)
+        self.assertAlmostEqual(np.abs(obj.f-f).max(), 0)
+        self.assertAlmostEqual(obj.orig_var, np.trapz(f.var(axis=1), timet))
+        self.assertAlmostEqual(obj.amp_var, np.trapz(obj.fn.var(axis=1), timet))
+        obj = fs.fdawarp(f[:,:4], timet)
+        obj.srsf_align()
+        obj.partial_fit(f[:,4:6])
+        obj.srsf_align(deriv="fd")
+        obj.partial_fit(f[:,4:])
+        self.assertEqual(obj.fn.shape, (M, 10))
+        q = fs.f_to_srsf(f[:,4:], timet, deriv="fd")
+        self.assertAlmostEqual(np.abs(obj.q0[:,6:]-q).max(), 0)
+
+    def test_template(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        f = np.column_stack([np.sin(2*np.pi*timet**p) for p in (0.8, 1.0, 1.3)])
+        obj = fs.fdawarp(f, timet)
+        obj.srsf_align()
+        with tempfile.TemporaryDirectory() as tmp:
+            obj.template().save(os.path.join(tmp, "model.npz"))
+            model = fs.fdatemplate.load(os.path.join(tmp, "model.npz"))
+        self.assertEqual(model.omethod, "DP")
+        fn, gam = model.transform(f)
+        self.assertEqual(fn.shape, (M, 3))
+        gam1 = fs.optimum_reparam(obj.mqn, timet, obj.q0[:,1])
+        self.assertAlmostEqual(np.abs(gam[:,1]-gam1).max(), 0)
+        fn1, gam1 = model.transform(f[:,1])
+        self.assertAlmostEqual(np.abs(fn[:,1]-fn1).max(), 0)
+        obj.srsf_align(deriv="fd", band=0.3)
+        with tempfile.TemporaryDirectory() as tmp:
+            obj.template().save(os.path.join(tmp, "model.npz"))
+            model = fs.fdatemplate.load(os.path.join(tmp, "model.npz"))
+        self.assertEqual((model.deriv, model.band), ("fd", 0.3))
+        fn, gam = model.transform(f)
+        q1 = fs.f_to_srsf(f[:,1], timet, deriv="fd")
+        gam1 = fs.optimum_reparam(obj.mqn, timet, q1, band=0.3)
+        self.assertAlmostEqual(np.abs(gam[:,1]-gam1).max(), 0)
+
+    def test_interp_batch(self):
+        M = 101
+        timet = np.linspace(0,1,M)
+        gam = np.column_stack([timet**p for p in (0.8, 1.0, 1.3)])
+        f = np.column_stack([np.sin(2*np.pi*timet*k) for k in (1, 2, 3)])
+        fw = fs.utility_functions.interp_batch(gam, timet, f)
+        for k in range(3):
+            self.assertAlmostEqual(np.abs(fw[:,k]-np.interp(gam[:,k], timet, f[:,k])).max(), 0)
+        fw = fs.utility_functions.interp_batch(gam[:,2], timet, f)
+        self.assertAlmostEqual(np.abs(fw[:,1]-np.interp(gam[:,2], timet, f[:,1])).max(), 0)
+
+    def test_gradient_spline_batch(self):
+        from scipy.interpolate import UnivariateSpline
+        M = 101
+        timet = np.sort(np.random.RandomState(0).rand(M))
+        f = np.column_stack([np.sin(2*np.pi*timet*k) for k in (1, 2, 3)])
+        f0, g, g2 = fs.gradient_spline(timet, f)
+        for k in range(3):
+            spl = UnivariateSpline(timet, f[:,k], s=0)
+            self.assertAlmostEqual(np.abs(g[:,k]-spl(timet, 1)).max(), 0, 8)
+            self.assertAlmostEqual(np.abs(g2[:,k]-spl(timet, 2)).max(), 0, 6)
+
+    def test_gradient_fd(self):
+        timet = np.sort(np.r_[0, 1, np.random.RandomState(1).rand(398)])
+        f = np.column_stack([np.sin(2*np.pi*timet), timet**3])
+        g = np.column_stack([2*np.pi*np.cos(2*np.pi*timet), 3*timet**2])
+        f0, g1, g2 = fs.gradient_spline(timet, f, deriv="fd")
+        self.assertLess(np.abs(g1-g).max(), 1e-5)
+        q = fs.f_to_srsf(f, timet, deriv="fd")
+        self.assertAlmostEqual(np.abs(q-g1/np.sqrt(np.abs(g1)+np.finfo(float).eps)).max(), 0)
+
+    def test_sqrt_mean_batch(self):
+        t = np.linspace(0, 1, 101)
+        gam = np.column_stack([t**a for a in (0.7, 0.9, 1.2, 1.5)])
+        mu, gam_mu, psi, vec = fs.SqrtMean(gam)
+        for k in range(gam.shape[1]):
+            v, theta = fs.geometry.inv_exp_map(mu, psi[:,k])
+            self.assertAlmostEqual(np.abs(vec[:,k]-v).max(), 0)
+        self.assertLess(fs.geometry.L2norm(vec.mean(axis=1)), 1e-7)
+
+    def test_geometry_batch(self):
+        t = np.linspace(0, 1, 101)
+        psi = np.sqrt(np.column_stack([a*t**(a-1) for a in (1.0, 1.2, 1.5)]))
+        w = fs.geometry.quadrature_weights(101)
+        vec = np.empty(psi.shape)
+        v, theta = fs.geometry.inv_exp_map(psi[:,0], psi, w, out=vec)
+        self.assertIs(v, vec)
+        for k in range(3):
+            vk, thk = fs.geometry.inv_exp_map(psi[:,0], psi[:,k])
+            self.assertAlmostEqual(np.abs(v[:,k]-vk).max(), 0)
+        psi2 = fs.geometry.exp_map(psi[:,0], v, w)
+        self.assertLess(np.abs(psi2[:,1:]-psi[:,1:]).max(), 1e-2)
+        self.assertAlmostEqual(np.abs(fs.geometry.L2norm(psi2, w)-1).max(), 0)
+
+    def test_warp_batch(self):
+        t = np.linspace(0, 1, 101)
+        gam = np.column_stack([t**a for a in (0.6, 1.0, 1.7)])
+        gamI = fs.invertGamma(gam)
+        for k in range(3):
+            self.assertAlmostEqual(np.abs(gamI[:,k]-fs.invertGamma(gam[:,k])).max(), 0)
+        gid = fs.utility_functions.compose_gamma(gam, gamI)
+        self.assertLess(np.abs(gid-t[:,None]).max(), 1e-2)
+        f = np.column_stack([np.sin(2*np.pi*t)]*3)
+        fw = fs.warp_f_gamma(t, f, gam)
+        self.assertAlmostEqual(np.abs(fw[:,2]-fs.warp_f_gamma(t, f[:,2], gam[:,2])).max(), 0)
+        qw = fs.warp_q_gamma(t, f, gam[:,0])
+        self.assertAlmostEqual(np.abs(qw[:,1]-fs.warp_q_gamma(t, f[:,1], gam[:,0])).max(), 0)
+
+    def test_group_action_batch(self):
+        T = 100
+        t = np.linspace(0,2*np.pi,T)
+        s = np.linspace(0,1,T)
+        q = np.stack([fs.curve_to_q(np.vstack((np.cos(t), np.sin(a*t))))
+                      for a in (1, 2, 3)], axis=2)
+        gam = np.column_stack([s**a for a in (0.8, 1.0, 1.3)])
+        qn = fs.curve_functions.group_action_by_gamma(q, gam)
+        for k in range(3):
+            qk = fs.curve_functions.group_action_by_gamma(q[:,:,k], gam[:,k])
+            self.assertLess(np.abs(qn[:,:,k]-qk).max(), 1e-12)
+        # three coordinates on an irregular curve
+        q3 = np.random.RandomState(0).randn(3, 7, 2)
+        g3 = np.column_stack([np.linspace(0,1,7)**1.2]*2)
+        qn3 = fs.curve_functions.group_action_by_gamma(q3, g3)
+        q31 = fs.curve_functions.group_action_by_gamma(q3[:,:,1], g3[:,1])
+        self.assertLess(np.abs(qn3[:,:,1]-q31).max(), 1e-12)
+
+    def test_random_gamma(self):
+        gam = fs.rgam(101, 0.1, 20, rng=np.random.default_rng(0))
+        rgam = fs.utility_functions.randomGamma(gam, 50, np.random.default_rng(1))
+        self.assertEqual(rgam.shape, (101, 50))
+        self.assertTrue((np.diff(rgam, axis=0) >= 0).all())
+        rgam2 = fs.utility_functions.randomGamma(gam, 50, np.random.default_rng(1))
+        self.assertAlmostEqual(np.abs(rgam-rgam2).max(), 0)
+        ref = np.array([[0.09925500015046754, 0.09897101279809449, 0.1019488601229592],
+                        [0.49716998533524553, 0.4960857858443635, 0.5073820890717511],
+                        [0.8987099356016822, 0.8982098324962281, 0.9033427391882533]])
+        self.assertLessEqual(np.abs(rgam[[10, 50, 90]][:, [0, 1, 49]]-ref).max(), 1e-10)
+
+    def test_dp2_batch(self):
+        t = np.linspace(0, 1, 101)
+        f = np.column_stack([np.sin(2*np.pi*t**a) for a in (0.7, 1.0, 1.4)])
+        q = fs.f_to_srsf(f, t)
+        gam = fs.optimum_reparam(q[:,1], t, q, "DP2", cores=2)
+        for k in range(3):
+            gk = fs.optimum_reparam(q[:,1], t, q[:,k], "DP2")
+            self.assertAlmostEqual(np.abs(gam[:,k]-gk).max(), 0)
+        tv = np.linspace(0, 1, 41)**1.2
+        gamc = fs.optimum_reparam(q[:,1], t, q, "DP2", tv1=tv, tv2=tv)
+        self.assertTrue((np.diff(gamc, axis=0) >= 0).all())
+        self.assertLess(np.abs(gamc-gam).max(), 0.1)
+
+    def test_pool(self):
+        q = np.arange(12.).reshape(4, 3)
+        w = np.linspace(0, 1, 4)
+        with fs.parallel.Pool(2, q=q) as pool:
+            for k in range(2):
+                out = pool.map(np.dot, fs.parallel.col('q'), w + k)
+                self.assertAlmostEqual(np.abs(np.array(out) - q.T.dot(w + k)).max(), 0)
+        with fs.parallel.Pool(1, q=q) as pool:
+            out = pool.map(np.dot, w, fs.parallel.col('q'))
+            self.assertAlmostEqual(np.abs(np.array(out) - q.T.dot(w)).max(), 0)
+
 if __name__ == '__main__': 
     unittest.main() 
\ No newline at end of file